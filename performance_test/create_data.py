@@ -1,10 +1,15 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
+
+from django.contrib.gis.geos import Point
 
 import factory
 
+from objects.core.constants import ObjectTypeVersionStatus
 from objects.core.tests.factories import (
+    ObjectFactory,
     ObjectRecordFactory as _ObjectRecordFactory,
     ObjectTypeFactory,
+    ObjectTypeVersionFactory,
 )
 from objects.token.constants import PermissionModes
 from objects.token.tests.factories import PermissionFactory, TokenAuthFactory
@@ -51,3 +56,90 @@ ObjectRecordFactory.create(
     data={"identifier": "ec5cde18-40a0-4135-8d97-3500d1730e60", "foo": "bar"},
     add_timestamp=True,
 )
+
+# object type for the write paths, with a large JSON schema and objects with deep
+# histories
+WRITE_PROPERTY_COUNT = 100
+WRITE_HISTORY_LENGTH = 250
+
+write_object_type = ObjectTypeFactory.create(
+    uuid="7d2b9a3c-5c1e-4f5a-9b8e-2c6f4a1d3e90",
+)
+ObjectTypeVersionFactory.create(
+    object_type=write_object_type,
+    version=1,
+    status=ObjectTypeVersionStatus.published,
+    json_schema={
+        "type": "object",
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "required": [f"field{i}" for i in range(WRITE_PROPERTY_COUNT)],
+        "properties": {
+            **{
+                f"field{i}": {"type": "string", "minLength": 1, "maxLength": 100}
+                for i in range(WRITE_PROPERTY_COUNT)
+            },
+            "nested": {
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "required": ["name", "amount"],
+                            "properties": {
+                                "name": {"type": "string"},
+                                "amount": {"type": "integer", "minimum": 0},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+)
+PermissionFactory.create(
+    object_type=write_object_type,
+    mode=PermissionModes.read_and_write,
+    token_auth=token,
+    use_fields=False,
+)
+
+write_data = {f"field{i}": f"value {i}" for i in range(WRITE_PROPERTY_COUNT)}
+for uuid in [
+    "0c4a8e2d-1b3f-4d5e-8a9b-7c6d5e4f3a21",
+    "5e7f9a1b-3c5d-4e6f-8a0b-2c4d6e8f0a13",
+]:
+    write_object = ObjectFactory.create(uuid=uuid, object_type=write_object_type)
+    for index in range(WRITE_HISTORY_LENGTH):
+        _ObjectRecordFactory.create(
+            object=write_object,
+            version=1,
+            start_at=date(2020, 1, 1) + timedelta(days=index),
+            data={**write_data, "nested": {"items": [{"name": "a", "amount": index}]}},
+        )
+
+# object type for the geographic searches, with points in a grid of 0.001 degrees
+# around the centre of Amsterdam
+GEO_GRID_COLUMNS = 100
+GEO_GRID_ROWS = 50
+
+geo_object_type = ObjectTypeFactory.create(
+    uuid="3b8e1f6a-2d4c-4e9b-a7f5-6c1d8e2b9a04",
+    allow_geometry=True,
+)
+PermissionFactory.create(
+    object_type=geo_object_type,
+    mode=PermissionModes.read_only,
+    token_auth=token,
+    use_fields=False,
+)
+
+for column in range(GEO_GRID_COLUMNS):
+    for row in range(GEO_GRID_ROWS):
+        _ObjectRecordFactory.create(
+            object__object_type=geo_object_type,
+            version=1,
+            start_at="2020-01-01",
+            data={"column": column, "row": row},
+            geometry=Point(4.85 + column * 0.001, 52.35 + row * 0.001),
+        )
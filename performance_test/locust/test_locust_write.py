@@ -0,0 +1,97 @@
+from uuid import uuid4
+
+from locust import HttpUser, task
+
+OBJECTS_LIST = "/api/v2/objects"
+AUTH_HEADERS = {"Authorization": "Token secret"}
+WRITE_HEADERS = {**AUTH_HEADERS, "Content-Crs": "EPSG:4326"}
+
+# object type and object with a deep history, see `create_data.py`
+OBJECT_TYPE = (
+    "http://localhost:8001/api/v2/objecttypes/7d2b9a3c-5c1e-4f5a-9b8e-2c6f4a1d3e90"
+)
+HISTORY_OBJECT = "5e7f9a1b-3c5d-4e6f-8a0b-2c4d6e8f0a13"
+PROPERTY_COUNT = 100
+
+
+def get_record(**kwargs) -> dict:
+    data = {f"field{i}": f"value {i}" for i in range(PROPERTY_COUNT)}
+    data["nested"] = {"items": [{"name": str(i), "amount": i} for i in range(50)]}
+    return {
+        "typeVersion": 1,
+        "data": data,
+        "startAt": "2024-01-01",
+        "references": [
+            {"type": "zaak", "url": f"https://zaken.example.com/zaken/{uuid4()}"}
+        ],
+        **kwargs,
+    }
+
+
+class WriteObjects(HttpUser):
+    """
+    Create objects, update them a number of times and delete them again
+    """
+
+    def on_start(self):
+        self.uuids = []
+
+    @task(2)
+    def create(self):
+        response = self.client.post(
+            OBJECTS_LIST,
+            json={"type": OBJECT_TYPE, "record": get_record()},
+            headers=WRITE_HEADERS,
+        )
+        if response.status_code == 201:
+            self.uuids.append(response.json()["uuid"])
+
+    @task(4)
+    def update(self):
+        if not self.uuids:
+            return
+
+        self.client.put(
+            f"{OBJECTS_LIST}/{self.uuids[-1]}",
+            json={"type": OBJECT_TYPE, "record": get_record(startAt="2025-01-01")},
+            headers=WRITE_HEADERS,
+            name=f"{OBJECTS_LIST}/[uuid]",
+        )
+
+    @task(4)
+    def partial_update(self):
+        if not self.uuids:
+            return
+
+        self.client.patch(
+            f"{OBJECTS_LIST}/{self.uuids[-1]}",
+            json={
+                "record": {
+                    "typeVersion": 1,
+                    "data": {"field0": "patched"},
+                    "startAt": "2026-01-01",
+                }
+            },
+            headers=WRITE_HEADERS,
+            name=f"{OBJECTS_LIST}/[uuid]",
+        )
+
+    @task(1)
+    def destroy(self):
+        if not self.uuids:
+            return
+
+        self.client.delete(
+            f"{OBJECTS_LIST}/{self.uuids.pop(0)}",
+            headers=WRITE_HEADERS,
+            name=f"{OBJECTS_LIST}/[uuid]",
+        )
+
+    @task(2)
+    def history(self):
+        self.client.get(
+            f"{OBJECTS_LIST}/{HISTORY_OBJECT}/history",
+            params={"pageSize": 500},
+            headers=AUTH_HEADERS,
+            name=f"{OBJECTS_LIST}/[uuid]/history",
+        )
@@ -0,0 +1,68 @@
+import pytest
+import requests
+from furl import furl
+
+BASE_URL = furl("http://localhost:8000/api/v2/")
+SEARCH_HEADERS = {"Authorization": "Token secret", "Content-Crs": "EPSG:4326"}
+
+# object type with a grid of points, see `create_data.py`
+OBJECT_TYPE = (
+    "http://localhost:8001/api/v2/objecttypes/3b8e1f6a-2d4c-4e9b-a7f5-6c1d8e2b9a04"
+)
+# covers 21 columns and 21 rows of the grid
+BBOX = [4.8795, 52.3595, 4.9005, 52.3805]
+POLYGON = {
+    "type": "Polygon",
+    "coordinates": [
+        [
+            [BBOX[0], BBOX[1]],
+            [BBOX[2], BBOX[1]],
+            [BBOX[2], BBOX[3]],
+            [BBOX[0], BBOX[3]],
+            [BBOX[0], BBOX[1]],
+        ]
+    ],
+}
+
+
+def search(geometry: dict) -> requests.Response:
+    return requests.post(
+        (BASE_URL / "objects" / "search").set({"pageSize": 500}),
+        json={"type": OBJECT_TYPE, "geometry": geometry},
+        headers=SEARCH_HEADERS,
+    )
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        pytest.param({"within": POLYGON}, id="within"),
+        pytest.param({"intersects": POLYGON}, id="intersects"),
+        pytest.param({"bbox": BBOX}, id="bbox"),
+    ],
+)
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_objects_api_search_area(benchmark, benchmark_assertions, geometry):
+    result = benchmark(search, geometry)
+
+    assert result.status_code == 200
+    assert result.json()["count"] == 21 * 21
+
+    benchmark_assertions(mean=1, max=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_objects_api_search_dwithin(benchmark, benchmark_assertions):
+    geometry = {
+        "dwithin": {
+            "geometry": {"type": "Point", "coordinates": [4.89, 52.37]},
+            "distance": 500,
+        }
+    }
+
+    result = benchmark(search, geometry)
+
+    assert result.status_code == 200
+    assert result.json()["count"] > 0
+
+    benchmark_assertions(mean=1, max=1)
@@ -0,0 +1,123 @@
+import pytest
+import requests
+from furl import furl
+
+BASE_URL = furl("http://localhost:8000/api/v2/")
+AUTH_HEADERS = {"Authorization": "Token secret"}
+WRITE_HEADERS = {**AUTH_HEADERS, "Content-Crs": "EPSG:4326"}
+
+# object type and objects with deep histories, see `create_data.py`
+OBJECT_TYPE = (
+    "http://localhost:8001/api/v2/objecttypes/7d2b9a3c-5c1e-4f5a-9b8e-2c6f4a1d3e90"
+)
+UPDATED_OBJECT = "0c4a8e2d-1b3f-4d5e-8a9b-7c6d5e4f3a21"
+HISTORY_OBJECT = "5e7f9a1b-3c5d-4e6f-8a0b-2c4d6e8f0a13"
+PROPERTY_COUNT = 100
+
+
+def get_record(**kwargs) -> dict:
+    data = {f"field{i}": f"value {i}" for i in range(PROPERTY_COUNT)}
+    data["nested"] = {"items": [{"name": str(i), "amount": i} for i in range(50)]}
+    return {
+        "typeVersion": 1,
+        "data": data,
+        "startAt": "2024-01-01",
+        "references": [
+            {"type": "zaak", "url": f"https://zaken.example.com/zaken/{i}"}
+            for i in range(3)
+        ],
+        **kwargs,
+    }
+
+
+def create_object() -> str:
+    response = requests.post(
+        BASE_URL / "objects",
+        json={"type": OBJECT_TYPE, "record": get_record()},
+        headers=WRITE_HEADERS,
+    )
+    assert response.status_code == 201
+    return response.json()["uuid"]
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_objects_api_create(benchmark, benchmark_assertions):
+    body = {"type": OBJECT_TYPE, "record": get_record()}
+
+    def make_request():
+        return requests.post(BASE_URL / "objects", json=body, headers=WRITE_HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 201
+
+    benchmark_assertions(mean=1, max=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_objects_api_update_deep_history(benchmark, benchmark_assertions):
+    body = {"type": OBJECT_TYPE, "record": get_record(startAt="2030-01-01")}
+
+    def make_request():
+        return requests.put(
+            BASE_URL / "objects" / UPDATED_OBJECT, json=body, headers=WRITE_HEADERS
+        )
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+
+    benchmark_assertions(mean=1, max=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_objects_api_partial_update_deep_history(benchmark, benchmark_assertions):
+    # the data is merged with the data of the current record
+    body = {
+        "record": {
+            "typeVersion": 1,
+            "data": {"field0": "patched", "nested": {"items": []}},
+            "startAt": "2030-01-01",
+        }
+    }
+
+    def make_request():
+        return requests.patch(
+            BASE_URL / "objects" / UPDATED_OBJECT, json=body, headers=WRITE_HEADERS
+        )
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+
+    benchmark_assertions(mean=1, max=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_objects_api_destroy_with_zaak_references(benchmark, benchmark_assertions):
+    def setup():
+        return (create_object(),), {}
+
+    def make_request(uuid):
+        return requests.delete(BASE_URL / "objects" / uuid, headers=WRITE_HEADERS)
+
+    result = benchmark.pedantic(make_request, setup=setup, rounds=20)
+
+    assert result.status_code == 204
+
+    benchmark_assertions(mean=1, max=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_objects_api_history_deep_history(benchmark, benchmark_assertions):
+    url = (BASE_URL / "objects" / HISTORY_OBJECT / "history").set({"pageSize": 500})
+
+    def make_request():
+        return requests.get(url, headers=AUTH_HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    assert result.json()["count"] == 250
+
+    benchmark_assertions(mean=1, max=1)
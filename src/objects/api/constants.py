@@ -10,3 +10,14 @@ class Operators(models.TextChoices):
     lte = "lte", _("lower than or equal to")
     icontains = "icontains", _("case-insensitive partial match")
     in_list = "in", _("in a list of values separated by `|`")
+
+
+class CountStrategies(models.TextChoices):
+    exact = "exact", _("exact count")
+    estimate = "estimate", _("estimate of the query planner")
+    cached = "cached", _("exact count, cached for a limited time")
+
+
+class ExportFormats(models.TextChoices):
+    ndjson = "ndjson", _("Newline delimited JSON")
+    csv = "csv", _("CSV")
@@ -0,0 +1,98 @@
+import time
+from collections.abc import Callable
+from functools import wraps
+
+from django.db import connection
+
+
+def _milliseconds(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+class QueryPlanRecorder:
+    """
+    Record the queries executed for a request and the time spent in serialization.
+
+    The recorder is used as execute wrapper of the database connection, so the
+    duration of each query is measured where it is actually executed, which is
+    usually not where the (lazy) queryset is constructed. Afterwards the ``SELECT``
+    queries are executed again with ``EXPLAIN (ANALYZE, BUFFERS)`` to retrieve their
+    query plans.
+    """
+
+    def __init__(self):
+        self.queries: list[tuple[str, tuple, float]] = []
+        self.serialization_duration = 0.0
+        self.total_duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, params, time.perf_counter() - start))
+
+    @property
+    def query_duration(self) -> float:
+        return sum(duration for _sql, _params, duration in self.queries)
+
+    def time_serialization(self, func: Callable) -> Callable:
+        """
+        Wrap ``func`` to add its duration to the serialization time. The queries
+        executed in it are excluded, since they are reported on their own.
+        """
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start, query_duration = time.perf_counter(), self.query_duration
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.serialization_duration += (time.perf_counter() - start) - (
+                    self.query_duration - query_duration
+                )
+
+        return wrapper
+
+    def time_total(self, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.total_duration = time.perf_counter() - start
+
+        return wrapper
+
+    def get_report(self) -> dict:
+        stages = [
+            {"name": "queries", "duration_ms": _milliseconds(self.query_duration)},
+            {
+                "name": "serialization",
+                "duration_ms": _milliseconds(self.serialization_duration),
+            },
+            {"name": "total", "duration_ms": _milliseconds(self.total_duration)},
+        ]
+
+        queries = []
+        with connection.cursor() as cursor:
+            for sql, params, duration in self.queries:
+                plan = None
+                # only queries without side effects can be analyzed again
+                if sql.lstrip()[:6].upper() == "SELECT":
+                    prefix = connection.ops.explain_query_prefix(
+                        format="json", analyze=True, buffers=True
+                    )
+                    cursor.execute(f"{prefix} {sql}", params)
+                    plan = cursor.fetchone()[0]
+
+                queries.append(
+                    {
+                        "sql": connection.ops.compose_sql(sql, params),
+                        "duration_ms": _milliseconds(duration),
+                        "plan": plan,
+                    }
+                )
+
+        return {"stages": stages, "queries": queries}
@@ -0,0 +1,98 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+
+from django.conf import settings
+from django.http import HttpRequest
+
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from objects.core.models import ObjectRecord
+from objects.token.models import TokenAuth
+
+from .constants import ExportFormats
+from .serializers import ObjectSerializer
+
+CONTENT_TYPES = {
+    ExportFormats.ndjson: "application/x-ndjson",
+    ExportFormats.csv: "text/csv",
+}
+
+
+class Echo:
+    """
+    File-like object which returns the written value, to stream CSV rows
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class SiteRequest(HttpRequest):
+    """
+    Request for the configured site domain, to build absolute URLs outside of a
+    request/response cycle
+    """
+
+    def get_host(self) -> str:
+        return settings.SITE_DOMAIN
+
+    def _get_scheme(self) -> str:
+        return "https" if settings.IS_HTTPS else "http"
+
+
+def get_export_request() -> Request:
+    request = Request(SiteRequest())
+    request.version = api_settings.DEFAULT_VERSION
+    request.versioning_scheme = api_settings.DEFAULT_VERSIONING_CLASS()
+    # exports outside of the API are not restricted by field-based permissions
+    request.auth = TokenAuth(is_superuser=True)
+    return request
+
+
+def export_records(
+    records: Iterable[ObjectRecord],
+    serializer: ObjectSerializer,
+    export_format: str = ExportFormats.ndjson,
+) -> Iterator[str]:
+    """
+    Serialize records one by one, so they can be streamed without keeping all
+    records in memory.
+
+    The field-based permissions and the ``fields`` query parameter of the request
+    in the serializer context are applied to every record.
+    """
+    if export_format == ExportFormats.csv:
+        yield from _export_csv(records, serializer)
+        return
+
+    for record in records:
+        yield _dumps(serializer.to_representation(record)) + "\n"
+
+
+def _export_csv(
+    records: Iterable[ObjectRecord], serializer: ObjectSerializer
+) -> Iterator[str]:
+    # nested record attributes get their own column, JSON values are dumped
+    record_fields = serializer.fields["record"].fields
+    columns = [name for name in serializer.fields if name != "record"] + [
+        f"record.{name}" for name in record_fields
+    ]
+
+    writer = csv.DictWriter(Echo(), fieldnames=columns)
+    yield writer.writeheader()
+
+    for record in records:
+        data = serializer.to_representation(record)
+        row = {name: value for name, value in data.items() if name != "record"}
+        for name, value in data.get("record", {}).items():
+            row[f"record.{name}"] = (
+                _dumps(value) if isinstance(value, dict | list) else value
+            )
+        yield writer.writerow(row)
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
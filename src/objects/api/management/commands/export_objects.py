@@ -0,0 +1,71 @@
+import datetime
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+import structlog
+
+from objects.core.models import ObjectRecord, ObjectType
+
+from ...constants import ExportFormats
+from ...export import export_records, get_export_request
+from ...serializers import ObjectReadSerializer
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Export all objects of an objecttype with their actual record as newline "
+        "delimited JSON or CSV"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("objecttype_uuid", help="UUID of the objecttype")
+        parser.add_argument(
+            "--format",
+            choices=ExportFormats.values,
+            default=ExportFormats.ndjson,
+            help="Format of the export (default: ndjson)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Path of the file to write the export to, instead of stdout",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            object_type = ObjectType.objects.get(uuid=options["objecttype_uuid"])
+        except (ObjectType.DoesNotExist, ValueError):
+            raise CommandError(
+                f"Objecttype {options['objecttype_uuid']} does not exist"
+            )
+
+        records = (
+            ObjectRecord.objects.filter(_object_type=object_type)
+            .keep_current_record_per_object(datetime.date.today())
+            .select_related("_object_type", "correct", "corrected")
+            .prefetch_related("object", "references")
+            .order_by("pk")
+            .iterator(chunk_size=settings.OBJECTS_EXPORT_CHUNK_SIZE)
+        )
+        serializer = ObjectReadSerializer(context={"request": get_export_request()})
+        chunks = export_records(records, serializer, options["format"])
+
+        if not options["output"]:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(options["output"], "w", newline="") as f:
+            f.writelines(chunks)
+
+        logger.info(
+            "objects_exported",
+            objecttype_uuid=str(object_type.uuid),
+            export_format=options["format"],
+            path=options["output"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully exported objects to {options['output']}")
+        )
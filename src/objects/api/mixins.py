@@ -1,15 +1,30 @@
+import datetime
+import hashlib
+import json
+from collections.abc import Callable
+from functools import partial
+
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.http import Http404
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models, transaction
+from django.http import Http404, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import gettext_lazy as _
 
+import structlog
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
 from notifications_api_common.viewsets import (
     NotificationCreateMixin,
     NotificationDestroyMixin,
     NotificationMixinBase,
     conditional_atomic,
 )
-from rest_framework.exceptions import NotAcceptable
+from rest_framework.exceptions import NotAcceptable, PermissionDenied
 from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
 from rest_framework_nested.viewsets import NestedViewSetMixin as _NestedViewSetMixin
 from vng_api_common.exceptions import PreconditionFailed
 from vng_api_common.geo import (
@@ -20,6 +35,13 @@ from vng_api_common.geo import (
     extract_header,
 )
 
+from objects.core.models import OutboxNotification
+
+from .explain import QueryPlanRecorder
+from .tasks import send_outbox_notifications
+
+logger = structlog.stdlib.get_logger(__name__)
+
 
 class NestedViewSetMixin(_NestedViewSetMixin):
     def get_queryset(self):
@@ -58,6 +80,130 @@ class GeoMixin(_GeoMixin):
             raise NotAcceptable(detail=f"CRS '{requested_crs}' is niet ondersteund")
 
 
+class QueryPlanMixin:
+    """
+    Return the query plans and the time spent in queries and serialization of a
+    list action instead of its results, if the ``X-Explain`` header is provided
+    with a superuser token.
+
+    The action is handled as usual, so the plans are those of the queries which
+    are actually executed for the request. Since the queries are analyzed, they
+    are executed twice.
+    """
+
+    explain_actions = ("list", "search")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        if (
+            not settings.OBJECTS_EXPLAIN_ENABLED
+            or self.action not in self.explain_actions
+            or not request.headers.get(settings.EXPLAIN_HEADER)
+        ):
+            return
+
+        if not getattr(request.auth, "is_superuser", False):
+            raise PermissionDenied(
+                _("Query plans can only be requested with a superuser token.")
+            )
+
+        # the handler is looked up after the initial checks, in the same way as the
+        # action is bound to the HTTP method in `ViewSetMixin.as_view`
+        method = request.method.lower()
+        setattr(self, method, partial(self.explain, getattr(self, method)))
+
+    def explain(self, handler, request, *args, **kwargs):
+        recorder = QueryPlanRecorder()
+        get_serializer = self.get_serializer
+
+        def get_timed_serializer(*args, **kwargs):
+            serializer = get_serializer(*args, **kwargs)
+            serializer.to_representation = recorder.time_serialization(
+                serializer.to_representation
+            )
+            return serializer
+
+        self.get_serializer = get_timed_serializer
+
+        with connection.execute_wrapper(recorder):
+            response = recorder.time_total(handler)(request, *args, **kwargs)
+
+        if response.status_code != 200:
+            return response
+
+        logger.info(
+            "query_plans_requested",
+            action=self.action,
+            query_count=len(recorder.queries),
+            token_identifier=request.auth.identifier,
+        )
+        return Response(recorder.get_report())
+
+
+class ConditionalRetrieveMixin:
+    """
+    Support conditional requests with the ``If-None-Match`` and
+    ``If-Modified-Since`` headers for the retrieve action.
+
+    The validators are derived from the retrieved instance with ``get_etag_values``
+    and ``get_last_modified``, so a ``304 Not Modified`` response is returned
+    without serializing the instance.
+    """
+
+    def get_etag_values(self, instance: models.Model) -> list:
+        """
+        Return the values the representation of `instance` depends on
+        """
+        return [
+            getattr(instance, field.attname) for field in instance._meta.concrete_fields
+        ]
+
+    def get_last_modified(self, instance: models.Model) -> datetime.datetime | None:
+        return None
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        return self.get_conditional_response(
+            self.get_etag_values(instance),
+            self.get_last_modified(instance),
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+    def get_conditional_response(
+        self,
+        etag_values: list,
+        last_modified: datetime.datetime | None,
+        get_response: Callable[[], HttpResponseBase],
+    ) -> HttpResponseBase:
+        # the representation also depends on the query parameters, e.g. `fields`
+        etag_values = [
+            *etag_values,
+            self.request.version,
+            sorted(self.request.query_params.lists()),
+        ]
+        etag = quote_etag(
+            hashlib.md5(
+                json.dumps(etag_values, cls=DjangoJSONEncoder).encode(),
+                usedforsecurity=False,
+            ).hexdigest()
+        )
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(
+            self.request, etag=etag, last_modified=timestamp
+        )
+        if response is None:
+            response = get_response()
+
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+
+        return response
+
+
 class ObjectNotificationMixinBase(NotificationMixinBase):
     def __new__(cls, name, bases, attrs):
         new_cls = super().__new__(cls, name, bases, attrs)
@@ -74,15 +220,76 @@ class ObjectNotificationMixin(
     NotificationDestroyMixin,
     metaclass=ObjectNotificationMixinBase,
 ):
-    def construct_message(self, data: dict, instance: models.Model = None) -> dict:
-        message = super().construct_message(data, instance)
+    """
+    Write the notifications to the outbox, in the transaction of the request. They
+    are sent by the ``send_outbox_notifications`` task once it's committed.
+    """
+
+    # the record which is created or updated, to construct the notification without
+    # retrieving it again
+    notification_instance: models.Model | None = None
+
+    def construct_message(
+        self, data: dict, instance: models.Model = None, **kwargs
+    ) -> dict:
+        message = super().construct_message(data, instance, **kwargs)
         message["resource"] = "object"
         return message
 
+    def _message(self, data: dict, instance: models.Model = None) -> None:
+        self.add_to_outbox([self.construct_message(data, instance=instance)])
+
+    def add_to_outbox(self, messages: list[dict]) -> None:
+        OutboxNotification.objects.bulk_create(
+            OutboxNotification(resource_url=message["resourceUrl"], message=message)
+            for message in messages
+        )
+        # the changes are committed regardless, the outbox is drained later by the
+        # `send_outbox_notifications` command if the task can't be started
+        transaction.on_commit(send_outbox_notifications.delay, robust=True)
+
+    def notify_bulk(self, action: str, items: list[tuple[dict, models.Model]]) -> None:
+        """
+        Notify about multiple created or updated resources.
+
+        The configuration is checked once and all messages are written to the outbox
+        at once.
+        """
+        if get_setting("NOTIFICATIONS_DISABLED") or not items:
+            return
+
+        if NotificationsConfig.get_client() is None:
+            logger.warning("notifications_api_not_configured")
+            if get_setting("NOTIFICATIONS_GUARANTEE_DELIVERY"):
+                raise RuntimeError(
+                    "Not notifying, Notifications API configuration is broken or absent."
+                )
+            return
+
+        self.add_to_outbox(
+            [
+                self.construct_message(data, instance=instance, action=action)
+                for data, instance in items
+            ]
+        )
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.notification_instance = serializer.instance
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.notification_instance = serializer.instance
+
+    def notify(
+        self, status_code: int, data: dict, instance: models.Model = None
+    ) -> None:
+        super().notify(
+            status_code, data, instance=instance or self.notification_instance
+        )
+
     def update(self, request, *args, **kwargs):
         with conditional_atomic(self.notifications_wrap_in_atomic_block)():
             response = super().update(request, *args, **kwargs)
-
-            instance = self.get_object()
-            self.notify(response.status_code, response.data, instance=instance)
+            self.notify(response.status_code, response.data)
             return response
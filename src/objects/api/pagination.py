@@ -0,0 +1,349 @@
+import base64
+import binascii
+import hashlib
+import json
+from functools import cached_property, partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from vng_api_common.pagination import DynamicPageSizePagination
+
+from .constants import CountStrategies
+
+
+class CountStrategyPaginator(Paginator):
+    def __init__(self, object_list, per_page, *, get_count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.get_count = get_count
+
+    @cached_property
+    def count(self) -> int:
+        return self.get_count(self.object_list)
+
+
+class OptionalCursorPagination(DynamicPageSizePagination):
+    """
+    Page number pagination with an opt-in cursor (keyset) mode.
+
+    For page number pagination the total count is determined with the strategy
+    configured in ``OBJECTS_COUNT_STRATEGY``, if there are more results than
+    ``OBJECTS_COUNT_EXACT_THRESHOLD``.
+
+    If the ``cursor`` query parameter is present (it's empty for the first page),
+    the next page is selected by comparing the ordering fields with the values of
+    the last result instead of using an OFFSET, and the total count is not calculated.
+    The primary key is added to the ordering to make it unique.
+
+    Missing keys and JSON ``null`` values of ordered JSON attributes are supported.
+    Both are loaded as ``None``, so the positions of JSON ``null`` values are stored
+    separately in the cursor.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = _(
+        "Use cursor pagination instead of page numbers, which is more efficient for "
+        "deep pages. Provide an empty value to retrieve the first page and follow "
+        "the `next` link for the following pages. The `count` is not included in "
+        "the response in this mode."
+    )
+    invalid_cursor_message = _("Invalid cursor")
+
+    # query parameters which don't influence the count
+    count_ignored_query_params = ("page", "pageSize", "cursor", "ordering", "fields")
+
+    use_cursor = False
+    approximate_count: CountStrategies | None = None
+
+    @property
+    def django_paginator_class(self):
+        return partial(CountStrategyPaginator, get_count=self.get_count)
+
+    def is_cursor_requested(self, request) -> bool:
+        return self.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_cursor = self.is_cursor_requested(request)
+        if not self.use_cursor:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        queryset = queryset.order_by(*self.ordering)
+        if position := self.decode_cursor(request):
+            queryset = queryset.filter(
+                self.get_position_filter(position["values"], position["json_nulls"])
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        if not self.use_cursor:
+            response = super().get_paginated_response(data)
+            if self.approximate_count:
+                response[settings.APPROXIMATE_COUNT_HEADER] = self.approximate_count
+            return response
+
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": None,
+                "results": data,
+            }
+        )
+
+    def get_next_link(self):
+        if not self.use_cursor:
+            return super().get_next_link()
+
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.page[-1])
+        )
+
+    def get_previous_link(self):
+        # cursors can only be followed forward
+        if self.use_cursor:
+            return None
+
+        return super().get_previous_link()
+
+    def get_count(self, queryset) -> int:
+        strategy = settings.OBJECTS_COUNT_STRATEGY
+        if strategy == CountStrategies.exact:
+            return queryset.count()
+
+        # counting up to the threshold is cheap, since the rest of the results is
+        # not scanned
+        threshold = settings.OBJECTS_COUNT_EXACT_THRESHOLD
+        count = queryset[: threshold + 1].count()
+        if count <= threshold:
+            return count
+
+        if strategy == CountStrategies.estimate:
+            self.approximate_count = CountStrategies.estimate
+            return max(self.get_estimated_count(queryset), count)
+
+        cache_key = self.get_count_cache_key()
+        if (cached_count := cache.get(cache_key)) is not None:
+            self.approximate_count = CountStrategies.cached
+            return cached_count
+
+        count = queryset.count()
+        cache.set(cache_key, count, timeout=settings.OBJECTS_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def get_estimated_count(self, queryset) -> int:
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return plan[0]["Plan"]["Plan Rows"]
+
+    def get_count_cache_key(self) -> str:
+        request = self.request
+        key_data = {
+            "path": request.path,
+            "query_params": self._normalize_filters(request.query_params),
+            "token": getattr(request.auth, "pk", None),
+        }
+        # search filters are provided in the request body
+        if request.method == "POST":
+            key_data["data"] = self._normalize_filters(request.data)
+
+        digest = hashlib.sha256(
+            json.dumps(key_data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"objects:count:{digest}"
+
+    def _normalize_filters(self, filters) -> dict:
+        return {
+            key: sorted(filters.getlist(key)) if hasattr(filters, "getlist") else value
+            for key, value in filters.items()
+            if key not in self.count_ignored_query_params
+        }
+
+    def get_ordering(self, queryset) -> list[str]:
+        ordering = [
+            field
+            for field in queryset.query.order_by or queryset.model._meta.ordering
+            if isinstance(field, str)
+        ]
+        field_names = {field.removeprefix("-") for field in ordering}
+        if not field_names & {"pk", queryset.model._meta.pk.name}:
+            descending = bool(ordering) and ordering[0].startswith("-")
+            ordering.append("-pk" if descending else "pk")
+
+        return ordering
+
+    def encode_cursor(self, instance: models.Model) -> str:
+        field_names = [field.removeprefix("-") for field in self.ordering]
+        # JSON null values are loaded as `None`, like SQL NULL values (e.g. of missing
+        # keys), so it's selected whether the values are SQL NULL as well
+        is_null = {
+            f"_is_null_{index}": models.ExpressionWrapper(
+                models.Q(**{f"{name}__isnull": True}),
+                output_field=models.BooleanField(),
+            )
+            for index, name in enumerate(field_names)
+        }
+        row = (
+            type(instance)
+            ._default_manager.filter(pk=instance.pk)
+            .annotate(**is_null)
+            .values_list(*field_names, *is_null)
+            .get()
+        )
+        values = list(row[: len(field_names)])
+        json_nulls = [
+            index
+            for index, (value, sql_null) in enumerate(
+                zip(values, row[len(field_names) :])
+            )
+            if value is None and not sql_null
+        ]
+
+        position = {"ordering": self.ordering, "values": values}
+        if json_nulls:
+            position["json_nulls"] = json_nulls
+        data = json.dumps(position, default=str)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, request) -> dict | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if (
+            not isinstance(position, dict)
+            or position.get("ordering") != self.ordering
+            or not isinstance(position.get("values"), list)
+            or len(position["values"]) != len(self.ordering)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        json_nulls = position.setdefault("json_nulls", [])
+        if not isinstance(json_nulls, list) or any(
+            not isinstance(index, int)
+            or not 0 <= index < len(self.ordering)
+            or position["values"][index] is not None
+            for index in json_nulls
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position
+
+    def get_position_filter(
+        self, values: list, json_nulls: list[int] | None = None
+    ) -> models.Q:
+        """
+        Build the filter for the results after the given position, for example for
+        the ordering ``a, -b`` this is ``a > x OR (a = x AND b < y)``
+
+        Postgres sorts NULL values last for ascending and first for descending order.
+        JSON ``null`` values are sorted before all other JSON values, the indexes of
+        the values in the position which are JSON ``null`` are given in `json_nulls`.
+        """
+        json_nulls = json_nulls or []
+        position_filter = models.Q()
+        preceding_equal = models.Q()
+        for index, (field, value) in enumerate(zip(self.ordering, values)):
+            name = field.removeprefix("-")
+            descending = field.startswith("-")
+
+            if index in json_nulls:
+                # the JSON values which are not null, and SQL NULL values
+                after = (
+                    None
+                    if descending
+                    else ~models.Q(**{name: None})
+                    | models.Q(**{f"{name}__isnull": True})
+                )
+                equal = models.Q(**{name: None})
+            elif value is None:
+                after = models.Q(**{f"{name}__isnull": False}) if descending else None
+                equal = models.Q(**{f"{name}__isnull": True})
+            else:
+                lookup = "lt" if descending else "gt"
+                after = models.Q(**{f"{name}__{lookup}": value})
+                if not descending:
+                    after |= models.Q(**{f"{name}__isnull": True})
+                equal = models.Q(**{name: value})
+
+            if after is not None:
+                position_filter |= preceding_equal & after
+            preceding_equal &= equal
+
+        return position_filter
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        # the count is omitted when using cursor pagination
+        response_schema["required"] = ["results"]
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.cursor_query_description),
+                "schema": {"type": "string"},
+            }
+        )
+        return parameters
+
+
+class ChangeFeedPagination(OptionalCursorPagination):
+    """
+    Cursor pagination of the change feed, which is always used.
+
+    The ``next`` link is also returned for the last page, so it can be polled for
+    later changes.
+    """
+
+    cursor_query_param = "since"
+    cursor_query_description = _(
+        "Position in the change feed, the changes after it are returned. Provide an "
+        "empty value to start at the first change and follow the `next` link for "
+        "the following changes."
+    )
+
+    def is_cursor_requested(self, request) -> bool:
+        return True
+
+    def get_next_link(self):
+        if not self.page:
+            # no changes since the position, which stays the same
+            return self.request.build_absolute_uri()
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.page[-1])
+        )
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            parameter
+            for parameter in super().get_schema_operation_parameters(view)
+            if parameter["name"] != self.page_query_param
+        ]
@@ -0,0 +1,41 @@
+import codecs
+import io
+import re
+
+from django.conf import settings
+
+import orjson
+from rest_framework.parsers import JSONParser
+
+from .renderers import ORJSONRenderer
+
+# `orjson` parses integers which don't fit in 64 bits as floats
+LONG_NUMBER_PATTERN = re.compile(rb"\d{19}")
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSON parser using ``orjson``, which is considerably faster for large request
+    bodies.
+
+    Bodies which ``orjson`` can't parse exactly, like invalid JSON, bodies which are
+    not encoded with UTF-8 or bodies with very long numbers, are parsed by the
+    regular ``JSONParser``, so the result and the error messages are the same.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        content = stream.read()
+        if LONG_NUMBER_PATTERN.search(content):
+            return super().parse(io.BytesIO(content), media_type, parser_context)
+
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(content), media_type, parser_context)
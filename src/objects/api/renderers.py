@@ -0,0 +1,41 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using ``orjson``, which is considerably faster for large responses.
+
+    Values which aren't supported natively are converted with the encoder of the
+    regular ``JSONRenderer``, including dates and times to get the same formats.
+    Options which ``orjson`` doesn't support, like indentation, and values which it
+    can't serialize, like integers over 64 bits, are rendered by the regular
+    ``JSONRenderer``.
+
+    The output differs from the regular ``JSONRenderer`` for floats: some exponents
+    are formatted differently (``1.5e-7`` instead of ``1.5e-07``), which represent
+    the same values, and ``NaN`` and ``Infinity`` are rendered as ``null`` instead
+    of raising an error. The latter can't be stored in the JSON data of objects.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.options
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # escape the line and paragraph separators like `JSONRenderer`
+        return ret.replace("\u2028".encode(), b"\\u2028").replace(
+            "\u2029".encode(), b"\\u2029"
+        )
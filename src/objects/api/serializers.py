@@ -1,3 +1,5 @@
+from django.contrib.gis.geos import Polygon
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
@@ -8,10 +10,15 @@ from rest_framework.validators import UniqueValidator
 from rest_framework_gis.serializers import GeometryField
 from rest_framework_nested.relations import NestedHyperlinkedRelatedField
 from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
+from vng_api_common.serializers import (
+    CachedHyperlinkedIdentityField,
+    FieldValidationErrorSerializer,
+)
 from vng_api_common.utils import get_help_text
 
 from objects.core.models import (
     Object,
+    ObjectChange,
     ObjectRecord,
     ObjectType,
     ObjectTypeVersion,
@@ -237,6 +244,48 @@ class HistoryRecordSerializer(serializers.ModelSerializer):
         }
 
 
+class ObjectListSerializer(serializers.ListSerializer):
+    @transaction.atomic
+    def create(self, validated_data: list[dict]) -> list[ObjectRecord]:
+        """
+        Create the objects and their initial records with one query per table
+        """
+        objects = []
+        records = []
+        references = []
+        for item in validated_data:
+            item = dict(item)
+            object_data = item.pop("object", {})
+            object_type = item.pop("_object_type")
+            references_data = item.pop("references", [])
+
+            object = Object(object_type=object_type, **object_data)
+            record = ObjectRecord(
+                object=object, _object_type=object_type, is_last_record=True, **item
+            )
+            references += [
+                Reference(record=record, **ref_data) for ref_data in references_data
+            ]
+            objects.append(object)
+            records.append(record)
+
+        Object.objects.bulk_create(objects)
+        ObjectRecord.objects.bulk_create(records)
+        Reference.objects.bulk_create(references)
+
+        token_auth: TokenAuth = self.context["request"].auth
+        for record in records:
+            logger.info(
+                "object_created",
+                object_uuid=str(record.object.uuid),
+                objecttype_uuid=str(record._object_type.uuid),
+                objecttype_version=record.version,
+                token_identifier=token_auth.identifier,
+                token_application=token_auth.application,
+            )
+        return records
+
+
 class ObjectSerializer(DynamicFieldsMixin, serializers.HyperlinkedModelSerializer):
     url = CachedObjectUrlField(view_name="object-detail")
     uuid = serializers.UUIDField(
@@ -269,6 +318,7 @@ class ObjectSerializer(DynamicFieldsMixin, serializers.HyperlinkedModelSerialize
             "url": {"lookup_field": "object.uuid"},
         }
         validators = [ObjectTypeSchemaValidator(), GeometryValidator()]
+        list_serializer_class = ObjectListSerializer
 
     @transaction.atomic
     def create(self, validated_data):
@@ -334,14 +384,158 @@ class ObjectSerializer(DynamicFieldsMixin, serializers.HyperlinkedModelSerialize
         return record
 
 
+def _date_representation(value) -> str | None:
+    # same output as `serializers.DateField` with the default ISO 8601 format
+    return value.isoformat() if value else None
+
+
+class ObjectReadSerializer(ObjectSerializer):
+    """
+    Read-only variant of ``ObjectSerializer``, which builds the same representation
+    from the model attributes directly instead of evaluating all (nested) fields
+    for each object.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._object_type_urls: dict[int, str] = {}
+
+    def to_representation(self, instance: ObjectRecord) -> dict:
+        return self.limit_fields(instance, self.get_representation(instance))
+
+    def get_representation(self, instance: ObjectRecord) -> dict:
+        fields = self.fields
+        geometry_field = fields["record"].fields["geometry"]
+
+        try:
+            corrected = instance.corrected
+        except ObjectDoesNotExist:
+            corrected = None
+
+        return {
+            "url": fields["url"].to_representation(instance),
+            "uuid": str(instance.object.uuid),
+            "type": self.get_object_type_url(instance._object_type),
+            "record": {
+                "index": instance.index,
+                "typeVersion": instance.version,
+                "data": instance.data,
+                "geometry": (
+                    geometry_field.to_representation(instance.geometry)
+                    if instance.geometry is not None
+                    else None
+                ),
+                "references": [
+                    {"type": reference.type, "url": reference.url}
+                    for reference in instance.references.all()
+                ],
+                "startAt": _date_representation(instance.start_at),
+                "endAt": _date_representation(instance.end_at),
+                "registrationAt": _date_representation(instance.registration_at),
+                "correctionFor": instance.correct.index if instance.correct else None,
+                "correctedBy": corrected.index if corrected else None,
+            },
+        }
+
+    def get_object_type_url(self, object_type: ObjectType) -> str:
+        if object_type.pk not in self._object_type_urls:
+            self._object_type_urls[object_type.pk] = self.fields[
+                "type"
+            ].to_representation(object_type)
+        return self._object_type_urls[object_type.pk]
+
+
+class ObjectBulkResultSerializer(serializers.Serializer):
+    status = serializers.IntegerField(
+        help_text=_("HTTP status code of the result of this OBJECT")
+    )
+    object = ObjectSerializer(
+        required=False, help_text=_("The created OBJECT, if it's valid")
+    )
+    invalidParams = FieldValidationErrorSerializer(
+        source="invalid_params",
+        many=True,
+        required=False,
+        help_text=_("Validation errors, if the OBJECT is invalid"),
+    )
+
+
+class ObjectBulkSerializer(serializers.Serializer):
+    results = ObjectBulkResultSerializer(
+        many=True,
+        help_text=_("Results in the same order as the OBJECTs in the request"),
+    )
+
+
+class GeoDWithinSerializer(serializers.Serializer):
+    geometry = GeometryField(help_text=_("Geometry to measure the distance to"))
+    distance = serializers.FloatField(
+        min_value=0, help_text=_("Maximum distance in meters")
+    )
+
+
 class GeoWithinSerializer(serializers.Serializer):
-    within = GeometryField(required=False)
+    within = GeometryField(
+        required=False, help_text=_("Only include OBJECTs within this geometry")
+    )
+    intersects = GeometryField(
+        required=False,
+        help_text=_("Only include OBJECTs which intersect with this geometry"),
+    )
+    bbox = serializers.ListField(
+        child=serializers.FloatField(),
+        min_length=4,
+        max_length=4,
+        required=False,
+        help_text=_(
+            "Only include OBJECTs whose bounding box overlaps with this bounding box, "
+            "given as `[minLongitude, minLatitude, maxLongitude, maxLatitude]`. This "
+            "is the cheapest geographic filter, for example for the visible area "
+            "of a map"
+        ),
+    )
+    dwithin = GeoDWithinSerializer(
+        required=False,
+        help_text=_("Only include OBJECTs within a distance of this geometry"),
+    )
+
+    def validate_bbox(self, value: list[float]) -> Polygon:
+        min_x, min_y, max_x, max_y = value
+        if min_x > max_x or min_y > max_y:
+            raise serializers.ValidationError(
+                _("The minimum coordinates should not exceed the maximum coordinates"),
+                code="invalid-bbox",
+            )
+
+        bbox = Polygon.from_bbox(value)
+        bbox.srid = 4326
+        return bbox
 
 
 class ObjectSearchSerializer(serializers.Serializer):
     geometry = GeoWithinSerializer(required=False)
 
 
+class ObjectChangeSerializer(serializers.ModelSerializer):
+    url = CachedHyperlinkedIdentityField(
+        view_name="object-detail",
+        lookup_field="uuid",
+        help_text=_("URL reference to the OBJECT, which no longer exists if deleted"),
+    )
+    type = ObjectTypeField(
+        source="object_type", help_text=_("Url reference to OBJECTTYPE")
+    )
+
+    class Meta:
+        model = ObjectChange
+        fields = ("url", "uuid", "type", "action", "recordIndex", "changedOn")
+        extra_kwargs = {
+            "recordIndex": {"source": "record_index"},
+            "changedOn": {"source": "changed_on"},
+        }
+
+
 class PermissionSerializer(serializers.ModelSerializer):
     type = ObjectTypeField(
         min_length=1,
@@ -0,0 +1,175 @@
+import datetime
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+import requests
+import structlog
+from ape_pie.client import APIClient
+from celery import shared_task
+from notifications_api_common.exponential_backoff import (
+    get_exponential_backoff_interval,
+)
+from notifications_api_common.models import NotificationsConfig
+
+from objects.core.models import OutboxNotification
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# name of the Postgres advisory lock, which is held by the task sending the outbox
+OUTBOX_LOCK = "objects_notification_outbox"
+
+
+@contextmanager
+def outbox_lock() -> Iterator[bool]:
+    """
+    Acquire the lock of the outbox, unless it's held by another task. Yields whether
+    the lock is acquired.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(hashtext(%s))", [OUTBOX_LOCK])
+        (acquired,) = cursor.fetchone()
+
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(hashtext(%s))", [OUTBOX_LOCK])
+
+
+def coalesce_notifications(
+    notifications: list[OutboxNotification],
+) -> tuple[list[OutboxNotification], list[OutboxNotification]]:
+    """
+    Return the notifications to send and the notifications which are superseded by
+    the next notification of the same resource with the same action.
+    """
+    to_send: list[OutboxNotification] = []
+    superseded: list[OutboxNotification] = []
+    last_positions: dict[str, int] = {}
+    for notification in notifications:
+        position = last_positions.get(notification.resource_url)
+        if (
+            position is not None
+            and to_send[position].message["actie"] == notification.message["actie"]
+        ):
+            superseded.append(to_send[position])
+            to_send[position] = notification
+            continue
+
+        last_positions[notification.resource_url] = len(to_send)
+        to_send.append(notification)
+
+    return to_send, superseded
+
+
+def send_notifications(
+    client: APIClient,
+    config: NotificationsConfig,
+    notifications: list[OutboxNotification],
+) -> datetime.datetime | None:
+    """
+    Send the notifications and remove them from the outbox. Failed notifications are
+    retried later, with the backoff of the notifications configuration, and block the
+    later notifications of their resource meanwhile.
+
+    Returns the date and time of the first retry, if any.
+    """
+    to_send, processed = coalesce_notifications(notifications)
+    failed_resources: set[str] = set()
+    retry_at = None
+    for notification in to_send:
+        if notification.resource_url in failed_resources:
+            continue
+
+        try:
+            response = client.post("notificaties", json=notification.message)
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            failed_resources.add(notification.resource_url)
+            notification.attempts += 1
+
+            if notification.attempts > config.notification_delivery_max_retries:
+                logger.error(
+                    "notification_delivery_failed",
+                    resource_url=notification.resource_url,
+                    attempts=notification.attempts,
+                    exc_info=exc,
+                )
+                processed.append(notification)
+                continue
+
+            countdown = get_exponential_backoff_interval(
+                factor=config.notification_delivery_retry_backoff,
+                retries=notification.attempts - 1,
+                maximum=config.notification_delivery_retry_backoff_max,
+                base=config.notification_delivery_base_factor,
+            )
+            notification.available_at = timezone.now() + datetime.timedelta(
+                seconds=countdown
+            )
+            notification.save(update_fields=["attempts", "available_at"])
+            logger.warning(
+                "notification_delivery_retried",
+                resource_url=notification.resource_url,
+                attempts=notification.attempts,
+                available_at=notification.available_at.isoformat(),
+                exc_info=exc,
+            )
+            retry_at = min(
+                retry_at or notification.available_at, notification.available_at
+            )
+            continue
+
+        processed.append(notification)
+
+    OutboxNotification.objects.filter(
+        pk__in=[notification.pk for notification in processed]
+    ).delete()
+    return retry_at
+
+
+@shared_task
+def send_outbox_notifications() -> None:
+    """
+    Send the notifications in the outbox to the Notificaties API.
+
+    The outbox is sent by one task at a time in batches, the tasks which are started
+    meanwhile stop immediately. Consecutive notifications of a resource with the
+    same action are sent once, with the data of the last one.
+    """
+    batch_size = settings.NOTIFICATIONS_OUTBOX_BATCH_SIZE
+    retry_at = None
+    while True:
+        with outbox_lock() as acquired:
+            if not acquired:
+                break
+
+            client = NotificationsConfig.get_client()
+            if client is None:
+                logger.warning("notifications_api_not_configured")
+                # the outbox isn't sent again until the next change otherwise
+                if OutboxNotification.objects.exists():
+                    retry_at = timezone.now() + datetime.timedelta(
+                        seconds=settings.NOTIFICATIONS_OUTBOX_RETRY_INTERVAL
+                    )
+                break
+
+            config = NotificationsConfig.get_solo()
+            while notifications := list(
+                OutboxNotification.objects.filter_available()[:batch_size]
+            ):
+                if batch_retry_at := send_notifications(client, config, notifications):
+                    retry_at = min(retry_at or batch_retry_at, batch_retry_at)
+
+        # the tasks of notifications which are written while the lock was held
+        # stopped immediately, so they are sent by this task
+        if not OutboxNotification.objects.filter_available().exists():
+            break
+
+    if retry_at:
+        send_outbox_notifications.apply_async(eta=retry_at)
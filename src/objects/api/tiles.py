@@ -0,0 +1,92 @@
+import math
+
+from django.contrib.gis.db.models import GeometryField
+from django.contrib.gis.db.models.functions import Transform
+from django.contrib.gis.geos import Polygon
+from django.db import connection, models
+from django.db.models.functions import Cast
+
+from objects.core.query import ObjectRecordQuerySet
+
+CONTENT_TYPE = "application/vnd.mapbox-vector-tile"
+
+# name of the layer with the objects in the tiles
+LAYER_NAME = "objects"
+# the size of the tiles in integer coordinates, the default of PostGIS
+EXTENT = 4096
+# the margin around the tiles in integer coordinates, so lines and polygons which
+# cross the borders of the tiles are rendered without gaps
+BUFFER = 64
+MAX_ZOOM = 24
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    return z <= MAX_ZOOM and x < 2**z and y < 2**z
+
+
+def get_tile_bbox(z: int, x: int, y: int) -> Polygon:
+    """
+    Return the bounding box of the tile in WGS84 coordinates, to select the records
+    in the tile with the spatial index.
+    """
+
+    def get_longitude(column: int) -> float:
+        return column / 2**z * 360 - 180
+
+    def get_latitude(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / 2**z))))
+
+    bbox = Polygon.from_bbox(
+        (get_longitude(x), get_latitude(y + 1), get_longitude(x + 1), get_latitude(y))
+    )
+    bbox.srid = 4326
+    return bbox
+
+
+def render_tile(records: ObjectRecordQuerySet, z: int, x: int, y: int) -> bytes:
+    """
+    Return the Mapbox vector tile with the geometry and the object UUID of the
+    records, which is empty if no record is in the tile.
+
+    The tile is encoded by PostGIS with ``ST_AsMVT``, so the records are not loaded
+    in Python.
+    """
+
+    def integer(value: int) -> Cast:
+        return Cast(models.Value(value), models.IntegerField())
+
+    envelope = models.Func(
+        integer(z),
+        integer(x),
+        integer(y),
+        function="ST_TileEnvelope",
+        output_field=GeometryField(srid=3857),
+    )
+    tile_geometry = models.Func(
+        Transform("geometry", 3857),
+        envelope,
+        integer(EXTENT),
+        integer(BUFFER),
+        function="ST_AsMVTGeom",
+        output_field=GeometryField(srid=3857),
+    )
+    tile_records = (
+        records.filter_for_geometry(bbox=get_tile_bbox(z, x, y))
+        .order_by()
+        .annotate(
+            uuid=Cast("object__uuid", models.TextField()),
+            tile_geometry=tile_geometry,
+        )
+        .values("uuid", "tile_geometry")
+    )
+
+    sql, params = tile_records.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT ST_AsMVT(tile, '{LAYER_NAME}', {EXTENT}, 'tile_geometry') "
+            f"FROM ({sql}) AS tile",
+            params,
+        )
+        tile = cursor.fetchone()[0]
+
+    return bytes(tile) if tile else b""
@@ -207,7 +207,17 @@ class ObjectRecordFilterSet(FilterSet):
 
     data_icontains = filters.CharFilter(
         method="filter_data_icontains",
-        help_text=_("Search in all `data` values of string properties."),
+        help_text=_(
+            "Search in all `data` values of string properties, case insensitive."
+        ),
+    )
+    data_iregex = filters.CharFilter(
+        method="filter_data_iregex",
+        help_text=_(
+            "Search in all `data` values of string properties with a case "
+            "insensitive regular expression. This is considerably slower than "
+            "`data_icontains`."
+        ),
     )
 
     class Meta:
@@ -230,12 +240,12 @@ class ObjectRecordFilterSet(FilterSet):
         return queryset
 
     def filter_data_icontains(self, queryset, name, value: str):
-        # TODO consider using `data__icontains=value` here instead? This does mean regexes
-        # are no longer supported, but it's a lot more efficient and the docs do not
-        # clearly state that regexes were supported anyway. A different parameter could
-        # be added to allow regex search
+        return queryset.filter_data_icontains(value)
 
-        # WHERE clause has jsonpath: where data @? '$.** ? (@ like_regex "$value" flag "i")'
+    def filter_data_iregex(self, queryset, name, value: str):
+        # can't use an index, since every value of the data is matched against the
+        # regex. WHERE clause has jsonpath:
+        # where data @? '$.** ? (@ like_regex "$value" flag "i")'
         where_str = "core_objectrecord.data @? CONCAT('$.** ? (@ like_regex \"',%s::text,'\" flag \"i\")')::jsonpath"
         return queryset.extra(where=[where_str], params=[value])
 
@@ -2,6 +2,8 @@ import datetime
 
 from django.conf import settings
 from django.db import models, transaction
+from django.db.models import prefetch_related_objects
+from django.http import HttpResponse, StreamingHttpResponse
 from django.urls import reverse
 from django.utils.dateparse import parse_date
 from django.utils.translation import gettext_lazy as _
@@ -16,16 +18,19 @@ from drf_spectacular.utils import (
     inline_serializer,
 )
 from notifications_api_common.cloudevents import process_cloudevent
+from notifications_api_common.viewsets import conditional_atomic
 from rest_framework import mixins, serializers, status, viewsets
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.decorators import action
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
+from vng_api_common.exception_handling import get_validation_errors
 from vng_api_common.filters_backend import Backend as FilterBackend
 from vng_api_common.pagination import DynamicPageSizePagination
+from vng_api_common.permissions import bypass_permissions
 from vng_api_common.search import SearchMixin
 
 from objects.api.metrics import (
@@ -34,13 +39,22 @@ from objects.api.metrics import (
     objecttype_update_counter,
 )
 from objects.cloud_events.constants import ZAAK_ONTKOPPELD
-from objects.cloud_events.tasks import send_zaak_events
+from objects.cloud_events.tasks import send_batched_zaak_events
 from objects.core.constants import ObjectTypeVersionStatus, ReferenceType
-from objects.core.models import Object, ObjectRecord, ObjectType, ObjectTypeVersion
+from objects.core.models import (
+    Object,
+    ObjectChange,
+    ObjectRecord,
+    ObjectType,
+    ObjectTypeVersion,
+)
 from objects.token.authentication import TokenAuthentication
+from objects.token.constants import PermissionModes
 from objects.token.models import Permission, TokenAuth
 from objects.token.permissions import IsTokenAuthenticated, ObjectTypeBasedPermission
 
+from ..constants import ExportFormats
+from ..export import CONTENT_TYPES, export_records
 from ..filter_backends import OrderingBackend
 from ..kanalen import KANAAL_OBJECTEN
 from ..metrics import (
@@ -48,15 +62,31 @@ from ..metrics import (
     objects_delete_counter,
     objects_update_counter,
 )
-from ..mixins import GeoMixin, NestedViewSetMixin, ObjectNotificationMixin
+from ..mixins import (
+    ConditionalRetrieveMixin,
+    GeoMixin,
+    NestedViewSetMixin,
+    ObjectNotificationMixin,
+    QueryPlanMixin,
+)
+from ..pagination import ChangeFeedPagination, OptionalCursorPagination
 from ..serializers import (
     HistoryRecordSerializer,
+    ObjectBulkSerializer,
+    ObjectChangeSerializer,
+    ObjectReadSerializer,
     ObjectSearchSerializer,
     ObjectSerializer,
     ObjectTypeSerializer,
     ObjectTypeVersionSerializer,
     PermissionSerializer,
 )
+from ..tiles import (
+    CONTENT_TYPE as TILE_CONTENT_TYPE,
+    LAYER_NAME as TILE_LAYER_NAME,
+    is_valid_tile,
+    render_tile,
+)
 from ..utils import is_date
 from .filters import (
     DATA_ATTR_HELP_TEXT,
@@ -85,14 +115,61 @@ data_attr_parameter = OpenApiParameter(
     explode=True,
 )
 
+# conditional requests, see `ConditionalRetrieveMixin`
+etag_parameters = [
+    OpenApiParameter(
+        name="If-None-Match",
+        location=OpenApiParameter.HEADER,
+        type=OpenApiTypes.STR,
+        description=_(
+            "Return a 304 response without body if the resource matches one of "
+            "the given ETag values."
+        ),
+    ),
+    OpenApiParameter(
+        name="ETag",
+        location=OpenApiParameter.HEADER,
+        type=OpenApiTypes.STR,
+        response=[200, 304],
+        description=_("Identifier of the current representation of the resource."),
+    ),
+]
+last_modified_parameters = [
+    OpenApiParameter(
+        name="If-Modified-Since",
+        location=OpenApiParameter.HEADER,
+        type=OpenApiTypes.STR,
+        description=_(
+            "Return a 304 response without body if the resource wasn't modified "
+            "since the given date. Ignored if `If-None-Match` is given."
+        ),
+    ),
+    OpenApiParameter(
+        name="Last-Modified",
+        location=OpenApiParameter.HEADER,
+        type=OpenApiTypes.STR,
+        response=[200, 304],
+        description=_("Date when the resource was last modified."),
+    ),
+]
+not_modified_response = OpenApiResponse(description=_("Not modified"))
+
 logger = structlog.stdlib.get_logger(__name__)
 
 
+def bulk_error(status_code: int, invalid_params: list[dict]) -> dict:
+    return {"status": status_code, "invalid_params": invalid_params}
+
+
 @extend_schema_view(
-    retrieve=extend_schema(operation_id="objecttype_read"),
+    retrieve=extend_schema(
+        operation_id="objecttype_read",
+        parameters=etag_parameters,
+        responses={200: ObjectTypeSerializer, 304: not_modified_response},
+    ),
     destroy=extend_schema(operation_id="objecttype_delete"),
 )
-class ObjectTypeViewSet(viewsets.ModelViewSet):
+class ObjectTypeViewSet(ConditionalRetrieveMixin, viewsets.ModelViewSet):
     queryset = ObjectType.objects.prefetch_related("versions").order_by("-pk")
     serializer_class = ObjectTypeSerializer
     lookup_field = "uuid"
@@ -150,11 +227,84 @@ class ObjectTypeViewSet(viewsets.ModelViewSet):
         )
         objecttype_delete_counter.add(1)
 
+    def get_etag_values(self, instance: ObjectType) -> list:
+        # `modified_at` is a date, so it can't be used as `Last-Modified`
+        return [
+            *super().get_etag_values(instance),
+            [version.version for version in instance.versions.all()],
+        ]
+
+    def has_tile_permission(self, object_type: ObjectType) -> bool:
+        request = self.request
+        if bypass_permissions(request) or request.auth.is_superuser:
+            return True
+
+        permission = request.auth.get_permission_for_object_type(object_type)
+        if not permission:
+            return False
+
+        # the geometry could be a field which isn't allowed by field based auth
+        return not (
+            permission.mode == PermissionModes.read_only and permission.use_fields
+        )
+
+    @extend_schema(
+        description=(
+            "Retrieve a Mapbox vector tile with the geometry of the actual RECORDs "
+            "of the OBJECTs of an OBJECTTYPE, to render them on a map. The tile "
+            f"contains the layer `{TILE_LAYER_NAME}` with the `uuid` of the "
+            "OBJECTs as property. Tiles without OBJECTs return a 204 response."
+        ),
+        operation_id="objecttype_tile",
+        parameters=[
+            OpenApiParameter(
+                name=name,
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description=description,
+            )
+            for name, description in [
+                ("z", _("Zoom level of the tile")),
+                ("x", _("Column of the tile, from west to east")),
+                ("y", _("Row of the tile, from north to south")),
+            ]
+        ],
+        responses={
+            (200, TILE_CONTENT_TYPE): OpenApiTypes.BINARY,
+            204: OpenApiResponse(description=_("The tile contains no OBJECTs")),
+        },
+    )
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"tiles/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)\.mvt",
+    )
+    def tile(self, request, uuid=None, z=None, x=None, y=None):
+        """Retrieve a vector tile with the OBJECTs of an OBJECTTYPE."""
+        object_type = self.get_object()
+        if not self.has_tile_permission(object_type):
+            raise PermissionDenied
+
+        z, x, y = int(z), int(x), int(y)
+        if not is_valid_tile(z, x, y):
+            raise NotFound(_("The tile does not exist."))
+
+        records = ObjectRecord.objects.filter(
+            _object_type=object_type
+        ).keep_current_record_per_object(datetime.date.today())
+        tile = render_tile(records, z, x, y)
+        if not tile:
+            return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+        return HttpResponse(tile, content_type=TILE_CONTENT_TYPE)
+
 
 @extend_schema_view(
     retrieve=extend_schema(
         operation_id="objecttypeversion_read",
         description=_("Retrieve an OBJECTTYPE with the given version."),
+        parameters=etag_parameters,
+        responses={200: ObjectTypeVersionSerializer, 304: not_modified_response},
     ),
     list=extend_schema(
         operation_id="objecttypeversion_list",
@@ -177,7 +327,9 @@ class ObjectTypeViewSet(viewsets.ModelViewSet):
         description=_("Partially update an OBJECTTYPE with the given version."),
     ),
 )
-class ObjectTypeVersionViewSet(NestedViewSetMixin, viewsets.ModelViewSet):
+class ObjectTypeVersionViewSet(
+    ConditionalRetrieveMixin, NestedViewSetMixin, viewsets.ModelViewSet
+):
     queryset = ObjectTypeVersion.objects.order_by("object_type", "-version")
     serializer_class = ObjectTypeVersionSerializer
     lookup_field = "version"
@@ -260,6 +412,8 @@ class ObjectTypeVersionViewSet(NestedViewSetMixin, viewsets.ModelViewSet):
         description="Retrieve a single OBJECT and its actual RECORD. "
         "The actual record is defined as if the query parameter `date=<today>` was given.",
         operation_id="object_read",
+        parameters=etag_parameters,
+        responses={200: ObjectSerializer, 304: not_modified_response},
     ),
     create=extend_schema(description="Create an OBJECT and its initial RECORD."),
     update=extend_schema(
@@ -302,7 +456,12 @@ class ObjectTypeVersionViewSet(NestedViewSetMixin, viewsets.ModelViewSet):
     ),
 )
 class ObjectViewSet(
-    ObjectNotificationMixin, SearchMixin, GeoMixin, viewsets.ModelViewSet
+    ObjectNotificationMixin,
+    QueryPlanMixin,
+    SearchMixin,
+    GeoMixin,
+    ConditionalRetrieveMixin,
+    viewsets.ModelViewSet,
 ):
     queryset = (
         ObjectRecord.objects.select_related(
@@ -322,7 +481,7 @@ class ObjectViewSet(
     lookup_url_kwarg = "uuid"
     search_input_serializer_class = ObjectSearchSerializer
     permission_classes = [ObjectTypeBasedPermission]
-    pagination_class = DynamicPageSizePagination
+    pagination_class = OptionalCursorPagination
     notifications_kanaal = KANAAL_OBJECTEN
 
     def get_queryset(self):
@@ -337,32 +496,72 @@ class ObjectViewSet(
             ),
         )
 
-        if self.action not in ("list", "search"):
+        if self.action not in ("list", "search", "export"):
             return base
 
         # show only allowed objects
         base = base.filter_for_token(token_auth)
         return base
 
+    def get_serializer_class(self):
+        # the schema is generated from the regular serializer
+        if getattr(self, "swagger_fake_view", False):
+            return super().get_serializer_class()
+
+        if self.action in ("list", "search", "retrieve", "export"):
+            return ObjectReadSerializer
+        return super().get_serializer_class()
+
+    def get_etag_values(self, instance: ObjectRecord) -> list:
+        # the allowed fields depend on the permission of the token
+        permissions = getattr(instance._object_type, "token_permissions", [])
+        # other records of the object are part of the representation as well, e.g.
+        # `correctedBy`, so the last modification of any of them is used
+        last_modified = instance.object.records.aggregate(
+            last_modified=models.Max("modified_on")
+        )["last_modified"]
+        return [
+            instance.pk,
+            last_modified,
+            # the actual record depends on the date of the request
+            datetime.date.today(),
+            [reference.pk for reference in instance.references.all()],
+            getattr(self.request.auth, "is_superuser", None),
+            [
+                (permission.mode, permission.use_fields, permission.fields)
+                for permission in permissions
+            ],
+        ]
+
     def filter_queryset(self, queryset):
         # show only actual objects
-        if self.action in ("list", "search", "retrieve"):
+        if self.action in ("list", "search", "retrieve", "export"):
             date = getattr(self.request, "query_params", {}).get("date", None)
             registration_date = getattr(self.request, "query_params", {}).get(
                 "registrationDate", None
             )
 
+            today = datetime.date.today()
             if date and is_date(date):
-                queryset = queryset.filter_for_date(parse_date(date))
+                date = parse_date(date)
             elif registration_date and is_date(registration_date):
+                date = None
+            else:
+                date = today
+
+            if date == today:
+                # the last record per object is maintained on save, which avoids
+                # a correlated subquery for every record
+                queryset = queryset.keep_current_record_per_object(today)
+            elif date:
+                queryset = queryset.filter_for_date(date).keep_max_record_per_object()
+            else:
                 queryset = queryset.filter_for_registration_date(
                     parse_date(registration_date)
-                )
-            else:
-                queryset = queryset.filter_for_date(datetime.date.today())
-
-        # keep only records with max index per object
-        queryset = queryset.keep_max_record_per_object()
+                ).keep_max_record_per_object()
+        else:
+            # keep only records with max index per object
+            queryset = queryset.keep_max_record_per_object()
 
         # filter on the rest of query params
         return super().filter_queryset(queryset)
@@ -372,11 +571,7 @@ class ObjectViewSet(
         objects_create_counter.add(1)
 
         if record := serializer.instance:
-            object_path = reverse(
-                "v2:object-detail", kwargs={"uuid": str(record.object.uuid)}
-            )
-            object_url = self.request.build_absolute_uri(object_path)
-            send_zaak_events.delay(record.pk, object_url)
+            self.schedule_zaak_events([record])
         else:
             logger.warning("missing_record")  # will this happen?
 
@@ -385,86 +580,371 @@ class ObjectViewSet(
         objects_update_counter.add(1)
 
         if record := serializer.instance:
-            object_path = reverse(
-                "v2:object-detail", kwargs={"uuid": str(record.object.uuid)}
-            )
-            object_url = self.request.build_absolute_uri(object_path)
-            send_zaak_events.delay(record.pk, object_url)
+            self.schedule_zaak_events([record])
         else:
             logger.warning("missing_record")  # will this happen?
 
+    def schedule_zaak_events(self, records: list[ObjectRecord]) -> None:
+        """
+        Schedule one task for the zaak events of the records, once the transaction is
+        committed.
+        """
+        if not settings.ENABLE_CLOUD_EVENTS or not records:
+            return
+
+        object_urls = [
+            (
+                record.pk,
+                self.request.build_absolute_uri(
+                    reverse(
+                        "v2:object-detail", kwargs={"uuid": str(record.object.uuid)}
+                    )
+                ),
+            )
+            for record in records
+        ]
+        transaction.on_commit(lambda: send_batched_zaak_events.delay(object_urls))
+
     def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        notification_data = self.get_serializer(instance).data
-        obj: Object = instance.object
-
-        object_path = reverse("v2:object-detail", kwargs={"uuid": str(obj.uuid)})
-        object_url = self.request.build_absolute_uri(object_path)
-        zaak_references = obj.last_record.references.filter(type=ReferenceType.zaak)
-
-        match settings.ENABLE_CLOUD_EVENTS and list(
-            zaak_references.values_list("url", flat=True)
-        ):
-            case [*zaak_urls] if (
-                archiving_zaak_url := request.query_params.get("zaak")
-            ) and len(zaak_urls) > 1:
-                # OAB is archiving one of many ZAKEN attached to this object;
-                # just remove this single zaak reference; don't delete the object
-                zaak_references.filter(url=archiving_zaak_url).delete()
-                process_cloudevent(
-                    ZAAK_ONTKOPPELD,
-                    data={
-                        "zaak": archiving_zaak_url,
-                        "linkTo": object_url,
-                        "linkObjectType": "object",
-                    },
-                )
+        # the notification is written to the outbox in the same transaction
+        with conditional_atomic(self.notifications_wrap_in_atomic_block)():
+            instance = self.get_object()
+            notification_data = self.get_serializer(instance).data
+            obj: Object = instance.object
+
+            object_path = reverse("v2:object-detail", kwargs={"uuid": str(obj.uuid)})
+            object_url = self.request.build_absolute_uri(object_path)
+            zaak_references = obj.last_record.references.filter(type=ReferenceType.zaak)
+
+            match settings.ENABLE_CLOUD_EVENTS and list(
+                zaak_references.values_list("url", flat=True)
+            ):
+                case [*zaak_urls] if (
+                    archiving_zaak_url := request.query_params.get("zaak")
+                ) and len(zaak_urls) > 1:
+                    # OAB is archiving one of many ZAKEN attached to this object;
+                    # just remove this single zaak reference; don't delete the object
+                    zaak_references.filter(url=archiving_zaak_url).delete()
+                    process_cloudevent(
+                        ZAAK_ONTKOPPELD,
+                        data={
+                            "zaak": archiving_zaak_url,
+                            "linkTo": object_url,
+                            "linkObjectType": "object",
+                        },
+                    )
+
+                    response = Response(
+                        {"behouden": [object_url]}, status=status.HTTP_200_OK
+                    )
+                    self.action = "update"  # change action for notification
+                    self.notify(
+                        response.status_code, notification_data, instance=instance
+                    )
+                    return response
+
+                case [*zaak_urls] if zaak_urls:
+
+                    def send_events():
+                        for zaak_url in zaak_urls:
+                            process_cloudevent(
+                                ZAAK_ONTKOPPELD,
+                                data={
+                                    "zaak": zaak_url,
+                                    "linkTo": object_url,
+                                    "linkObjectType": "object",
+                                },
+                            )
+
+                    transaction.on_commit(send_events)
+
+            obj.delete()
+            objects_delete_counter.add(1)
+
+            response = Response(status=status.HTTP_204_NO_CONTENT)
+            self.notify(response.status_code, notification_data, instance=instance)
+            return response
+
+    @extend_schema(
+        description=(
+            "Create multiple OBJECTs and their initial RECORD at once. The OBJECTs "
+            "are validated individually: the valid OBJECTs are created and the "
+            "result of each OBJECT is returned in the same order as in the request."
+        ),
+        operation_id="object_bulk_create",
+        request=ObjectSerializer(many=True),
+        responses={"200": ObjectBulkSerializer},
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        """Create multiple OBJECTs at once."""
+        items = request.data
+        if not isinstance(items, list):
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [_("Expected a list of objects.")]},
+                code="not_a_list",
+            )
 
-                response = Response(
-                    {"behouden": [object_url]}, status=status.HTTP_200_OK
+        max_size = settings.OBJECTS_BULK_CREATE_MAX_SIZE
+        if len(items) > max_size:
+            raise ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        _(
+                            "Ensure this list has no more than {max_size} objects."
+                        ).format(max_size=max_size)
+                    ]
+                },
+                code="max_length",
+            )
+
+        results: list[dict] = []
+        validated_items: list[tuple[dict, dict]] = []
+        object_types: dict[int, ObjectType] = {}
+        uuids = set()
+        for item in items:
+            serializer = self.get_serializer(data=item)
+            if not serializer.is_valid():
+                errors = list(get_validation_errors(serializer.errors))
+                results.append(bulk_error(status.HTTP_400_BAD_REQUEST, errors))
+                continue
+
+            validated_data = serializer.validated_data
+            # share the object type instances, since they cache the permissions
+            object_type = object_types.setdefault(
+                validated_data["_object_type"].pk, validated_data["_object_type"]
+            )
+            validated_data["_object_type"] = object_type
+
+            if not self.has_write_permission(object_type):
+                error = {
+                    "name": "type",
+                    "code": PermissionDenied.default_code,
+                    "reason": PermissionDenied.default_detail,
+                }
+                results.append(bulk_error(status.HTTP_403_FORBIDDEN, [error]))
+                continue
+
+            if uuid := validated_data.get("object", {}).get("uuid"):
+                if uuid in uuids:
+                    error = {
+                        "name": "uuid",
+                        "code": "unique",
+                        "reason": _("An object with this UUID already exists."),
+                    }
+                    results.append(bulk_error(status.HTTP_400_BAD_REQUEST, [error]))
+                    continue
+                uuids.add(uuid)
+
+            result = {"status": status.HTTP_201_CREATED}
+            results.append(result)
+            validated_items.append((result, validated_data))
+
+        with transaction.atomic():
+            records = self.get_serializer(many=True).create(
+                [validated_data for _result, validated_data in validated_items]
+            )
+            # avoid queries per record in the representation
+            prefetch_related_objects(records, "references", "corrected")
+
+            for (result, _validated_data), record in zip(validated_items, records):
+                result["object"] = record
+
+            response = Response(
+                ObjectBulkSerializer(
+                    {"results": results}, context=self.get_serializer_context()
+                ).data
+            )
+
+            self.notify_bulk(
+                "create",
+                [
+                    (result_data["object"], result["object"])
+                    for result, result_data in zip(results, response.data["results"])
+                    if "object" in result
+                ],
+            )
+
+        objects_create_counter.add(len(records))
+        # new objects only have events for their zaak references
+        self.schedule_zaak_events(
+            [
+                record
+                for record in records
+                if any(
+                    reference.type == ReferenceType.zaak
+                    for reference in record.references.all()
                 )
-                self.action = "update"  # change action for notification
-                self.notify(response.status_code, notification_data, instance=instance)
-                return response
-
-            case [*zaak_urls] if zaak_urls:
-
-                def send_events():
-                    for zaak_url in zaak_urls:
-                        process_cloudevent(
-                            ZAAK_ONTKOPPELD,
-                            data={
-                                "zaak": zaak_url,
-                                "linkTo": object_url,
-                                "linkObjectType": "object",
-                            },
-                        )
+            ]
+        )
+
+        return response
+
+    def has_write_permission(self, object_type: ObjectType) -> bool:
+        request = self.request
+        if bypass_permissions(request) or request.auth.is_superuser:
+            return True
+
+        if not hasattr(object_type, "token_permissions"):
+            object_type.token_permissions = list(
+                request.auth.permissions.filter(object_type=object_type)
+            )
+
+        return any(
+            permission.mode == PermissionModes.read_and_write
+            for permission in object_type.token_permissions
+        )
+
+    @extend_schema(
+        description=(
+            "Export all OBJECTs of an OBJECTTYPE and their actual RECORD at once. "
+            "The OBJECTs are streamed as newline delimited JSON (one OBJECT per "
+            "line) or as CSV and support the same filters as the list endpoint."
+        ),
+        operation_id="object_export",
+        filters=True,
+        parameters=[
+            data_attrs_parameter,
+            data_attr_parameter,
+            OpenApiParameter(
+                name="fields",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description=_(
+                    "Comma-separated fields, which should be exported. "
+                    "For example: 'url, uuid, record__geometry'."
+                ),
+            ),
+            OpenApiParameter(
+                name="exportFormat",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                enum=ExportFormats.values,
+                default=ExportFormats.ndjson,
+                description=_("Format of the exported OBJECTs"),
+            ),
+        ],
+        responses={
+            (200, content_type): OpenApiTypes.STR
+            for content_type in CONTENT_TYPES.values()
+        },
+    )
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Stream all OBJECTs of an OBJECTTYPE."""
+        if not request.query_params.get("type"):
+            raise ValidationError(
+                {"type": [_("This field is required.")]}, code="required"
+            )
 
-                transaction.on_commit(send_events)
+        export_format = request.query_params.get("exportFormat", ExportFormats.ndjson)
+        if export_format not in ExportFormats.values:
+            raise ValidationError(
+                {
+                    "exportFormat": [
+                        _('"{input}" is not a valid choice.').format(
+                            input=export_format
+                        )
+                    ]
+                },
+                code="invalid_choice",
+            )
 
-        obj.delete()
-        objects_delete_counter.add(1)
+        queryset = self.filter_queryset(self.get_queryset())
+        # `iterator` uses a server side cursor, unless disabled with
+        # `DB_DISABLE_SERVER_SIDE_CURSORS`, and prefetches per chunk
+        records = queryset.iterator(chunk_size=settings.OBJECTS_EXPORT_CHUNK_SIZE)
 
-        response = Response(status=status.HTTP_204_NO_CONTENT)
-        self.notify(response.status_code, notification_data, instance=instance)
+        response = StreamingHttpResponse(
+            export_records(records, self.get_serializer(), export_format),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="objects.{export_format}"'
+        )
         return response
 
+    @extend_schema(
+        description=(
+            "Retrieve the changes of OBJECTs in the order of the transactions which "
+            "made them, to synchronize OBJECTs incrementally. A change is added for "
+            "every new RECORD and for deleted OBJECTs. Changes are only returned "
+            "once all earlier transactions are finished, so following the `next` "
+            "link never skips changes."
+        ),
+        operation_id="object_changes",
+        parameters=[
+            OpenApiParameter(
+                name="type",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.URI,
+                description=_("Only include changes of OBJECTs of this OBJECTTYPE"),
+            ),
+        ],
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        serializer_class=ObjectChangeSerializer,
+        pagination_class=ChangeFeedPagination,
+    )
+    def changes(self, request):
+        """Retrieve the changes of OBJECTs."""
+        changes = (
+            ObjectChange.objects.filter_for_token(request.auth)
+            .filter_committed()
+            .select_related("object_type")
+        )
+        if object_type_url := request.query_params.get("type"):
+            try:
+                object_type = ObjectType.objects.get_by_url(object_type_url)
+            except (ObjectType.DoesNotExist, ValueError):
+                raise ValidationError(
+                    {"type": [_("Invalid OBJECTTYPE url.")]}, code="invalid"
+                )
+            changes = changes.filter(object_type=object_type)
+
+        page = self.paginate_queryset(changes)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
     @extend_schema(
         description="Retrieve all RECORDs of an OBJECT.",
-        responses={"200": HistoryRecordSerializer(many=True)},
+        parameters=[*etag_parameters, *last_modified_parameters],
+        responses={
+            "200": HistoryRecordSerializer(many=True),
+            "304": not_modified_response,
+        },
     )
     @action(detail=True, methods=["get"], serializer_class=HistoryRecordSerializer)
     def history(self, request, uuid=None):
         """Retrieve all RECORDs of an OBJECT."""
-        records = self.get_object().object.records.order_by("id")
+        records = (
+            self.get_object()
+            .object.records.select_related("correct", "corrected")
+            .order_by("id")
+        )
 
-        page = self.paginate_queryset(records)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        def get_response():
+            page = self.paginate_queryset(records)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
 
-        serializer = self.get_serializer(records, many=True)
-        return Response(serializer.data)
+            serializer = self.get_serializer(records, many=True)
+            return Response(serializer.data)
+
+        # records are only added and closed, which updates `modified_on`. Unlike the
+        # actual record of the object, the history doesn't change over time, so it
+        # also has a `Last-Modified`
+        validators = records.aggregate(
+            count=models.Count("pk"), last_modified=models.Max("modified_on")
+        )
+        return self.get_conditional_response(
+            [validators["count"], validators["last_modified"]],
+            validators["last_modified"],
+            get_response,
+        )
 
     @extend_schema(
         description="Retrieve the specified OBJECT given an UUID and INDEX.",
@@ -509,8 +989,7 @@ class ObjectViewSet(
         queryset = self.filter_queryset(self.get_queryset())
 
         if "geometry" in search_input:
-            within = search_input["geometry"]["within"]
-            queryset = queryset.filter(geometry__within=within).distinct()
+            queryset = queryset.filter_for_geometry(**search_input["geometry"])
 
         return self.get_search_output(queryset)
 
@@ -529,11 +1008,15 @@ class ObjectViewSet(
     def finalize_response(self, request, response, *args, **kwargs):
         """add warning header if not all data is allowed to display"""
 
-        if response.status_code == 200:
+        if response.status_code == 200 and isinstance(response, Response):
             serializer = getattr(response.data, "serializer", None) or getattr(
                 response.data.get("results"), "serializer", None
             )
-            if self.action == "retrieve" and serializer.not_allowed:
+            if serializer is None:
+                # the query plans are returned instead of the results
+                pass
+
+            elif self.action == "retrieve" and serializer.not_allowed:
                 self.headers[settings.UNAUTHORIZED_FIELDS_HEADER] = (
                     serializer.not_allowed.pretty()
                 )
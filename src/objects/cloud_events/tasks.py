@@ -1,69 +1,138 @@
 from django.conf import settings
+from django.db.models import Exists, F, OuterRef
 
+import requests
+import structlog
 from celery import shared_task
-from notifications_api_common.cloudevents import process_cloudevent
+from notifications_api_common.cloudevents import construct_cloudevent
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
+from notifications_api_common.tasks import send_cloudevent
 
 from objects.core.constants import ReferenceType
 from objects.core.models import ObjectRecord, Reference
 
 from .constants import ZAAK_GEKOPPELD, ZAAK_ONTKOPPELD
 
+logger = structlog.stdlib.get_logger(__name__)
+
 
 @shared_task
 def send_zaak_events(object_record_id: int, object_url: str):
-    """Send all zaak gekoppeld/ontkoppeld
+    """Send all zaak gekoppeld/ontkoppeld of a single record
+
+    Kept for the tasks which were queued before ``send_batched_zaak_events``.
+    """
+    send_batched_zaak_events([(object_record_id, object_url)])
+
+
+@shared_task
+def send_batched_zaak_events(records: list[tuple[int, str]]):
+    """Send all zaak gekoppeld/ontkoppeld of multiple records
 
     In order to not slow down the object API endpoint with extra queries and
-    multiple cloudevent schedules, this is done in a task.
+    multiple cloudevent schedules, this is done in a task. The references of all
+    records and their previous records are retrieved at once and the events are
+    sent by this task, instead of a task per event.
     """
     if not settings.ENABLE_CLOUD_EVENTS:
         return
 
-    try:
-        record = (
-            ObjectRecord.objects.select_related("object")
-            .prefetch_related("references")
-            .get(pk=object_record_id)
-        )
-    except ObjectRecord.DoesNotExist:  # pragma: no cover
+    # like `process_cloudevent`, which sends the events of deleted objects
+    if not get_setting("NOTIFICATIONS_SOURCE"):
+        logger.warning("notifications_source_not_configured")
         return
 
-    object = record.object
-    label = f"{object.object_type.name} {record}"
-
-    current: set[str] = {
-        ref.url for ref in record.references.all() if ref.type == ReferenceType.zaak
-    }
-    previous: set[str] = {
-        ref.url
-        for ref in Reference.objects.filter(
-            type=ReferenceType.zaak,
-            record__object__pk=object.pk,
-            record__index=record.index - 1,
-        )
-    }
-
-    gekoppeld = current - previous
-    ontkoppeld = previous - current
-
-    for zaak_url in gekoppeld:
-        process_cloudevent(
-            ZAAK_GEKOPPELD,
-            data={
-                "zaak": zaak_url,
-                "linkTo": object_url,
-                "linkObjectType": "object",
-                "label": label,
-            },
-        )
+    object_urls: dict[int, str] = dict(records)
+    object_records = list(
+        ObjectRecord.objects.select_related("object__object_type")
+        .filter(pk__in=list(object_urls))
+        .order_by("pk")
+    )
+    if not object_records:  # pragma: no cover
+        return
+
+    zaak_references = Reference.objects.filter(type=ReferenceType.zaak)
+    current: dict[int, set[str]] = {record.pk: set() for record in object_records}
+    for record_id, url in zaak_references.filter(record__in=object_records).values_list(
+        "record_id", "url"
+    ):
+        current[record_id].add(url)
 
-    for zaak_url in ontkoppeld:
-        process_cloudevent(
-            ZAAK_ONTKOPPELD,
-            data={
-                "zaak": zaak_url,
-                "linkTo": object_url,
-                "linkObjectType": "object",
-                # label is not used, it's pure display and not needed for removal
-            },
+    # the references of the previous records, by the object and index of the records
+    # which follow them
+    previous: dict[tuple[int, int], set[str]] = {}
+    previous_records = ObjectRecord.objects.filter(
+        Exists(
+            ObjectRecord.objects.filter(
+                pk__in=list(object_urls),
+                object=OuterRef("object"),
+                index=OuterRef("index") + 1,
+            )
         )
+    )
+    for object_id, index, url in zaak_references.filter(
+        record__in=previous_records
+    ).values_list("record__object_id", F("record__index") + 1, "url"):
+        previous.setdefault((object_id, index), set()).add(url)
+
+    cloudevents = []
+    for record in object_records:
+        object_url = object_urls[record.pk]
+        label = f"{record.object.object_type.name} {record}"
+        current_urls = current[record.pk]
+        previous_urls = previous.get((record.object_id, record.index), set())
+
+        for zaak_url in sorted(current_urls - previous_urls):
+            cloudevents.append(
+                construct_cloudevent(
+                    ZAAK_GEKOPPELD,
+                    data={
+                        "zaak": zaak_url,
+                        "linkTo": object_url,
+                        "linkObjectType": "object",
+                        "label": label,
+                    },
+                )
+            )
+
+        for zaak_url in sorted(previous_urls - current_urls):
+            cloudevents.append(
+                construct_cloudevent(
+                    ZAAK_ONTKOPPELD,
+                    data={
+                        "zaak": zaak_url,
+                        "linkTo": object_url,
+                        "linkObjectType": "object",
+                        # label is not used, it's pure display and not needed for removal
+                    },
+                )
+            )
+
+    send_cloudevents(cloudevents)
+
+
+def send_cloudevents(cloudevents: list[dict]) -> None:
+    """
+    Send the cloudevents to the Notifications API with one client.
+
+    Events which can't be delivered are scheduled with the ``send_cloudevent`` task,
+    which retries them with the backoff of the notifications configuration.
+    """
+    if not cloudevents:
+        return
+
+    client = NotificationsConfig.get_client()
+    if client is None:
+        logger.warning("notifications_api_not_configured")
+        return
+
+    for cloudevent in cloudevents:
+        try:
+            response = client.post("cloudevents", json=cloudevent)
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            logger.warning(
+                "cloudevent_delivery_retried", type=cloudevent["type"], exc_info=exc
+            )
+            send_cloudevent.delay(cloudevent)
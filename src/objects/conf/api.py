@@ -117,5 +117,7 @@ SPECTACULAR_SETTINGS = {
 }
 
 UNAUTHORIZED_FIELDS_HEADER = "X-Unauthorized-Fields"
+APPROXIMATE_COUNT_HEADER = "X-Approximate-Count"
+EXPLAIN_HEADER = "X-Explain"
 
 COMMONGROUND_API_COMMON_GET_DOMAIN = "objects.utils.get_domain"
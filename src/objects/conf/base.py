@@ -124,6 +124,181 @@ NOTIFICATIONS_SOURCE = config(
 if ENABLE_CLOUD_EVENTS and not NOTIFICATIONS_SOURCE:
     raise ImproperlyConfigured("NOTIFICATIONS_SOURCE is REQUIRED for CloudEvents")
 
+NOTIFICATIONS_OUTBOX_BATCH_SIZE = config(
+    "NOTIFICATIONS_OUTBOX_BATCH_SIZE",
+    default=100,
+    help_text=(
+        "Number of notifications which are fetched from the outbox at once to send "
+        "them to the Notificaties API"
+    ),
+)
+NOTIFICATIONS_OUTBOX_RETRY_INTERVAL = config(
+    "NOTIFICATIONS_OUTBOX_RETRY_INTERVAL",
+    default=300,
+    help_text=(
+        "Number of seconds after which sending the outbox is retried, if the "
+        "Notificaties API is not configured"
+    ),
+)
+
+OBJECTS_COUNT_STRATEGY = config(
+    "OBJECTS_COUNT_STRATEGY",
+    default="exact",
+    help_text=(
+        "Strategy to determine the total count of paginated object lists with more "
+        "results than ``OBJECTS_COUNT_EXACT_THRESHOLD``. Possible values are "
+        "``exact``, ``estimate`` (estimate of the Postgres query planner) and "
+        "``cached`` (exact count, cached for ``OBJECTS_COUNT_CACHE_TIMEOUT`` seconds). "
+        "Approximate counts are indicated with the ``X-Approximate-Count`` "
+        "response header"
+    ),
+)
+OBJECTS_COUNT_EXACT_THRESHOLD = config(
+    "OBJECTS_COUNT_EXACT_THRESHOLD",
+    default=10_000,
+    help_text=(
+        "Paginated object lists with at most this number of results always have an "
+        "exact count, regardless of ``OBJECTS_COUNT_STRATEGY``"
+    ),
+)
+OBJECTS_COUNT_CACHE_TIMEOUT = config(
+    "OBJECTS_COUNT_CACHE_TIMEOUT",
+    default=60,
+    help_text=(
+        "Number of seconds the count of paginated object lists is cached, if "
+        "``OBJECTS_COUNT_STRATEGY`` is ``cached``"
+    ),
+)
+OBJECTS_MAX_RECORD_STRATEGY = config(
+    "OBJECTS_MAX_RECORD_STRATEGY",
+    default="subquery",
+    help_text=(
+        "Strategy to select the last record of objects for the ``date`` and "
+        "``registrationDate`` filters of object lists. Possible values are "
+        "``subquery`` (correlated subquery per record), ``distinct_on`` (``DISTINCT "
+        "ON`` the object) and ``window`` (``ROW_NUMBER()`` window per object). The "
+        "latter two perform better for objects with long histories, use the "
+        "``benchmark_max_record_strategies`` management command to compare them"
+    ),
+)
+
+if OBJECTS_MAX_RECORD_STRATEGY not in ("subquery", "distinct_on", "window"):
+    raise ImproperlyConfigured(
+        "OBJECTS_MAX_RECORD_STRATEGY must be 'subquery', 'distinct_on' or 'window'"
+    )
+
+OBJECTS_SCHEMA_VALIDATOR_CACHE_TIMEOUT = config(
+    "OBJECTS_SCHEMA_VALIDATOR_CACHE_TIMEOUT",
+    default=300,
+    help_text=(
+        "Number of seconds the compiled JSON schema validators of object type "
+        "versions are cached in each process. Changes to object type versions made "
+        "in other processes are applied after at most this number of seconds. Use "
+        "``0`` to disable the cache"
+    ),
+)
+OBJECTS_BULK_CREATE_MAX_SIZE = config(
+    "OBJECTS_BULK_CREATE_MAX_SIZE",
+    default=1000,
+    help_text="Maximum number of objects which can be created in one bulk request",
+)
+OBJECTS_EXPORT_CHUNK_SIZE = config(
+    "OBJECTS_EXPORT_CHUNK_SIZE",
+    default=2000,
+    help_text=(
+        "Number of object records which are fetched from the database at once when "
+        "exporting objects"
+    ),
+)
+OBJECTS_TOKEN_CACHE_TIMEOUT = config(
+    "OBJECTS_TOKEN_CACHE_TIMEOUT",
+    default=5,
+    help_text=(
+        "Number of seconds API tokens and their permissions are cached. Changes "
+        "made in other processes, including revoked tokens, are applied after at "
+        "most this number of seconds, unless ``OBJECTS_TOKEN_CACHE_SHARED`` is "
+        "enabled. Use ``0`` to disable the cache"
+    ),
+)
+OBJECTS_TOKEN_CACHE_SHARED = config(
+    "OBJECTS_TOKEN_CACHE_SHARED",
+    default=False,
+    help_text=(
+        "Cache API tokens in the shared (Redis) cache instead of in each process, "
+        "so changes to tokens and permissions are applied immediately in all "
+        "processes. Changes which are made directly in the database, instead of "
+        "through the admin or the application, are applied after at most "
+        "``OBJECTS_TOKEN_CACHE_TIMEOUT`` seconds"
+    ),
+)
+OBJECTTYPES_CLIENT_CACHE = config(
+    "OBJECTTYPES_CLIENT_CACHE",
+    default="",
+    help_text=(
+        "Cache the responses of the Objecttypes API, which are fetched when importing "
+        "objecttypes. Possible values are empty (no cache), ``redis`` (the shared "
+        "Redis cache) and ``disk`` (files in ``OBJECTTYPES_CLIENT_CACHE_DIR``)"
+    ),
+)
+OBJECTTYPES_CLIENT_CACHE_DIR = config(
+    "OBJECTTYPES_CLIENT_CACHE_DIR",
+    default="",
+    help_text=(
+        "Directory in which the responses of the Objecttypes API are cached, if "
+        "``OBJECTTYPES_CLIENT_CACHE`` is ``disk``. Defaults to the "
+        "``cache/objecttypes`` directory of the installation"
+    ),
+) or str(BASE_DIR / "cache" / "objecttypes")
+OBJECTTYPES_CLIENT_CACHE_TIMEOUT = config(
+    "OBJECTTYPES_CLIENT_CACHE_TIMEOUT",
+    default=60,
+    help_text=(
+        "Number of seconds cached responses of the Objecttypes API are used without "
+        "requesting them again. Afterwards they are revalidated with their ``ETag``, "
+        "so unchanged responses are not transferred again"
+    ),
+)
+OBJECTTYPES_CLIENT_CACHE_MAX_AGE = config(
+    "OBJECTTYPES_CLIENT_CACHE_MAX_AGE",
+    default=86400,
+    help_text=(
+        "Number of seconds cached responses of the Objecttypes API with an ``ETag`` "
+        "are kept to revalidate them. Afterwards they are requested again in full"
+    ),
+)
+
+if OBJECTTYPES_CLIENT_CACHE not in ("", "redis", "disk"):
+    raise ImproperlyConfigured(
+        "OBJECTTYPES_CLIENT_CACHE must be empty, 'redis' or 'disk'"
+    )
+
+OBJECTS_FAST_JSON = config(
+    "OBJECTS_FAST_JSON",
+    default=False,
+    help_text=(
+        "Use ``orjson`` to render and parse JSON in the API, which is considerably "
+        "faster for large responses and request bodies. The output represents the "
+        "same values as the default JSON renderer, but the exponents of some floats "
+        "are formatted differently (e.g. ``1.5e-7`` instead of ``1.5e-07``)"
+    ),
+)
+if OBJECTS_FAST_JSON:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
+        "objects.api.renderers.ORJSONRenderer"
+    ]
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = ["objects.api.parsers.ORJSONParser"]
+OBJECTS_EXPLAIN_ENABLED = config(
+    "OBJECTS_EXPLAIN_ENABLED",
+    default=False,
+    help_text=(
+        "Allow superuser tokens to retrieve the query plans (``EXPLAIN ANALYZE``) "
+        "and the time spent in queries and serialization of object lists and "
+        "searches instead of the results, by providing the ``X-Explain`` request "
+        "header. The queries are executed twice for such requests, so this should "
+        "only be enabled to investigate slow requests"
+    ),
+)
+
 #
 # CELERY
 #
@@ -25,7 +25,13 @@ from objects.api.v2.filters import filter_queryset_by_data_attr
 from .constants import ObjectTypeVersionStatus
 from .forms import FileImportForm, ObjectTypeVersionForm, UrlImportForm
 from .import_export import export_data, import_upload
-from .models import Object, ObjectRecord, ObjectType, ObjectTypeVersion
+from .models import (
+    IndexedAttribute,
+    Object,
+    ObjectRecord,
+    ObjectType,
+    ObjectTypeVersion,
+)
 from .widgets import JSONSuit
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -106,11 +112,19 @@ class ObjectTypeVersionInline(admin.StackedInline):
         css = READONLY_WIDGET_MEDIA_CSS
 
 
+class IndexedAttributeInline(admin.TabularInline):
+    model = IndexedAttribute
+    extra = 0
+    verbose_name_plural = _(
+        "indexed attributes (run the `sync_attribute_indexes` command to apply changes)"
+    )
+
+
 @admin.register(ObjectType)
 class ObjectTypeAdmin(admin.ModelAdmin):
     list_display = ("name", "name_plural", "allow_geometry")
     search_fields = ("name", "name_plural", "uuid")
-    inlines = [ObjectTypeVersionInline]
+    inlines = [ObjectTypeVersionInline, IndexedAttributeInline]
 
     change_list_template = "admin/core/objecttype/object_list.html"
 
@@ -25,5 +25,21 @@ class UpdateFrequencyChoices(models.TextChoices):
     unknown = "unknown", _("Unknown")
 
 
+class MaxRecordStrategies(models.TextChoices):
+    subquery = "subquery", _("correlated subquery")
+    distinct_on = "distinct_on", _("DISTINCT ON the object")
+    window = "window", _("ROW_NUMBER() window per object")
+
+
+class ChangeActions(models.TextChoices):
+    created = "created", _("Created")
+    updated = "updated", _("Updated")
+    deleted = "deleted", _("Deleted")
+
+
 class ReferenceType(models.TextChoices):
     zaak = "zaak", _("Zaak")
+
+
+# prefix of the names of the indexes of `IndexedAttribute`
+INDEXED_ATTRIBUTE_PREFIX = "idx_attr_"
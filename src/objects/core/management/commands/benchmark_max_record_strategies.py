@@ -0,0 +1,175 @@
+import datetime
+import statistics
+import time
+
+from django.core.management import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.backends.base.creation import TEST_DATABASE_PREFIX
+
+from objects.core.constants import MaxRecordStrategies
+from objects.core.models import ObjectRecord, ObjectType
+
+START_DATE = datetime.date(2000, 1, 1)
+
+INSERT_OBJECTS_SQL = """
+    INSERT INTO core_object (uuid, object_type_id, created_on, modified_on)
+    SELECT gen_random_uuid(), %(object_type)s, now(), now()
+    FROM generate_series(1, %(object_count)s)
+"""
+
+# every record of an object starts one day after the previous one
+INSERT_RECORDS_SQL = """
+    INSERT INTO core_objectrecord (
+        object_id, _object_type_id, index, version, data, start_at, end_at,
+        registration_at, created_on, modified_on, is_last_record
+    )
+    SELECT
+        o.id, o.object_type_id, i, 1, jsonb_build_object('index', i),
+        %(start_date)s::date + i,
+        CASE WHEN i < %(record_count)s THEN %(start_date)s::date + i + 1 END,
+        %(start_date)s::date + i, now(), now(), i = %(record_count)s
+    FROM core_object o CROSS JOIN generate_series(1, %(record_count)s) i
+    WHERE o.object_type_id = %(object_type)s
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the strategies to select the last record of objects, for object "
+        "types with different numbers of objects and records per object. The "
+        "generated data is rolled back afterwards, but it's inserted in the object "
+        "tables, so the benchmark should be run against a separate database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            help=(
+                "Alias of the (separate) database in which the data is generated, "
+                "instead of the default database"
+            ),
+        )
+        parser.add_argument(
+            "--yes-use-live-db",
+            action="store_true",
+            help=(
+                "Generate the data in the default database, even though it's not a "
+                "test database. The inserts lock and bloat the object tables, and "
+                "fire their triggers"
+            ),
+        )
+        parser.add_argument(
+            "--objects",
+            type=int,
+            nargs="+",
+            default=[1000, 10000],
+            help="Numbers of objects of the generated object types",
+        )
+        parser.add_argument(
+            "--records",
+            type=int,
+            nargs="+",
+            default=[1, 10, 100],
+            help="Numbers of records per object of the generated object types",
+        )
+        parser.add_argument(
+            "--rounds",
+            type=int,
+            default=5,
+            help="Number of times each query is executed, the median is reported",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=100,
+            help="Number of records retrieved for the first page",
+        )
+
+    def handle(self, *args, **options):
+        self.database = options["database"] or DEFAULT_DB_ALIAS
+        self.rounds = options["rounds"]
+        self.page_size = options["page_size"]
+
+        database_name = connections[self.database].settings_dict["NAME"]
+        if (
+            not options["database"]
+            and not options["yes_use_live_db"]
+            and not database_name.startswith(TEST_DATABASE_PREFIX)
+        ):
+            raise CommandError(
+                f"Refusing to generate benchmark data in the database "
+                f"{database_name!r}. Use --database to run the benchmark against a "
+                f"separate database, or --yes-use-live-db to use it anyway"
+            )
+
+        self.stdout.write(
+            f"{'objects':>8} {'records':>8} {'filter':<18} "
+            + " ".join(f"{strategy:>12}" for strategy in MaxRecordStrategies.values)
+        )
+
+        with transaction.atomic(using=self.database):
+            for object_count in options["objects"]:
+                for record_count in options["records"]:
+                    object_type = self.create_data(object_count, record_count)
+                    last_date = START_DATE + datetime.timedelta(days=record_count)
+                    records = ObjectRecord.objects.using(self.database).filter(
+                        _object_type=object_type
+                    )
+                    filters = {
+                        "date": records.filter_for_date(last_date),
+                        "registrationDate": records.filter_for_registration_date(
+                            last_date
+                        ),
+                    }
+
+                    for name, queryset in filters.items():
+                        durations = [
+                            self.benchmark(queryset, strategy, expected=object_count)
+                            for strategy in MaxRecordStrategies.values
+                        ]
+                        self.stdout.write(
+                            f"{object_count:>8} {record_count:>8} {name:<18} "
+                            + " ".join(f"{duration:>10.1f}ms" for duration in durations)
+                        )
+
+            transaction.set_rollback(True, using=self.database)
+
+    def create_data(self, object_count: int, record_count: int) -> ObjectType:
+        object_type = ObjectType.objects.using(self.database).create(
+            name=f"benchmark {object_count}x{record_count}",
+            name_plural=f"benchmarks {object_count}x{record_count}",
+        )
+        params = {
+            "object_type": object_type.pk,
+            "object_count": object_count,
+            "record_count": record_count,
+            "start_date": START_DATE,
+        }
+        with connections[self.database].cursor() as cursor:
+            cursor.execute(INSERT_OBJECTS_SQL, params)
+            cursor.execute(INSERT_RECORDS_SQL, params)
+            # update the statistics, so the query plans match those of real data
+            cursor.execute("ANALYZE core_object, core_objectrecord")
+
+        return object_type
+
+    def benchmark(self, queryset, strategy: str, expected: int) -> float:
+        """
+        Return the median duration in milliseconds of counting the last records and
+        retrieving the first page, as is done for object lists.
+        """
+        durations = []
+        for _round in range(self.rounds):
+            start = time.perf_counter()
+            max_records = queryset.keep_max_record_per_object(strategy)
+            count = max_records.count()
+            list(max_records.order_by("-pk")[: self.page_size])
+            durations.append((time.perf_counter() - start) * 1000)
+
+            if count != expected:
+                raise CommandError(
+                    f"Strategy {strategy} returned {count} record(s) instead of "
+                    f"{expected}"
+                )
+
+        return statistics.median(durations)
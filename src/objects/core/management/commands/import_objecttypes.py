@@ -1,13 +1,19 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.utils.translation import gettext as _
 
 from djangorestframework_camel_case.util import underscoreize
 from packaging.version import Version
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from zgw_consumers.models import Service
 
 from objects.core.models import ObjectType, ObjectTypeVersion
+from objects.core.utils import clear_objecttype_validators
 from objects.utils.client import get_objecttypes_client
 
 # Minimum Objecttypes application version is 3.4.0, because that version added the
@@ -23,34 +29,60 @@ class Command(BaseCommand):
             "service_slug",
             help=_("Identifier/slug of Objecttypes API service"),
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help=_(
+                "Number of objecttypes of which the versions are fetched concurrently"
+            ),
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=_(
+                "Path of a file in which the progress is stored after each page of "
+                "objecttypes, an interrupted import continues from it"
+            ),
+        )
 
-    @transaction.atomic
     def handle(self, *args, **options):
         service_slug = options["service_slug"]
         service = self._get_service(service_slug)
+        workers = options["workers"]
+        checkpoint = Path(options["checkpoint"]) if options["checkpoint"] else None
+
+        with (
+            get_objecttypes_client(service) as client,
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+            # the threads share the connections of the session
+            adapter = HTTPAdapter(pool_maxsize=workers)
+            client.mount("http://", adapter)
+            client.mount("https://", adapter)
 
-        with get_objecttypes_client(service) as client:
             try:
                 self._check_objecttypes_api_version(client)
 
-                objecttypes = client.list_objecttypes()
-                data = self._parse_objecttype_data(objecttypes)
-                self._bulk_create_or_update_objecttypes(data)
-                self.stdout.write("Successfully imported %s objecttypes" % len(data))
-
-                for objecttype in data:
-                    objecttype_versions = client.list_objecttype_versions(
-                        objecttype.uuid
-                    )
-                    data = self._parse_objecttypeversion_data(
-                        objecttype_versions, objecttype
-                    )
-                    self._bulk_create_or_update_objecttype_versions(data)
-                    self.stdout.write(
-                        "Successfully imported %s versions for type: %s"
-                        % (len(data), objecttype.name)
+                url = self._read_checkpoint(checkpoint, service_slug)
+                for objecttypes, next_url in client.iter_objecttype_pages(url):
+                    data = self._parse_objecttype_data(objecttypes)
+                    # the versions are fetched before the transaction, so it's only
+                    # open while writing
+                    versions = list(
+                        executor.map(
+                            lambda objecttype: client.list_objecttype_versions(
+                                objecttype.uuid
+                            ),
+                            data,
+                        )
                     )
 
+                    with transaction.atomic():
+                        self._import_page(data, versions)
+
+                    if checkpoint:
+                        self._write_checkpoint(checkpoint, service_slug, next_url)
+
             except RequestException as e:
                 raise CommandError(
                     _(
@@ -58,6 +90,52 @@ class Command(BaseCommand):
                     ).format(e)
                 )
 
+        if checkpoint:
+            checkpoint.unlink(missing_ok=True)
+
+    def _import_page(
+        self,
+        objecttypes: list[ObjectType],
+        versions: list[list[dict[str, object]]],
+    ) -> None:
+        self._bulk_create_or_update_objecttypes(objecttypes)
+        self.stdout.write("Successfully imported %s objecttypes" % len(objecttypes))
+
+        for objecttype, objecttype_versions in zip(objecttypes, versions):
+            data = self._parse_objecttypeversion_data(objecttype_versions, objecttype)
+            self._bulk_create_or_update_objecttype_versions(data)
+            self.stdout.write(
+                "Successfully imported %s versions for type: %s"
+                % (len(data), objecttype.name)
+            )
+
+    def _read_checkpoint(self, checkpoint: Path | None, service_slug: str) -> str:
+        """
+        Return the URL of the page of objecttypes to start at, which is the first page
+        unless an earlier import of the service was interrupted.
+        """
+        if not checkpoint or not checkpoint.exists():
+            return "objecttypes"
+
+        progress = json.loads(checkpoint.read_text())
+        if progress["service"] != service_slug:
+            raise CommandError(
+                _("Checkpoint '{}' belongs to the import of service '{}'").format(
+                    checkpoint, progress["service"]
+                )
+            )
+
+        self.stdout.write("Continuing the import at %s" % progress["next"])
+        return progress["next"]
+
+    def _write_checkpoint(
+        self, checkpoint: Path, service_slug: str, next_url: str | None
+    ) -> None:
+        if next_url is None:
+            return
+
+        checkpoint.write_text(json.dumps({"service": service_slug, "next": next_url}))
+
     def _get_service(self, slug):
         try:
             return Service.objects.get(slug=slug)
@@ -66,9 +144,9 @@ class Command(BaseCommand):
 
     def _check_objecttypes_api_version(self, client):
         api_version = client.get_objecttypes_api_version()
-        if api_version is None or Version(
-            client.get_objecttypes_api_version()
-        ) < Version(MIN_OBJECTTYPES_API_VERSION):
+        if api_version is None or Version(api_version) < Version(
+            MIN_OBJECTTYPES_API_VERSION
+        ):
             raise CommandError(
                 _("Object types API version must be {} or higher.").format(
                     MIN_OBJECTTYPES_API_VERSION
@@ -119,6 +197,9 @@ class Command(BaseCommand):
                 "status",
             ],
         )
+        # `bulk_create` doesn't call `ObjectTypeVersion.save`
+        clear_objecttype_validators()
+        transaction.on_commit(clear_objecttype_validators)
 
     def _parse_objecttype_data(
         self, objecttypes: list[dict[str, object]]
@@ -0,0 +1,47 @@
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+
+import structlog
+
+from objects.core.models import ObjectRecord
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the `is_last_record` flag of object records, which is used to "
+        "retrieve the current record of objects"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only check if the flags are consistent, without updating them",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            inconsistent_count = (
+                ObjectRecord.objects.inconsistent_last_records().count()
+            )
+            if inconsistent_count:
+                logger.warning(
+                    "inconsistent_last_records", record_count=inconsistent_count
+                )
+                raise CommandError(
+                    f"{inconsistent_count} object record(s) have an inconsistent "
+                    "last record flag, run this command without `--check` to fix them"
+                )
+
+            self.stdout.write(self.style.SUCCESS("OK"))
+            return
+
+        with transaction.atomic():
+            updated_count = ObjectRecord.objects.rebuild_last_records()
+
+        logger.info("last_records_rebuilt", record_count=updated_count)
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully updated {updated_count} object record(s)")
+        )
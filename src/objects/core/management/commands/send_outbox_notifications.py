@@ -0,0 +1,24 @@
+from django.core.management import BaseCommand
+
+from objects.api.tasks import send_outbox_notifications
+from objects.core.models import OutboxNotification
+
+
+class Command(BaseCommand):
+    help = (
+        "Send the notifications in the outbox to the Notificaties API. The outbox is "
+        "sent by the Celery worker after each change, this command drains it if "
+        "starting the task failed, and should be scheduled periodically (e.g. with "
+        "cron)"
+    )
+
+    def handle(self, *args, **options):
+        send_outbox_notifications()
+
+        pending_count = OutboxNotification.objects.count()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully sent the outbox, {pending_count} notification(s) "
+                "are pending"
+            )
+        )
@@ -0,0 +1,99 @@
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, models
+
+import structlog
+
+from objects.core.constants import INDEXED_ATTRIBUTE_PREFIX
+from objects.core.models import IndexedAttribute, ObjectRecord
+
+logger = structlog.stdlib.get_logger(__name__)
+
+# indexes of failed concurrent builds are invalid and are rebuilt
+EXISTING_INDEXES_SQL = r"""
+    SELECT index_class.relname, pg_index.indisvalid
+    FROM pg_index
+    JOIN pg_class index_class ON index_class.oid = pg_index.indexrelid
+    WHERE pg_index.indrelid = %s::regclass AND index_class.relname LIKE %s
+"""
+
+
+def get_existing_indexes() -> dict[str, bool]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            EXISTING_INDEXES_SQL,
+            [ObjectRecord._meta.db_table, f"{INDEXED_ATTRIBUTE_PREFIX}%"],
+        )
+        return dict(cursor.fetchall())
+
+
+def get_declared_indexes() -> dict[str, models.Index]:
+    return {
+        index.name: index
+        for indexed_attribute in IndexedAttribute.objects.all()
+        for index in indexed_attribute.get_indexes()
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Create and drop the indexes of the record data attributes, which are "
+        "declared as indexed attributes of object types"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only check if the indexes are in sync, without changing them",
+        )
+
+    def handle(self, *args, **options):
+        existing = get_existing_indexes()
+        declared = get_declared_indexes()
+
+        to_drop = [
+            name
+            for name, is_valid in existing.items()
+            if name not in declared or not is_valid
+        ]
+        to_create = [
+            index
+            for name, index in declared.items()
+            if name not in existing or not existing[name]
+        ]
+
+        if options["check"]:
+            if to_drop or to_create:
+                logger.warning(
+                    "attribute_indexes_out_of_sync",
+                    missing_indexes=[index.name for index in to_create],
+                    obsolete_indexes=to_drop,
+                )
+                raise CommandError(
+                    f"{len(to_create)} attribute index(es) are missing and "
+                    f"{len(to_drop)} are obsolete, run this command without "
+                    "`--check` to fix them"
+                )
+
+            self.stdout.write(self.style.SUCCESS("OK"))
+            return
+
+        # concurrent index operations can't be run in a transaction, but don't
+        # block writes to the records
+        with connection.schema_editor(atomic=False) as schema_editor:
+            for name in to_drop:
+                schema_editor.execute(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {schema_editor.quote_name(name)}"
+                )
+                logger.info("attribute_index_dropped", index_name=name)
+
+            for index in to_create:
+                schema_editor.add_index(ObjectRecord, index, concurrently=True)
+                logger.info("attribute_index_created", index_name=index.name)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully created {len(to_create)} and dropped {len(to_drop)} "
+                "attribute index(es)"
+            )
+        )
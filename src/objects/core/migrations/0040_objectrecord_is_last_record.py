@@ -0,0 +1,172 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:12
+
+import os
+
+from django.db import migrations, models, transaction
+
+# The migration isn't atomic, so the table is not locked during the backfill and the
+# index builds. Each step can be run again, in case the migration is interrupted.
+
+ADD_FIELD_SQL = """
+    ALTER TABLE core_objectrecord
+    ADD COLUMN IF NOT EXISTS is_last_record boolean DEFAULT false NOT NULL;
+    ALTER TABLE core_objectrecord ALTER COLUMN is_last_record DROP DEFAULT;
+"""
+
+REMOVE_FIELD_SQL = """
+    ALTER TABLE core_objectrecord DROP COLUMN IF EXISTS is_last_record;
+"""
+
+# number of objects of which the last record is flagged in one transaction
+BATCH_SIZE = int(os.getenv("OBJECTRECORD_MIGRATION_0040_BATCH_SIZE", 10_000))
+
+BACKFILL_SQL = """
+    UPDATE core_objectrecord r
+    SET is_last_record = TRUE
+    FROM (
+        SELECT object_id, MAX(index) AS max_index
+        FROM core_objectrecord
+        WHERE object_id >= %(start)s AND object_id < %(end)s
+        GROUP BY object_id
+    ) m
+    WHERE r.object_id = m.object_id
+        AND r.index = m.max_index
+        AND NOT r.is_last_record;
+"""
+
+UNIQUE_INDEX_NAME = "unique_last_record_per_object"
+
+# a conditional unique constraint is a partial unique index in Postgres
+ADD_UNIQUE_INDEX_SQL = f"""
+    CREATE UNIQUE INDEX CONCURRENTLY {UNIQUE_INDEX_NAME}
+    ON core_objectrecord (object_id)
+    WHERE is_last_record;
+"""
+
+REMOVE_UNIQUE_INDEX_SQL = f"DROP INDEX CONCURRENTLY IF EXISTS {UNIQUE_INDEX_NAME};"
+
+INDEX_NAME = "idx_objectrecord_last_record"
+
+ADD_INDEX_SQL = f"""
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME}
+    ON core_objectrecord ("_object_type_id", "start_at")
+    WHERE is_last_record;
+"""
+
+REMOVE_INDEX_SQL = f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME};"
+
+
+def backfill_last_records(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT MIN(id), MAX(id) FROM core_object")
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            return
+
+    # each batch is committed on its own, so the updated rows are only locked briefly
+    for start in range(min_id, max_id + 1, BATCH_SIZE):
+        with transaction.atomic(), schema_editor.connection.cursor() as cursor:
+            cursor.execute(BACKFILL_SQL, {"start": start, "end": start + BATCH_SIZE})
+
+
+def _add_index_concurrently(schema_editor, name: str, add_sql: str, remove_sql: str):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = %s
+            """,
+            [name],
+        )
+        row = cursor.fetchone()
+        if row and row[0]:
+            return
+
+        # an interrupted concurrent build leaves an invalid index behind
+        if row:
+            cursor.execute(remove_sql)
+        cursor.execute(add_sql)
+
+
+def add_unique_index(apps, schema_editor):
+    _add_index_concurrently(
+        schema_editor, UNIQUE_INDEX_NAME, ADD_UNIQUE_INDEX_SQL, REMOVE_UNIQUE_INDEX_SQL
+    )
+
+
+def remove_unique_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(REMOVE_UNIQUE_INDEX_SQL)
+
+
+def add_index(apps, schema_editor):
+    _add_index_concurrently(schema_editor, INDEX_NAME, ADD_INDEX_SQL, REMOVE_INDEX_SQL)
+
+
+def remove_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(REMOVE_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+    dependencies = [
+        ("core", "0039_alter_objecttype_unique_together_and_more"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name="objectrecord",
+                    name="is_last_record",
+                    field=models.BooleanField(
+                        default=False,
+                        editable=False,
+                        help_text="Designates whether this record has the highest index of its object. Maintained on save to avoid looking up the last record per object.",
+                        verbose_name="is last record",
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(ADD_FIELD_SQL, REMOVE_FIELD_SQL),
+            ],
+        ),
+        migrations.RunPython(
+            backfill_last_records, migrations.RunPython.noop, atomic=False
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="objectrecord",
+                    constraint=models.UniqueConstraint(
+                        condition=models.Q(("is_last_record", True)),
+                        fields=("object",),
+                        name=UNIQUE_INDEX_NAME,
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(
+                    add_unique_index, remove_unique_index, atomic=False
+                ),
+            ],
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="objectrecord",
+                    index=models.Index(
+                        condition=models.Q(("is_last_record", True)),
+                        fields=["_object_type_id", "start_at"],
+                        name=INDEX_NAME,
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(add_index, remove_index, atomic=False),
+            ],
+        ),
+    ]
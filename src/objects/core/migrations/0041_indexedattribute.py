@@ -0,0 +1,62 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:20
+
+import django.db.models.deletion
+import objects.core.utils
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0040_objectrecord_is_last_record"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name="IndexedAttribute",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "path",
+                    models.CharField(
+                        help_text="Path of the attribute in the record data. Nested attributes are separated by double underscores, for example `nested__timestamp`. The index is used for the `gt`, `gte`, `lt`, `lte` and `in` operators of the `data_attr` filter and for ordering",
+                        max_length=255,
+                        validators=[objects.core.utils.validate_data_attribute_path],
+                        verbose_name="path",
+                    ),
+                ),
+                (
+                    "text_search",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Designates whether a trigram index is added as well, which is used for the `icontains` operator of the `data_attr` filter",
+                        verbose_name="text search",
+                    ),
+                ),
+                (
+                    "object_type",
+                    models.ForeignKey(
+                        help_text="Object type whose records are indexed",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="indexed_attributes",
+                        to="core.objecttype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "indexed attribute",
+                "verbose_name_plural": "indexed attributes",
+                "unique_together": {("object_type", "path")},
+            },
+        ),
+    ]
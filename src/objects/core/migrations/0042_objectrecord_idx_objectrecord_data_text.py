@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+import objects.core.query
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+# returns all string values of the data separated by newlines. It's immutable, so it
+# can be indexed.
+CREATE_DATA_TEXT_SQL = r"""
+    CREATE OR REPLACE FUNCTION objects_data_text(data jsonb) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$
+        SELECT coalesce(string_agg(value #>> '{}', E'\n'), '')
+        FROM jsonb_path_query(data, 'strict $.** ? (@.type() == "string")') AS value
+    $$;
+"""
+
+DROP_DATA_TEXT_SQL = "DROP FUNCTION IF EXISTS objects_data_text(jsonb);"
+
+
+class Migration(migrations.Migration):
+    atomic = False
+    dependencies = [
+        ("core", "0041_indexedattribute"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_DATA_TEXT_SQL, DROP_DATA_TEXT_SQL),
+        AddIndexConcurrently(
+            model_name="objectrecord",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        objects.core.query.DataText("data")
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="idx_objectrecord_data_text",
+            ),
+        ),
+    ]
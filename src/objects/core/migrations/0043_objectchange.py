@@ -0,0 +1,133 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# the changes are written per statement, so bulk creates and cascading deletes
+# insert all their changes with one query
+CREATE_TRIGGERS_SQL = """
+    CREATE OR REPLACE FUNCTION objects_record_inserted() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        INSERT INTO core_objectchange (
+            transaction_id, uuid, object_type_id, action, record_index, changed_on
+        )
+        SELECT
+            pg_current_xact_id()::text::bigint, o.uuid, r._object_type_id,
+            CASE WHEN r.index = 1 THEN 'created' ELSE 'updated' END, r.index, now()
+        FROM new_records r JOIN core_object o ON o.id = r.object_id
+        ORDER BY r.id;
+        RETURN NULL;
+    END
+    $$;
+
+    CREATE OR REPLACE FUNCTION objects_object_deleted() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    BEGIN
+        INSERT INTO core_objectchange (
+            transaction_id, uuid, object_type_id, action, record_index, changed_on
+        )
+        SELECT
+            pg_current_xact_id()::text::bigint, o.uuid, o.object_type_id, 'deleted',
+            NULL, now()
+        FROM old_objects o
+        ORDER BY o.id;
+        RETURN NULL;
+    END
+    $$;
+
+    CREATE TRIGGER objects_record_inserted
+    AFTER INSERT ON core_objectrecord
+    REFERENCING NEW TABLE AS new_records
+    FOR EACH STATEMENT EXECUTE FUNCTION objects_record_inserted();
+
+    CREATE TRIGGER objects_object_deleted
+    AFTER DELETE ON core_object
+    REFERENCING OLD TABLE AS old_objects
+    FOR EACH STATEMENT EXECUTE FUNCTION objects_object_deleted();
+"""
+
+DROP_TRIGGERS_SQL = """
+    DROP TRIGGER IF EXISTS objects_record_inserted ON core_objectrecord;
+    DROP TRIGGER IF EXISTS objects_object_deleted ON core_object;
+    DROP FUNCTION IF EXISTS objects_record_inserted();
+    DROP FUNCTION IF EXISTS objects_object_deleted();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0042_objectrecord_idx_objectrecord_data_text"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ObjectChange",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "transaction_id",
+                    models.BigIntegerField(
+                        editable=False,
+                        help_text="Id of the database transaction which made the change",
+                        verbose_name="transaction id",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        help_text="Unique identifier (UUID4) of the OBJECT"
+                    ),
+                ),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("updated", "Updated"),
+                            ("deleted", "Deleted"),
+                        ],
+                        max_length=10,
+                        verbose_name="action",
+                    ),
+                ),
+                (
+                    "record_index",
+                    models.PositiveIntegerField(
+                        help_text="Index of the created record, empty for deleted objects",
+                        null=True,
+                        verbose_name="record index",
+                    ),
+                ),
+                (
+                    "changed_on",
+                    models.DateTimeField(
+                        help_text="Date and time of the change",
+                        verbose_name="changed on",
+                    ),
+                ),
+                (
+                    "object_type",
+                    models.ForeignKey(
+                        help_text="OBJECTTYPE",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core.objecttype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "object change",
+                "verbose_name_plural": "object changes",
+                "indexes": [
+                    models.Index(
+                        fields=["transaction_id", "id"],
+                        name="idx_objectchange_order",
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS_SQL, DROP_TRIGGERS_SQL),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0043_objectchange"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "resource_url",
+                    models.URLField(
+                        help_text="URL of the resource of the notification, the notifications of a resource are sent in order",
+                        max_length=1000,
+                        verbose_name="resource url",
+                    ),
+                ),
+                (
+                    "message",
+                    models.JSONField(
+                        help_text="Message of the notification", verbose_name="message"
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0,
+                        help_text="Number of failed attempts to send the notification",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "available_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Date and time from which the notification is (re)sent",
+                        verbose_name="available at",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, help_text="Creation date"),
+                ),
+            ],
+            options={
+                "verbose_name": "outbox notification",
+                "verbose_name_plural": "outbox notifications",
+            },
+        ),
+    ]
@@ -1,24 +1,42 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import uuid
 from typing import ClassVar
 
 from django.contrib.gis.db.models import GeometryField
-from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, transaction
+from django.db.models.fields.json import KT, KeyTransform
+from django.db.models.functions import Cast, Upper
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from .constants import (
+    INDEXED_ATTRIBUTE_PREFIX,
+    ChangeActions,
     DataClassificationChoices,
     ObjectTypeVersionStatus,
     ReferenceType,
     UpdateFrequencyChoices,
 )
-from .query import ObjectQuerySet, ObjectRecordQuerySet, ObjectTypeQuerySet
-from .utils import check_json_schema, check_objecttype
+from .query import (
+    DataText,
+    ObjectChangeQuerySet,
+    ObjectQuerySet,
+    ObjectRecordQuerySet,
+    ObjectTypeQuerySet,
+    OutboxNotificationQuerySet,
+)
+from .utils import (
+    check_json_schema,
+    check_objecttype,
+    clear_objecttype_validators,
+    validate_data_attribute_path,
+)
 
 
 class ObjectType(models.Model):
@@ -218,6 +236,18 @@ class ObjectTypeVersion(models.Model):
 
         super().save(*args, **kwargs)
 
+        self.clear_validator()
+        transaction.on_commit(self.clear_validator)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+
+        self.clear_validator()
+        return result
+
+    def clear_validator(self):
+        clear_objecttype_validators(self.object_type.uuid, self.version)
+
     def generate_version_number(self) -> int:
         # XXX: this is racing other queries!
         existed_versions = ObjectTypeVersion.objects.filter(
@@ -326,6 +356,15 @@ class ObjectRecord(models.Model):
     modified_on = models.DateTimeField(
         auto_now=True, help_text=_("Last modification date")
     )
+    is_last_record = models.BooleanField(
+        _("is last record"),
+        default=False,
+        editable=False,
+        help_text=_(
+            "Designates whether this record has the highest index of its object. "
+            "Maintained on save to avoid looking up the last record per object."
+        ),
+    )
 
     # Denormalized field to avoid unnecessary joins on `Object`
     _object_type = models.ForeignKey(
@@ -344,6 +383,10 @@ class ObjectRecord(models.Model):
         unique_together = ("object", "index")
         indexes = [
             GinIndex(fields=["data"], name="idx_objectrecord_data_gin"),
+            GinIndex(
+                OpClass(Upper(DataText("data")), name="gin_trgm_ops"),
+                name="idx_objectrecord_data_text",
+            ),
             models.Index(
                 fields=["_object_type_id", "-index"],
                 name="idx_objectrecord_type_index",
@@ -356,6 +399,18 @@ class ObjectRecord(models.Model):
                 fields=["_object_type_id", "start_at", "end_at", "object", "-index"],
                 name="idx_type_start_end_object_idx",
             ),
+            models.Index(
+                fields=["_object_type_id", "start_at"],
+                condition=models.Q(is_last_record=True),
+                name="idx_objectrecord_last_record",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["object"],
+                condition=models.Q(is_last_record=True),
+                name="unique_last_record_per_object",
+            )
         ]
 
     def __str__(self):
@@ -368,17 +423,47 @@ class ObjectRecord(models.Model):
             check_objecttype(self.object.object_type, self.version, self.data)
 
     def save(self, *args, **kwargs):
-        if not self.id and self.object.last_record:
-            self.index = self.object.last_record.index + 1
+        if self.id:
+            self._set_object_type(self.object.object_type_id)
+            super().save(*args, **kwargs)
+            return
+
+        # errors roll back the enclosing transaction, so no savepoint is needed
+        with transaction.atomic(savepoint=False):
+            # lock the object, so records of the same object are created one after
+            # the other, with consecutive indexes
+            object_type_id = (
+                Object.objects.select_for_update()
+                .values_list("object_type_id", flat=True)
+                .get(pk=self.object_id)
+            )
+            self._set_object_type(object_type_id)
+            previous_record = (
+                ObjectRecord.objects.filter(object_id=self.object_id)
+                .order_by("-index")
+                .values_list("pk", "index")
+                .first()
+            )
+            if previous_record:
+                previous_pk, previous_index = previous_record
+                self.index = previous_index + 1
 
-            #  add end_at to previous record
-            previous_record = self.object.last_record
-            previous_record.end_at = self.start_at
-            previous_record.save()
+                #  add end_at to previous record
+                ObjectRecord.objects.filter(pk=previous_pk).update(
+                    end_at=self.start_at,
+                    is_last_record=False,
+                    modified_on=timezone.now(),
+                )
 
-        self._object_type = self.object.object_type
+            self.is_last_record = True
+            super().save(*args, **kwargs)
 
-        super().save(*args, **kwargs)
+    def _set_object_type(self, object_type_id: int) -> None:
+        # reuse the object type of the object, if it's loaded already
+        if Object.object_type.is_cached(self.object):
+            self._object_type = self.object.object_type
+        else:
+            self._object_type_id = object_type_id
 
 
 class Reference(models.Model):
@@ -398,3 +483,170 @@ class Reference(models.Model):
 
     def __str__(self):
         return f"{self.type}: {self.url}"
+
+
+class ObjectChange(models.Model):
+    """
+    Change of an object, for the incremental synchronization of objects.
+
+    The changes are not written by Django but by database triggers on the insert of
+    records and the delete of objects (see migration 0043), so bulk creates and
+    cascading deletes are included. Changes of deleted objects are kept as
+    tombstones.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    transaction_id = models.BigIntegerField(
+        _("transaction id"),
+        editable=False,
+        help_text=_("Id of the database transaction which made the change"),
+    )
+    uuid = models.UUIDField(help_text=_("Unique identifier (UUID4) of the OBJECT"))
+    object_type = models.ForeignKey(
+        ObjectType,
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text=_("OBJECTTYPE"),
+    )
+    action = models.CharField(_("action"), max_length=10, choices=ChangeActions.choices)
+    record_index = models.PositiveIntegerField(
+        _("record index"),
+        null=True,
+        help_text=_("Index of the created record, empty for deleted objects"),
+    )
+    changed_on = models.DateTimeField(
+        _("changed on"), help_text=_("Date and time of the change")
+    )
+
+    objects = ObjectChangeQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("object change")
+        verbose_name_plural = _("object changes")
+        indexes = [
+            models.Index(
+                fields=["transaction_id", "id"], name="idx_objectchange_order"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.uuid} {self.action}"
+
+
+class OutboxNotification(models.Model):
+    """
+    Notification for the Notifications API, which is written in the transaction of the
+    change it notifies about.
+
+    The notifications are sent in batches by the
+    ``objects.api.tasks.send_outbox_notifications`` task once the transaction is
+    committed, so sending them doesn't slow down the API requests.
+    """
+
+    resource_url = models.URLField(
+        _("resource url"),
+        max_length=1000,
+        help_text=_(
+            "URL of the resource of the notification, the notifications of a "
+            "resource are sent in order"
+        ),
+    )
+    message = models.JSONField(_("message"), help_text=_("Message of the notification"))
+    attempts = models.PositiveSmallIntegerField(
+        _("attempts"),
+        default=0,
+        help_text=_("Number of failed attempts to send the notification"),
+    )
+    available_at = models.DateTimeField(
+        _("available at"),
+        default=timezone.now,
+        help_text=_("Date and time from which the notification is (re)sent"),
+    )
+    created_on = models.DateTimeField(auto_now_add=True, help_text=_("Creation date"))
+
+    objects = OutboxNotificationQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("outbox notification")
+        verbose_name_plural = _("outbox notifications")
+
+    def __str__(self):
+        return f"{self.message.get('actie')} {self.resource_url}"
+
+
+class IndexedAttribute(models.Model):
+    """
+    Attribute of the record data, which is indexed for the records of an object type.
+
+    The indexes are not part of the migrations, since they depend on the object
+    types. They are created and dropped with the ``sync_attribute_indexes``
+    management command.
+    """
+
+    object_type = models.ForeignKey(
+        ObjectType,
+        on_delete=models.CASCADE,
+        related_name="indexed_attributes",
+        help_text=_("Object type whose records are indexed"),
+    )
+    path = models.CharField(
+        _("path"),
+        max_length=255,
+        validators=[validate_data_attribute_path],
+        help_text=_(
+            "Path of the attribute in the record data. Nested attributes are "
+            "separated by double underscores, for example `nested__timestamp`. "
+            "The index is used for the `gt`, `gte`, `lt`, `lte` and `in` operators "
+            "of the `data_attr` filter and for ordering"
+        ),
+    )
+    text_search = models.BooleanField(
+        _("text search"),
+        default=False,
+        help_text=_(
+            "Designates whether a trigram index is added as well, which is used for "
+            "the `icontains` operator of the `data_attr` filter"
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("indexed attribute")
+        verbose_name_plural = _("indexed attributes")
+        unique_together = ("object_type", "path")
+
+    def __str__(self):
+        return f"{self.object_type}: {self.path}"
+
+    @property
+    def index_name(self) -> str:
+        # the name changes with the path, so changed attributes are reindexed
+        digest = hashlib.sha256(self.path.encode()).hexdigest()[:10]
+        return f"{INDEXED_ATTRIBUTE_PREFIX}{self.object_type_id}_{digest}"
+
+    def get_indexes(self) -> list[models.Index]:
+        # the same expressions as the `data__<path>` lookups of the ORM
+        *parents, key = self.path.split("__")
+        key_transform = "data"
+        for parent in parents:
+            key_transform = KeyTransform(parent, key_transform)
+        condition = models.Q(_object_type=self.object_type_id)
+
+        indexes = [
+            models.Index(
+                KeyTransform(key, key_transform),
+                condition=condition,
+                name=self.index_name,
+            )
+        ]
+        if self.text_search:
+            indexes.append(
+                GinIndex(
+                    OpClass(
+                        Upper(Cast(KT(f"data__{self.path}"), models.TextField())),
+                        name="gin_trgm_ops",
+                    ),
+                    condition=condition,
+                    name=f"{self.index_name}_trgm",
+                )
+            )
+        return indexes
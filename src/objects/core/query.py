@@ -1,7 +1,43 @@
+import math
+
+from django.conf import settings
+from django.contrib.gis.geos import GEOSGeometry, Polygon
+from django.contrib.gis.measure import D
 from django.db import models
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import RowNumber
+from django.utils import timezone
 
 from vng_api_common.utils import get_uuid_from_path
 
+from .constants import MaxRecordStrategies
+
+
+class DataText(models.Func):
+    """
+    The string values of the record data separated by newlines, to search in all
+    values at once. The immutable database function is created in a migration, so
+    it can be indexed.
+    """
+
+    function = "objects_data_text"
+    output_field = models.TextField()
+
+
+# the shortest length of a degree of latitude
+METERS_PER_DEGREE = 110_574
+
+
+def get_distance_degrees(geometry: GEOSGeometry, distance: float) -> float:
+    """
+    Return an upper bound of `distance` in meters in degrees around the geographic
+    `geometry`. A degree of longitude gets shorter further from the equator.
+    """
+    degrees = distance / METERS_PER_DEGREE
+    min_y, max_y = geometry.extent[1], geometry.extent[3]
+    latitude = min(max(abs(min_y), abs(max_y)) + degrees, 89)
+    return degrees / math.cos(math.radians(latitude))
+
 
 class ObjectTypeQuerySet(models.QuerySet):
     def get_by_url(self, url):
@@ -47,16 +83,150 @@ class ObjectRecordQuerySet(models.QuerySet):
         allowed_object_types = token.permissions.values("object_type")
         return self.filter(_object_type__in=models.Subquery(allowed_object_types))
 
-    def keep_max_record_per_object(self):
+    def filter_data_icontains(self, value: str):
+        """
+        Return records with a string value in the data which contains `value`, case
+        insensitive. Uses the trigram index on the string values of the data
+        """
+        return self.alias(data_text=DataText("data")).filter(data_text__icontains=value)
+
+    def filter_for_geometry(
+        self,
+        *,
+        within: GEOSGeometry | None = None,
+        intersects: GEOSGeometry | None = None,
+        bbox: Polygon | None = None,
+        dwithin: dict | None = None,
+    ):
+        """
+        Return records with a geometry matching all the given spatial filters, which
+        use the GiST index on the geometry.
+
+        The distance of `dwithin` is in meters. Since the index only supports
+        distances in degrees for geographic coordinates, the records within an upper
+        bound of the distance in degrees are selected first.
+        """
+        queryset = self
+        if bbox is not None:
+            queryset = queryset.filter(geometry__bboverlaps=bbox)
+        if within is not None:
+            queryset = queryset.filter(geometry__within=within)
+        if intersects is not None:
+            queryset = queryset.filter(geometry__intersects=intersects)
+        if dwithin is not None:
+            geometry, distance = dwithin["geometry"], dwithin["distance"]
+            queryset = queryset.filter(
+                geometry__dwithin=(geometry, get_distance_degrees(geometry, distance)),
+                geometry__distance_lte=(geometry, D(m=distance)),
+            )
+        return queryset
+
+    def keep_max_record_per_object(self, strategy: MaxRecordStrategies | None = None):
         """
         Return records with the largest index for the object
+
+        The records are selected with the strategy configured in
+        ``OBJECTS_MAX_RECORD_STRATEGY``, unless `strategy` is given:
+
+        * ``subquery``: a correlated subquery per record, which is fast for objects
+          with few records
+        * ``distinct_on``: ``DISTINCT ON`` the object, ordered by descending index
+        * ``window``: the first ``ROW_NUMBER()`` per object, ordered by descending
+          index
+
+        The last two select the records in one pass, which doesn't degrade for
+        objects with long histories.
         """
-        filtered_records = (
-            self.filter(object=models.OuterRef("object"))
+        strategy = strategy or settings.OBJECTS_MAX_RECORD_STRATEGY
+
+        if strategy == MaxRecordStrategies.distinct_on:
+            max_records = (
+                self.order_by("object_id", "-index").distinct("object_id").values("pk")
+            )
+            return self.filter(pk__in=models.Subquery(max_records))
+
+        if strategy == MaxRecordStrategies.window:
+            max_records = (
+                self.annotate(
+                    _row_number=models.Window(
+                        RowNumber(),
+                        partition_by=models.F("object_id"),
+                        order_by=models.F("index").desc(),
+                    )
+                )
+                .filter(_row_number=1)
+                .values("pk")
+            )
+            return self.filter(pk__in=models.Subquery(max_records))
+
+        if strategy == MaxRecordStrategies.subquery:
+            filtered_records = (
+                self.filter(object=models.OuterRef("object"))
+                .order_by("-index")
+                .values("index")[:1]
+            )
+            return self.filter(index__in=models.Subquery(filtered_records))
+
+        raise ValueError(f"Unknown strategy to select the last records: {strategy!r}")
+
+    def keep_current_record_per_object(self, date):
+        """
+        Return records which are actual on `date` and have the largest index for the
+        object, equivalent to ``filter_for_date(date).keep_max_record_per_object()``
+
+        The last record of an object is flagged with `is_last_record`, so it can be
+        selected without a correlated subquery if it is actual on `date`. Only objects
+        with a last record that is not actual (e.g. it starts in the future) fall
+        back to `keep_max_record_per_object`.
+        """
+        is_actual = models.Q(start_at__lte=date) & (
+            models.Q(end_at__gte=date) | models.Q(end_at__isnull=True)
+        )
+        not_actual_last_records = self.filter(
+            models.Q(is_last_record=True) & ~is_actual
+        )
+        fallback_records = (
+            self.filter(object__in=not_actual_last_records.values("object"))
+            .filter_for_date(date)
+            .keep_max_record_per_object()
+        )
+        return self.filter_for_date(date).filter(
+            models.Q(is_last_record=True)
+            | models.Q(pk__in=models.Subquery(fallback_records.values("pk")))
+        )
+
+    def with_max_index(self):
+        max_index = (
+            self.model.objects.filter(object=models.OuterRef("object"))
             .order_by("-index")
             .values("index")[:1]
         )
-        return self.filter(index__in=models.Subquery(filtered_records))
+        return self.annotate(max_index=models.Subquery(max_index))
+
+    def inconsistent_last_records(self):
+        """
+        Return records for which the `is_last_record` flag doesn't match the largest
+        index of their object
+        """
+        return self.with_max_index().filter(
+            models.Q(is_last_record=True) & ~models.Q(index=models.F("max_index"))
+            | models.Q(is_last_record=False, index=models.F("max_index"))
+        )
+
+    def rebuild_last_records(self) -> int:
+        """
+        Reset the `is_last_record` flag for all inconsistent records and return the
+        number of updated records
+        """
+        inconsistent = self.inconsistent_last_records()
+        # unset stale flags first to respect the unique constraint per object
+        unset = self.model.objects.filter(
+            pk__in=inconsistent.filter(is_last_record=True).values("pk")
+        ).update(is_last_record=False)
+        set_ = self.model.objects.filter(
+            pk__in=inconsistent.filter(is_last_record=False).values("pk")
+        ).update(is_last_record=True)
+        return unset + set_
 
     def filter_for_date(self, date):
         """
@@ -78,3 +248,48 @@ class ObjectRecordQuerySet(models.QuerySet):
         perspective.
         """
         return self.filter(registration_at__lte=date)
+
+
+class ObjectChangeQuerySet(models.QuerySet):
+    def filter_for_token(self, token):
+        if not token:
+            return self.none()
+
+        if token.is_superuser:
+            return self.all()
+
+        allowed_object_types = token.permissions.values("object_type")
+        return self.filter(object_type__in=models.Subquery(allowed_object_types))
+
+    def filter_committed(self):
+        """
+        Return changes of finished transactions, ordered by transaction.
+
+        Transactions which are still in progress, and could commit later, have an id
+        of at least the oldest transaction in progress. So the changes after a
+        returned change never include changes which are committed afterwards.
+        """
+        oldest_transaction_id = RawSQL(
+            "pg_snapshot_xmin(pg_current_snapshot())::text::bigint", []
+        )
+        return self.filter(transaction_id__lt=oldest_transaction_id).order_by(
+            "transaction_id", "id"
+        )
+
+
+class OutboxNotificationQuerySet(models.QuerySet):
+    def filter_available(self):
+        """
+        Return the notifications which can be sent now, in the order they were
+        written.
+
+        The notifications of resources with a notification which is retried later are
+        excluded, so the notifications of a resource are always sent in order.
+        """
+        now = timezone.now()
+        delayed_resources = self.filter(available_at__gt=now).values("resource_url")
+        return (
+            self.filter(available_at__lte=now)
+            .exclude(resource_url__in=models.Subquery(delayed_resources))
+            .order_by("id")
+        )
@@ -0,0 +1,51 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from ..models import ObjectRecord, ObjectType
+
+
+class BenchmarkMaxRecordStrategiesCommandTests(TestCase):
+    def test_benchmark(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark_max_record_strategies",
+            objects=[3],
+            records=[1, 4],
+            rounds=1,
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertIn("distinct_on", lines[0])
+        self.assertEqual(lines[4].split()[:3], ["3", "4", "registrationDate"])
+        # the generated data is rolled back
+        self.assertFalse(ObjectType.objects.exists())
+        self.assertFalse(ObjectRecord.objects.exists())
+
+    def test_live_database(self):
+        with patch.dict(connection.settings_dict, {"NAME": "objects"}):
+            with self.assertRaises(CommandError):
+                call_command(
+                    "benchmark_max_record_strategies",
+                    objects=[3],
+                    records=[1],
+                    rounds=1,
+                    stdout=StringIO(),
+                )
+
+            call_command(
+                "benchmark_max_record_strategies",
+                objects=[3],
+                records=[1],
+                rounds=1,
+                yes_use_live_db=True,
+                stdout=StringIO(),
+            )
+
+        self.assertFalse(ObjectType.objects.exists())
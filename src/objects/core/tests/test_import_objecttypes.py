@@ -1,4 +1,7 @@
+import json
+import tempfile
 import uuid
+from pathlib import Path
 
 from django.core.management import CommandError, call_command
 from django.test import TestCase
@@ -49,6 +52,15 @@ class TestImportObjectTypesCommand(TestCase):
         ):
             self._call_command()
 
+    def test_api_version_is_requested_once(self):
+        self.m.get(f"{self.url}objecttypes", json={"next": None, "results": []})
+
+        self._call_command()
+
+        self.assertEqual(
+            [request.method for request in self.m.request_history], ["HEAD", "GET"]
+        )
+
     def test_command_fails_if_http_error(self):
         self.m.get(f"{self.url}objecttypes", status_code=404)
         with self.assertRaises(CommandError):
@@ -156,3 +168,79 @@ class TestImportObjectTypesCommand(TestCase):
                 },
             },
         )
+
+    def _mock_pages(self, *uuids: str):
+        """Mock the pages of objecttypes with two objecttypes each."""
+        for page, index in enumerate(range(0, len(uuids), 2), start=1):
+            data = mock_objecttypes(*uuids[index : index + 2])
+            if index + 2 < len(uuids):
+                data["next"] = f"{self.url}objecttypes?page={page + 1}"
+            url = f"{self.url}objecttypes" + (f"?page={page}" if page > 1 else "")
+            self.m.get(url, json=data)
+
+        for objecttype_uuid in uuids:
+            self.m.get(
+                f"{self.url}objecttypes/{objecttype_uuid}/versions",
+                json=mock_objecttype_versions(objecttype_uuid),
+            )
+
+    def _get_checkpoint(self) -> Path:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return Path(directory.name) / "checkpoint.json"
+
+    def test_objecttypes_are_imported_per_page(self):
+        uuids = [str(uuid.uuid4()) for _ in range(4)]
+        self._mock_pages(*uuids)
+
+        call_command("import_objecttypes", self.service.slug, workers=2)
+
+        self.assertEqual(
+            set(ObjectType.objects.values_list("uuid", flat=True)),
+            {uuid.UUID(objecttype_uuid) for objecttype_uuid in uuids},
+        )
+        self.assertEqual(ObjectTypeVersion.objects.count(), 8)
+
+    def test_checkpoint_is_written_after_each_page(self):
+        uuids = [str(uuid.uuid4()) for _ in range(4)]
+        self._mock_pages(*uuids)
+        self.m.get(f"{self.url}objecttypes/{uuids[3]}/versions", status_code=500)
+        checkpoint = self._get_checkpoint()
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_objecttypes", self.service.slug, checkpoint=str(checkpoint)
+            )
+
+        # the first page is committed
+        self.assertEqual(ObjectType.objects.count(), 2)
+        self.assertEqual(
+            json.loads(checkpoint.read_text()),
+            {"service": self.service.slug, "next": f"{self.url}objecttypes?page=2"},
+        )
+
+        self.m.get(
+            f"{self.url}objecttypes/{uuids[3]}/versions",
+            json=mock_objecttype_versions(uuids[3]),
+        )
+        # the first page is not requested again
+        self.m.get(f"{self.url}objecttypes", status_code=500)
+
+        call_command(
+            "import_objecttypes", self.service.slug, checkpoint=str(checkpoint)
+        )
+
+        self.assertEqual(ObjectType.objects.count(), 4)
+        self.assertEqual(ObjectTypeVersion.objects.count(), 8)
+        self.assertFalse(checkpoint.exists())
+
+    def test_checkpoint_of_other_service(self):
+        checkpoint = self._get_checkpoint()
+        checkpoint.write_text(
+            json.dumps({"service": "other", "next": f"{self.url}objecttypes?page=2"})
+        )
+
+        with self.assertRaisesMessage(CommandError, "service 'other'"):
+            call_command(
+                "import_objecttypes", self.service.slug, checkpoint=str(checkpoint)
+            )
@@ -1,7 +1,13 @@
-from django.test import TestCase
+from datetime import date
 
+from django.contrib.gis.geos import Point, Polygon
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from ..constants import MaxRecordStrategies
 from ..models import ObjectRecord
-from .factories import ObjectFactory, ObjectTypeFactory
+from .factories import ObjectFactory, ObjectRecordFactory, ObjectTypeFactory
 
 
 class ObjectRecordTestCase(TestCase):
@@ -14,3 +20,147 @@ class ObjectRecordTestCase(TestCase):
         )
 
         self.assertEqual(record._object_type, object_type1)
+
+    def test_last_record_is_flagged_on_save(self):
+        object = ObjectFactory.create()
+
+        record1 = ObjectRecord.objects.create(
+            object=object, version=1, start_at="2025-01-01"
+        )
+        self.assertTrue(record1.is_last_record)
+
+        record2 = ObjectRecord.objects.create(
+            object=object, version=1, start_at="2025-02-01"
+        )
+        record1.refresh_from_db()
+
+        self.assertFalse(record1.is_last_record)
+        self.assertTrue(record2.is_last_record)
+        self.assertEqual(
+            list(ObjectRecord.objects.filter(is_last_record=True)), [record2]
+        )
+
+    def test_previous_record_is_closed_on_save(self):
+        object = ObjectFactory.create()
+        record1 = ObjectRecord.objects.create(
+            object=object, version=1, start_at="2025-01-01"
+        )
+
+        # lock the object, select the previous record, close it and insert
+        with self.assertNumQueries(4):
+            record2 = ObjectRecord.objects.create(
+                object=object, version=1, start_at="2025-02-01"
+            )
+
+        record1.refresh_from_db()
+        self.assertEqual(record1.end_at, date(2025, 2, 1))
+        self.assertGreater(record1.modified_on, record1.created_on)
+        self.assertEqual(record2.index, 2)
+        self.assertIsNone(record2.end_at)
+        self.assertEqual(record2._object_type, object.object_type)
+
+    def test_object_is_locked_on_save(self):
+        object = ObjectFactory.create()
+
+        with CaptureQueriesContext(connection) as context:
+            ObjectRecord.objects.create(object=object, version=1, start_at="2025-01-01")
+
+        self.assertIn("FOR UPDATE", context.captured_queries[0]["sql"])
+        self.assertIn('"core_object"', context.captured_queries[0]["sql"])
+
+
+class ObjectRecordQuerySetTestCase(TestCase):
+    def test_filter_data_icontains(self):
+        record = ObjectRecordFactory.create(
+            data={"name": "Something", "nested": {"tags": ["Important", 1]}}
+        )
+        ObjectRecordFactory.create(data={"important": "something else", "count": 1})
+
+        for value in ["import", "IMPORTANT"]:
+            with self.subTest(value=value):
+                self.assertQuerySetEqual(
+                    ObjectRecord.objects.filter_data_icontains(value), [record]
+                )
+
+    def test_filter_data_icontains_uses_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        plan = ObjectRecord.objects.filter_data_icontains("something").explain()
+
+        self.assertIn("idx_objectrecord_data_text", plan)
+
+    def test_filter_for_geometry_uses_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        bbox = Polygon.from_bbox((4.89, 52.36, 4.91, 52.38))
+        bbox.srid = 4326
+        dwithin = {"geometry": Point(4.9, 52.37, srid=4326), "distance": 100}
+
+        for filters in [{"bbox": bbox}, {"within": bbox}, {"dwithin": dwithin}]:
+            with self.subTest(filters=list(filters)):
+                plan = ObjectRecord.objects.filter_for_geometry(**filters).explain()
+
+                self.assertRegex(plan, r"Index Scan on core_objectrecord_geometry_\w+")
+
+    def test_filter_for_geometry_dwithin_meters(self):
+        # about 100 and 70 meters from the point, at the latitude of Amsterdam
+        north = ObjectRecordFactory.create(geometry=Point(4.9, 52.3709))
+        east = ObjectRecordFactory.create(geometry=Point(4.901, 52.37))
+        point = Point(4.9, 52.37, srid=4326)
+
+        for distance, expected in [(50, []), (80, [east]), (110, [east, north])]:
+            with self.subTest(distance=distance):
+                self.assertQuerySetEqual(
+                    ObjectRecord.objects.filter_for_geometry(
+                        dwithin={"geometry": point, "distance": distance}
+                    ),
+                    expected,
+                    ordered=False,
+                )
+
+    def test_keep_max_record_per_object_strategies(self):
+        object1 = ObjectFactory.create()
+        ObjectRecordFactory.create(object=object1, start_at="2025-01-01")
+        ObjectRecordFactory.create(object=object1, start_at="2025-02-01")
+        last_record1 = ObjectRecordFactory.create(object=object1, start_at="2025-03-01")
+        object2 = ObjectFactory.create()
+        first_record2 = ObjectRecordFactory.create(
+            object=object2, start_at="2025-01-01"
+        )
+        # records of the queryset are filtered before the last record is selected
+        past_record = ObjectRecordFactory.create(object=object2, start_at="2025-01-15")
+        ObjectRecordFactory.create(object=object2, start_at="2025-04-01")
+
+        for strategy in MaxRecordStrategies.values:
+            with self.subTest(strategy=strategy):
+                self.assertQuerySetEqual(
+                    ObjectRecord.objects.keep_max_record_per_object(strategy),
+                    [last_record1, ObjectRecord.objects.get(object=object2, index=3)],
+                    ordered=False,
+                )
+                self.assertQuerySetEqual(
+                    ObjectRecord.objects.filter_for_date(
+                        date(2025, 3, 15)
+                    ).keep_max_record_per_object(strategy),
+                    [last_record1, past_record],
+                    ordered=False,
+                )
+                self.assertQuerySetEqual(
+                    ObjectRecord.objects.filter(
+                        start_at__lt="2025-01-15"
+                    ).keep_max_record_per_object(strategy),
+                    [ObjectRecord.objects.get(object=object1, index=1), first_record2],
+                    ordered=False,
+                )
+
+    @override_settings(OBJECTS_MAX_RECORD_STRATEGY=MaxRecordStrategies.window)
+    def test_keep_max_record_per_object_configured_strategy(self):
+        sql = str(ObjectRecord.objects.keep_max_record_per_object().query)
+
+        self.assertIn("ROW_NUMBER()", sql)
+
+    def test_keep_max_record_per_object_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            ObjectRecord.objects.keep_max_record_per_object("unknown")
@@ -0,0 +1,44 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from ..models import ObjectRecord
+from .factories import ObjectFactory, ObjectRecordFactory
+
+
+class RebuildLastRecordsCommandTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        object = ObjectFactory.create()
+        cls.record1 = ObjectRecordFactory.create(object=object, start_at="2025-01-01")
+        cls.record2 = ObjectRecordFactory.create(object=object, start_at="2025-02-01")
+
+    def test_check_consistent(self):
+        out = StringIO()
+
+        call_command("rebuild_last_records", check=True, stdout=out)
+
+        self.assertIn("OK", out.getvalue())
+
+    def test_check_inconsistent(self):
+        ObjectRecord.objects.filter(pk=self.record2.pk).update(is_last_record=False)
+
+        with self.assertRaisesMessage(
+            CommandError, "1 object record(s) have an inconsistent last record flag"
+        ):
+            call_command("rebuild_last_records", check=True, stdout=StringIO())
+
+    def test_rebuild(self):
+        ObjectRecord.objects.filter(pk=self.record2.pk).update(is_last_record=False)
+        ObjectRecord.objects.filter(pk=self.record1.pk).update(is_last_record=True)
+
+        call_command("rebuild_last_records", stdout=StringIO())
+
+        self.record1.refresh_from_db()
+        self.record2.refresh_from_db()
+        self.assertFalse(self.record1.is_last_record)
+        self.assertTrue(self.record2.is_last_record)
+        self.assertFalse(ObjectRecord.objects.inconsistent_last_records().exists())
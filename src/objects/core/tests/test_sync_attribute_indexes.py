@@ -0,0 +1,99 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TransactionTestCase
+
+from ..management.commands.sync_attribute_indexes import get_existing_indexes
+from ..models import IndexedAttribute, ObjectRecord
+from .factories import ObjectRecordFactory, ObjectTypeFactory
+
+
+class SyncAttributeIndexesCommandTests(TransactionTestCase):
+    # indexes are created concurrently, which isn't possible in a transaction
+
+    def setUp(self):
+        super().setUp()
+
+        self.object_type = ObjectTypeFactory.create()
+        ObjectRecordFactory.create_batch(
+            3,
+            object__object_type=self.object_type,
+            data={"status": "open", "nested": {"timestamp": "2025-01-01"}},
+        )
+        self.addCleanup(self.drop_indexes)
+
+    def drop_indexes(self):
+        IndexedAttribute.objects.all().delete()
+        call_command("sync_attribute_indexes", stdout=StringIO())
+
+    def get_query_plan(self, queryset) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute("SET enable_seqscan = off")
+        try:
+            return queryset.explain()
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute("RESET enable_seqscan")
+
+    def test_create_indexes(self):
+        status = IndexedAttribute.objects.create(
+            object_type=self.object_type, path="status", text_search=True
+        )
+        timestamp = IndexedAttribute.objects.create(
+            object_type=self.object_type, path="nested__timestamp"
+        )
+
+        call_command("sync_attribute_indexes", stdout=StringIO())
+
+        self.assertEqual(
+            get_existing_indexes(),
+            {
+                status.index_name: True,
+                f"{status.index_name}_trgm": True,
+                timestamp.index_name: True,
+            },
+        )
+
+        records = ObjectRecord.objects.filter(_object_type=self.object_type)
+        for queryset, index_name in [
+            (records.filter(data__status__in=["open"]), status.index_name),
+            (
+                records.filter(data__status__icontains="ope"),
+                f"{status.index_name}_trgm",
+            ),
+            (
+                records.filter(data__nested__timestamp__gte="2025-01-01"),
+                timestamp.index_name,
+            ),
+            (records.order_by("data__nested__timestamp"), timestamp.index_name),
+        ]:
+            with self.subTest(query=str(queryset.query)):
+                self.assertIn(index_name, self.get_query_plan(queryset))
+
+    def test_drop_obsolete_indexes(self):
+        indexed_attribute = IndexedAttribute.objects.create(
+            object_type=self.object_type, path="status"
+        )
+        call_command("sync_attribute_indexes", stdout=StringIO())
+
+        indexed_attribute.path = "nested__timestamp"
+        indexed_attribute.save()
+        call_command("sync_attribute_indexes", stdout=StringIO())
+
+        self.assertEqual(get_existing_indexes(), {indexed_attribute.index_name: True})
+
+    def test_check(self):
+        IndexedAttribute.objects.create(object_type=self.object_type, path="status")
+
+        with self.assertRaisesMessage(
+            CommandError, "1 attribute index(es) are missing and 0 are obsolete"
+        ):
+            call_command("sync_attribute_indexes", check=True, stdout=StringIO())
+
+        call_command("sync_attribute_indexes", stdout=StringIO())
+        out = StringIO()
+
+        call_command("sync_attribute_indexes", check=True, stdout=out)
+
+        self.assertIn("OK", out.getvalue())
@@ -0,0 +1,76 @@
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from ..utils import (
+    check_objecttype,
+    clear_objecttype_validators,
+    validate_data_attribute_path,
+)
+from .factories import ObjectTypeVersionFactory
+
+
+class CheckObjectTypeTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_objecttype_validators()
+        self.addCleanup(clear_objecttype_validators)
+
+        self.version = ObjectTypeVersionFactory.create()
+        self.object_type = self.version.object_type
+
+    def test_validator_is_cached(self):
+        check_objecttype(self.object_type, self.version.version, {"diameter": 10})
+
+        with self.assertNumQueries(0):
+            check_objecttype(self.object_type, self.version.version, {"diameter": 10})
+
+            with self.assertRaisesMessage(
+                ValidationError, "'diameter' is a required property"
+            ):
+                check_objecttype(self.object_type, self.version.version, {})
+
+    @override_settings(OBJECTS_SCHEMA_VALIDATOR_CACHE_TIMEOUT=0)
+    def test_validator_cache_disabled(self):
+        check_objecttype(self.object_type, self.version.version, {"diameter": 10})
+
+        with self.assertNumQueries(1):
+            check_objecttype(self.object_type, self.version.version, {"diameter": 10})
+
+    def test_validator_is_invalidated_on_save(self):
+        check_objecttype(self.object_type, self.version.version, {"diameter": 10})
+
+        self.version.json_schema["required"] = ["plantDate"]
+        self.version.save()
+
+        with self.assertRaisesMessage(
+            ValidationError, "'plantDate' is a required property"
+        ):
+            check_objecttype(self.object_type, self.version.version, {"diameter": 10})
+
+    def test_validator_is_invalidated_on_delete(self):
+        check_objecttype(self.object_type, self.version.version, {"diameter": 10})
+
+        version = self.version.version
+        self.version.delete()
+
+        with self.assertRaisesMessage(ValidationError, "does not appear to exist"):
+            check_objecttype(self.object_type, version, {"diameter": 10})
+
+    def test_unknown_version(self):
+        with self.assertRaises(ValidationError) as cm:
+            check_objecttype(self.object_type, self.version.version + 1, {})
+
+        self.assertEqual(cm.exception.code, "invalid_key")
+
+
+class ValidateDataAttributePathTestCase(SimpleTestCase):
+    def test_valid_paths(self):
+        for path in ["status", "nested__timestamp", "with space", "tags__0"]:
+            with self.subTest(path=path):
+                validate_data_attribute_path(path)
+
+    def test_invalid_paths(self):
+        for path in ["", "a,b", "__status", "nested__", "a____b"]:
+            with self.subTest(path=path), self.assertRaises(ValidationError):
+                validate_data_attribute_path(path)
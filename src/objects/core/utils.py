@@ -1,25 +1,84 @@
+import time
+from uuid import UUID
+
+from django.conf import settings
 from django.core.exceptions import ValidationError
 
-import jsonschema
-from jsonschema.exceptions import SchemaError
+from jsonschema.exceptions import SchemaError, best_match
+from jsonschema.protocols import Validator
 from jsonschema.validators import validator_for
 
 from objects.core import models
 
+# process-local cache of compiled validators, keyed by (objecttype uuid, version)
+_validator_cache: dict[tuple[UUID, int], tuple[float, Validator]] = {}
+
+
+def get_objecttype_validator(
+    object_type: "models.ObjectType", version: int
+) -> Validator:
+    """
+    Return the JSON schema validator of an object type version.
+
+    Validators are compiled once and cached for
+    ``OBJECTS_SCHEMA_VALIDATOR_CACHE_TIMEOUT`` seconds, which saves a query and
+    the validation of the schema itself for every validated record.
+    """
+    key = (object_type.uuid, version)
+    timeout = settings.OBJECTS_SCHEMA_VALIDATOR_CACHE_TIMEOUT
+    if (cached := _validator_cache.get(key)) and cached[0] > time.monotonic():
+        return cached[1]
+
+    json_schema = object_type.versions.values_list("json_schema", flat=True).get(
+        version=version
+    )
+    validator_class = validator_for(json_schema)
+    validator_class.check_schema(json_schema)
+    validator = validator_class(json_schema)
+
+    if timeout:
+        _validator_cache[key] = (time.monotonic() + timeout, validator)
+    return validator
+
+
+def clear_objecttype_validators(
+    object_type_uuid: UUID | None = None, version: int | None = None
+) -> None:
+    """
+    Remove cached validators, for all object types if no object type is provided
+    """
+    if object_type_uuid is None:
+        _validator_cache.clear()
+        return
+
+    for key in list(_validator_cache):
+        if key[0] == object_type_uuid and version in (None, key[1]):
+            _validator_cache.pop(key, None)
+
 
 def check_objecttype(
     object_type: "models.ObjectType", version: int, data: dict
 ) -> None:
     try:
-        version_data = object_type.versions.get(version=version)
-        jsonschema.validate(data, version_data.json_schema)
+        validator = get_objecttype_validator(object_type, version)
     except models.ObjectTypeVersion.DoesNotExist:
         raise ValidationError(
             f"Object type {object_type} version: {version} does not appear to exist.",
             code="invalid_key",
         )
-    except jsonschema.exceptions.ValidationError as exc:
-        raise ValidationError(exc.args[0], code="invalid_jsonschema")
+
+    # same error selection as `jsonschema.validate`
+    error = best_match(validator.iter_errors(data))
+    if error is not None:
+        raise ValidationError(error.args[0], code="invalid_jsonschema")
+
+
+def validate_data_attribute_path(value: str) -> None:
+    if "," in value or not all(value.split("__")):
+        raise ValidationError(
+            "Attribute path may not contain commas or empty attribute names.",
+            code="invalid",
+        )
 
 
 def check_json_schema(json_schema: dict):
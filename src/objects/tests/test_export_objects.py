@@ -0,0 +1,59 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+
+from objects.core.tests.factories import ObjectRecordFactory, ObjectTypeFactory
+
+from .v2.utils import reverse
+
+
+@override_settings(SITE_DOMAIN="objects.example.com", IS_HTTPS=True)
+class ExportObjectsTests(TestCase):
+    def test_export_to_stdout(self):
+        object_type = ObjectTypeFactory.create()
+        record = ObjectRecordFactory.create(
+            object__object_type=object_type, data={"name": "some"}
+        )
+        ObjectRecordFactory.create()
+        out = StringIO()
+
+        call_command("export_objects", str(object_type.uuid), stdout=out)
+
+        data = json.loads(out.getvalue())
+
+        self.assertEqual(
+            data["url"],
+            f"https://objects.example.com{reverse('object-detail', args=[record.object.uuid])}",
+        )
+        self.assertEqual(
+            data["type"],
+            f"https://objects.example.com{reverse('objecttype-detail', args=[object_type.uuid])}",
+        )
+        self.assertEqual(data["record"]["data"], {"name": "some"})
+
+    def test_export_csv_to_file(self):
+        object_type = ObjectTypeFactory.create()
+        ObjectRecordFactory.create_batch(3, object__object_type=object_type)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "objects.csv"
+            call_command(
+                "export_objects",
+                str(object_type.uuid),
+                format="csv",
+                output=str(path),
+                stdout=StringIO(),
+            )
+
+            lines = path.read_text().splitlines()
+
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[0].startswith("url,uuid,type,record.index"))
+
+    def test_unknown_objecttype(self):
+        with self.assertRaises(CommandError):
+            call_command("export_objects", "invalid", stdout=StringIO())
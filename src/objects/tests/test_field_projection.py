@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from glom import GlomError, glom
+
+from objects.utils.serializers import (
+    build_projection,
+    build_spec,
+    get_excluded_field_names,
+    get_field_names,
+    project,
+)
+
+DATA = {
+    "url": "http://testserver/api/v2/objects/1",
+    "uuid": "5d8d7c4b-6b2b-4e9a-8f3b-1a0b4d6c7e8f",
+    "record": {
+        "index": 1,
+        "data": {
+            "plantDate": "2020-04-12",
+            "diameter": 30,
+            "dimensions": {"height": 10, "width": {"min": 1, "max": 2}},
+            "tags": ["a", "b"],
+            "empty": {},
+        },
+        "geometry": {"type": "Point", "coordinates": [4.9, 52.3]},
+        "correctedBy": None,
+    },
+}
+
+
+class FieldProjectionTests(TestCase):
+    def test_projection_matches_glom_spec(self):
+        test_fields = [
+            ["uuid"],
+            ["url", "record__index"],
+            ["record__data"],
+            ["record__data__diameter", "record__geometry"],
+            ["record__data__dimensions__width__max", "record__data__unknown"],
+            ["record__data__unknown__nested"],
+            ["record__data__tags__1"],
+            ["record__data__diameter__nested"],
+            ["record__correctedBy", "record__data__empty"],
+        ]
+
+        for fields in test_fields:
+            with self.subTest(fields=fields):
+                self.assertEqual(
+                    project(build_projection(fields), DATA),
+                    glom(DATA, build_spec(fields)),
+                )
+
+    def test_projection_required_field_absent(self):
+        with self.assertRaises(GlomError) as glom_cm:
+            glom(DATA, build_spec(["record__unknown"]))
+
+        with self.assertRaises(GlomError) as projection_cm:
+            project(build_projection(["record__unknown"]), DATA)
+
+        self.assertEqual(
+            str(projection_cm.exception.args[0]), str(glom_cm.exception.args[0])
+        )
+
+    def test_excluded_field_names(self):
+        test_fields = [
+            ["uuid"],
+            ["record__data"],
+            ["record__data__dimensions__height", "record__geometry__type"],
+            ["record__data__diameter__nested", "record__data__unknown"],
+            ["url", "uuid", "record"],
+        ]
+
+        for fields in test_fields:
+            with self.subTest(fields=fields):
+                projection = build_projection(fields)
+                self.assertEqual(
+                    get_excluded_field_names(DATA, projection),
+                    set(get_field_names(DATA))
+                    - set(get_field_names(project(projection, DATA))),
+                )
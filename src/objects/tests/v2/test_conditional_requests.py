@@ -0,0 +1,191 @@
+from datetime import date, timedelta
+
+from django.utils.http import http_date
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from objects.core.tests.factories import (
+    ObjectFactory,
+    ObjectRecordFactory,
+    ObjectTypeFactory,
+    ObjectTypeVersionFactory,
+    ReferenceFactory,
+)
+from objects.token.constants import PermissionModes
+from objects.token.tests.factories import PermissionFactory
+from objects.utils.test import TokenAuthMixin
+
+from .utils import reverse
+
+
+class ObjectConditionalRequestTests(TokenAuthMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        cls.permission = PermissionFactory.create(
+            object_type=cls.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=cls.token_auth,
+        )
+        cls.object = ObjectFactory.create(object_type=cls.object_type)
+        cls.record = ObjectRecordFactory.create(
+            object=cls.object,
+            version=1,
+            data={"name": "Name"},
+            start_at=date.today() - timedelta(days=1),
+        )
+
+    def test_retrieve_validators(self):
+        url = reverse("object-detail", args=[self.object.uuid])
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"].startswith('"'))
+        # the actual record can change without modifications
+        self.assertNotIn("Last-Modified", response)
+
+    def test_retrieve_not_modified(self):
+        url = reverse("object-detail", args=[self.object.uuid])
+        response = self.client.get(url)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified.content, b"")
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+
+    def test_retrieve_if_modified_since_is_ignored(self):
+        url = reverse("object-detail", args=[self.object.uuid])
+
+        response = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=http_date(self.record.modified_on.timestamp())
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_actual_record_changes_over_time(self):
+        url = reverse("object-detail", args=[self.object.uuid])
+        tomorrow = date.today() + timedelta(days=1)
+        ObjectRecordFactory.create(
+            object=self.object, version=1, data={"name": "Later"}, start_at=tomorrow
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.json()["record"]["data"], {"name": "Name"})
+
+        with freeze_time(tomorrow):
+            modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+        self.assertEqual(modified.json()["record"]["data"], {"name": "Later"})
+
+    def test_retrieve_modified(self):
+        url = reverse("object-detail", args=[self.object.uuid])
+        etag = self.client.get(url)["ETag"]
+
+        # the previous record is closed
+        ObjectRecordFactory.create(object=self.object, version=1, start_at=date.today())
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_retrieve_modified_references(self):
+        url = reverse("object-detail", args=[self.object.uuid])
+        etag = self.client.get(url)["ETag"]
+
+        ReferenceFactory.create(record=self.record)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_modified_permission(self):
+        url = reverse("object-detail", args=[self.object.uuid])
+        etag = self.client.get(url)["ETag"]
+
+        self.permission.use_fields = True
+        self.permission.fields = {"1": ["uuid", "record__data__name"]}
+        self.permission.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_other_fields(self):
+        url = reverse("object-detail", args=[self.object.uuid])
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, {"fields": "uuid"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_history(self):
+        url = reverse("object-history", args=[self.object.uuid])
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        ObjectRecordFactory.create(object=self.object, version=1, start_at=date.today())
+
+        modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+        self.assertEqual(modified.json()["count"], 2)
+
+
+class ObjectTypeConditionalRequestTests(TokenAuthMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        cls.version = ObjectTypeVersionFactory.create(object_type=cls.object_type)
+
+    def test_objecttype(self):
+        url = reverse("objecttype-detail", args=[self.object_type.uuid])
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("Last-Modified", response)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # a new version adds its URL to the object type
+        ObjectTypeVersionFactory.create(object_type=self.object_type)
+
+        modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+
+    def test_objecttype_version(self):
+        url = reverse(
+            "objecttypeversion-detail",
+            args=[self.object_type.uuid, self.version.version],
+        )
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.version.json_schema = {"type": "object", "title": "changed"}
+        self.version.save()
+
+        modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
@@ -0,0 +1,110 @@
+from datetime import date
+
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from objects.core.tests.factories import ObjectRecordFactory, ObjectTypeFactory
+from objects.token.constants import PermissionModes
+from objects.token.tests.factories import PermissionFactory
+from objects.utils.test import TokenAuthMixin
+
+from ..constants import GEO_WRITE_KWARGS
+from .utils import reverse, reverse_lazy
+
+
+@override_settings(OBJECTS_EXPLAIN_ENABLED=True)
+class QueryPlanTests(TokenAuthMixin, APITestCase):
+    url = reverse_lazy("object-list")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.token_auth.is_superuser = True
+        cls.token_auth.save()
+
+        cls.object_type = ObjectTypeFactory.create()
+        ObjectRecordFactory.create_batch(
+            3,
+            object__object_type=cls.object_type,
+            data={"name": "demo"},
+            start_at=date.today(),
+        )
+
+    def test_list_query_plans(self):
+        response = self.client.get(
+            self.url, {"data_attr": "name__exact__demo"}, HTTP_X_EXPLAIN="1"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        stages = {stage["name"]: stage["duration_ms"] for stage in data["stages"]}
+        self.assertEqual(list(stages), ["queries", "serialization", "total"])
+        self.assertGreater(stages["serialization"], 0)
+        self.assertLessEqual(
+            stages["queries"] + stages["serialization"], stages["total"]
+        )
+        self.assertAlmostEqual(
+            stages["queries"],
+            sum(query["duration_ms"] for query in data["queries"]),
+            places=2,
+        )
+        # count and page of the results
+        select_queries = [query for query in data["queries"] if query["plan"]]
+        self.assertGreaterEqual(len(select_queries), 2)
+        for query in select_queries:
+            with self.subTest(sql=query["sql"]):
+                self.assertIn("core_objectrecord", query["sql"])
+                self.assertIn("Execution Time", query["plan"][0])
+                self.assertIn("Shared Hit Blocks", query["plan"][0]["Plan"])
+
+    def test_search_query_plans(self):
+        response = self.client.post(
+            reverse("object-search"),
+            {
+                "type": f"https://testserver{reverse('objecttype-detail', args=[self.object_type.uuid])}"
+            },
+            HTTP_X_EXPLAIN="1",
+            **GEO_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("queries", response.json())
+        self.assertNotIn("results", response.json())
+
+    def test_invalid_filters(self):
+        response = self.client.get(
+            self.url, {"type": "invalid-objecttype-url"}, HTTP_X_EXPLAIN="1"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_without_header(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 3)
+
+    @override_settings(OBJECTS_EXPLAIN_ENABLED=False)
+    def test_disabled(self):
+        response = self.client.get(self.url, HTTP_X_EXPLAIN="1")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 3)
+
+    def test_not_superuser(self):
+        self.token_auth.is_superuser = False
+        self.token_auth.save()
+        PermissionFactory.create(
+            object_type=self.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=self.token_auth,
+        )
+
+        response = self.client.get(self.url, HTTP_X_EXPLAIN="1")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1052,13 +1052,104 @@ class FilterDataIcontainsTests(TokenAuthMixin, APITestCase):
             f"http://testserver{reverse('object-detail', args=[record.object.uuid])}",
         )
 
+    def test_filter_in_arrays(self):
+        record = ObjectRecordFactory.create(
+            data={"tags": ["old", {"label": "Something important"}]},
+            object__object_type=self.object_type,
+        )
+        ObjectRecordFactory.create(
+            data={"tags": ["old"]}, object__object_type=self.object_type
+        )
+
+        response = self.client.get(self.url, {"data_icontains": "some"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(
+            data[0]["url"],
+            f"http://testserver{reverse('object-detail', args=[record.object.uuid])}",
+        )
+
+    def test_filter_only_string_values(self):
+        ObjectRecordFactory.create(
+            data={"something": 1234, "valid": True},
+            object__object_type=self.object_type,
+        )
+
+        for value in ["some", "123", "true"]:
+            with self.subTest(value=value):
+                response = self.client.get(self.url, {"data_icontains": value})
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json()["results"], [])
+
+    def test_filter_is_not_a_regex(self):
+        record = ObjectRecordFactory.create(
+            data={"name": "a.b%c_d"}, object__object_type=self.object_type
+        )
+        ObjectRecordFactory.create(
+            data={"name": "axbyczd"}, object__object_type=self.object_type
+        )
+
+        for value in ["a.b", "b%c", "c_d"]:
+            with self.subTest(value=value):
+                response = self.client.get(self.url, {"data_icontains": value})
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+                data = response.json()["results"]
+
+                self.assertEqual(len(data), 1)
+                self.assertEqual(data[0]["record"]["index"], record.index)
+                self.assertEqual(data[0]["record"]["data"], {"name": "a.b%c_d"})
+
+
+class FilterDataIregexTests(TokenAuthMixin, APITestCase):
+    url = reverse_lazy("object-list")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        PermissionFactory.create(
+            object_type=cls.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=cls.token_auth,
+        )
+
+    def test_filter_regex(self):
+        record = ObjectRecordFactory.create(
+            data={"person": {"name": "Something important"}},
+            object__object_type=self.object_type,
+        )
+        ObjectRecordFactory.create(
+            data={"person": {"name": "Nothing important"}},
+            object__object_type=self.object_type,
+        )
+
+        response = self.client.get(self.url, {"data_iregex": "^some.*ant$"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(
+            data[0]["url"],
+            f"http://testserver{reverse('object-detail', args=[record.object.uuid])}",
+        )
+
     @patch.dict(os.environ, {"DEBUG": "false"})
     @patch(
         "objects.core.query.ObjectRecordQuerySet._fetch_all",
         side_effect=ProgrammingError("'jsonpath' is not found"),
     )
     def test_filter_db_error(self, mock_query):
-        response = self.client.get(self.url, {"data_icontains": "some"})
+        response = self.client.get(self.url, {"data_iregex": "some"})
 
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -1,7 +1,8 @@
-from django.contrib.gis.geos import Point
+from django.contrib.gis.geos import LineString, Point
 
 from rest_framework import status
 from rest_framework.test import APITestCase
+from vng_api_common.tests import get_validation_errors
 
 from objects.core.tests.factories import ObjectRecordFactory, ObjectTypeFactory
 from objects.token.constants import PermissionModes
@@ -121,3 +122,101 @@ class GeoSearchTests(TokenAuthMixin, APITestCase):
             data[0]["url"],
             f"http://testserver{reverse('object-detail', args=[record.object.uuid])}",
         )
+
+    def test_filter_intersects(self):
+        # crosses the border of the district
+        record = ObjectRecordFactory.create(
+            object__object_type=self.object_type,
+            geometry=LineString((4.897787, 52.369918), (4.897787, 52.38)),
+        )
+        # outside of district
+        ObjectRecordFactory.create(
+            object__object_type=self.object_type, geometry=Point(4.905650, 52.357621)
+        )
+
+        for operator, expected in [("intersects", [record]), ("within", [])]:
+            with self.subTest(operator=operator):
+                response = self.client.post(
+                    self.url,
+                    {
+                        "geometry": {
+                            operator: {
+                                "type": "Polygon",
+                                "coordinates": [POLYGON_AMSTERDAM_CENTRUM],
+                            }
+                        }
+                    },
+                    **GEO_WRITE_KWARGS,
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [result["uuid"] for result in response.json()["results"]],
+                    [str(record.object.uuid) for record in expected],
+                )
+
+    def test_filter_bbox(self):
+        record = ObjectRecordFactory.create(
+            object__object_type=self.object_type, geometry=Point(4.905289, 52.369918)
+        )
+        ObjectRecordFactory.create(
+            object__object_type=self.object_type, geometry=Point(4.905650, 52.357621)
+        )
+
+        response = self.client.post(
+            self.url,
+            {"geometry": {"bbox": [4.89, 52.36, 4.91, 52.38]}},
+            **GEO_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["uuid"], str(record.object.uuid))
+
+    def test_filter_bbox_invalid(self):
+        response = self.client.post(
+            self.url,
+            {"geometry": {"bbox": [4.91, 52.36, 4.89, 52.38]}},
+            **GEO_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        error = get_validation_errors(response, "geometry.bbox")
+        self.assertEqual(error["code"], "invalid-bbox")
+
+    def test_filter_dwithin(self):
+        # about 100 meters north of the point
+        record = ObjectRecordFactory.create(
+            object__object_type=self.object_type, geometry=Point(4.905289, 52.370818)
+        )
+        ObjectRecordFactory.create(
+            object__object_type=self.object_type, geometry=Point(4.905650, 52.357621)
+        )
+
+        for distance, expected in [(150, [record]), (50, [])]:
+            with self.subTest(distance=distance):
+                response = self.client.post(
+                    self.url,
+                    {
+                        "geometry": {
+                            "dwithin": {
+                                "geometry": {
+                                    "type": "Point",
+                                    "coordinates": [4.905289, 52.369918],
+                                },
+                                "distance": distance,
+                            }
+                        }
+                    },
+                    **GEO_WRITE_KWARGS,
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [result["uuid"] for result in response.json()["results"]],
+                    [str(record.object.uuid) for record in expected],
+                )
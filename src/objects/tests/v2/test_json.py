@@ -0,0 +1,105 @@
+import datetime
+import decimal
+import io
+import json
+import uuid
+
+from django.test import SimpleTestCase
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from objects.api.parsers import ORJSONParser
+from objects.api.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_same_output_as_json_renderer(self):
+        data = {
+            "url": "http://testserver/api/v2/objects/1",
+            "uuid": uuid.uuid4(),
+            "record": {
+                "index": 1,
+                "data": {"name": "Ünïcode \u2028", "nested": {"list": [1, 2.5, None]}},
+                "geometry": {"type": "Point", "coordinates": [4.9, 52.3]},
+                "startAt": datetime.date(2020, 1, 1),
+                "registeredAt": datetime.datetime(
+                    2020, 1, 1, 12, 30, 15, 123456, tzinfo=datetime.UTC
+                ),
+                "time": datetime.time(12, 30),
+                "amount": decimal.Decimal("1.50"),
+                "references": [],
+            },
+        }
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_unsupported_values_fall_back_to_json_renderer(self):
+        data = {"number": 2**70}
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_float_exponents(self):
+        data = {"small": 1.5e-7}
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertEqual(rendered, b'{"small":1.5e-7}')
+        self.assertEqual(JSONRenderer().render(data), b'{"small":1.5e-07}')
+        # the same values are represented
+        self.assertEqual(json.loads(rendered), data)
+
+    def test_non_finite_floats(self):
+        data = {"nan": float("nan"), "infinity": float("inf")}
+
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
+
+        self.assertEqual(ORJSONRenderer().render(data), b'{"nan":null,"infinity":null}')
+
+    def test_indent(self):
+        data = {"a": [1, 2]}
+
+        self.assertEqual(
+            ORJSONRenderer().render(data, "application/json; indent=4"),
+            JSONRenderer().render(data, "application/json; indent=4"),
+        )
+
+    def test_no_data(self):
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+class ORJSONParserTests(SimpleTestCase):
+    def parse(self, parser, content: bytes, **parser_context):
+        return parser.parse(io.BytesIO(content), parser_context=parser_context)
+
+    def test_same_result_as_json_parser(self):
+        for content in [
+            b'{"type": "http://testserver/api/v2/objecttypes/1", "record": {}}',
+            b'{"record": {"data": {"big": 123456789012345678901234567890}}}',
+            '{"name": "Ünïcode"}'.encode(),
+            b"[1, 2.5, null, true]",
+        ]:
+            with self.subTest(content=content):
+                self.assertEqual(
+                    self.parse(ORJSONParser(), content),
+                    self.parse(JSONParser(), content),
+                )
+
+    def test_other_encoding(self):
+        content = '{"name": "Ünïcode"}'.encode("latin-1")
+
+        self.assertEqual(
+            self.parse(ORJSONParser(), content, encoding="latin-1"),
+            {"name": "Ünïcode"},
+        )
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError) as orjson_cm:
+            self.parse(ORJSONParser(), b'{"record": ')
+
+        with self.assertRaises(ParseError) as json_cm:
+            self.parse(JSONParser(), b'{"record": ')
+
+        self.assertEqual(orjson_cm.exception.detail, json_cm.exception.detail)
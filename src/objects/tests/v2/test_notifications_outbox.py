@@ -0,0 +1,192 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from freezegun import freeze_time
+from notifications_api_common.models import NotificationsConfig
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+
+from objects.api.tasks import send_outbox_notifications
+from objects.core.models import OutboxNotification
+
+NOTIFICATIONS_API_ROOT = "https://notificaties-api.vng.cloud/api/v1/"
+NOTIFICATIONS_URL = f"{NOTIFICATIONS_API_ROOT}notificaties"
+
+
+def create_notification(resource_url: str, action: str, **kwargs):
+    message = {
+        "kanaal": "objecten",
+        "hoofdObject": resource_url,
+        "resource": "object",
+        "resourceUrl": resource_url,
+        "actie": action,
+        "aanmaakdatum": timezone.now().isoformat(),
+        "kenmerken": {},
+    }
+    return OutboxNotification.objects.create(
+        resource_url=resource_url, message=message, **kwargs
+    )
+
+
+@freeze_time("2024-01-01T12:00:00Z")
+@requests_mock.Mocker()
+class SendOutboxNotificationsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        service = Service.objects.create(
+            api_root=NOTIFICATIONS_API_ROOT,
+            api_type=APITypes.nrc,
+            client_id="test",
+            secret="test",
+            user_id="test",
+            user_representation="Test",
+        )
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = service
+        config.notification_delivery_max_retries = 2
+        config.notification_delivery_retry_backoff = 10
+        config.notification_delivery_base_factor = 2
+        config.save()
+
+    def test_send(self, m):
+        m.post(NOTIFICATIONS_URL, status_code=201)
+        create = create_notification("http://testserver/object/1", "create")
+        destroy = create_notification("http://testserver/object/2", "destroy")
+
+        send_outbox_notifications()
+
+        self.assertEqual(
+            [request.json() for request in m.request_history],
+            [create.message, destroy.message],
+        )
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_coalesce_same_action(self, m):
+        m.post(NOTIFICATIONS_URL, status_code=201)
+        create = create_notification("http://testserver/object/1", "create")
+        create_notification("http://testserver/object/1", "update")
+        last_update = create_notification("http://testserver/object/1", "update")
+
+        send_outbox_notifications()
+
+        self.assertEqual(
+            [request.json() for request in m.request_history],
+            [create.message, last_update.message],
+        )
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    @override_settings(NOTIFICATIONS_OUTBOX_BATCH_SIZE=1)
+    def test_batches(self, m):
+        m.post(NOTIFICATIONS_URL, status_code=201)
+        for index in range(3):
+            create_notification(f"http://testserver/object/{index}", "create")
+
+        send_outbox_notifications()
+
+        self.assertEqual(len(m.request_history), 3)
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    @patch("objects.api.tasks.send_outbox_notifications.apply_async")
+    def test_retry(self, m, mock_apply_async):
+        m.post(
+            NOTIFICATIONS_URL,
+            [{"status_code": 500}, {"status_code": 201}],
+        )
+        failed = create_notification("http://testserver/object/1", "create")
+        blocked = create_notification("http://testserver/object/1", "destroy")
+        other = create_notification("http://testserver/object/2", "create")
+
+        send_outbox_notifications()
+
+        # the later notification of the object waits for the failed one
+        self.assertEqual(
+            [request.json() for request in m.request_history],
+            [failed.message, other.message],
+        )
+
+        failed.refresh_from_db()
+        retry_at = timezone.now() + timedelta(seconds=10)
+
+        self.assertEqual(failed.attempts, 1)
+        self.assertEqual(failed.available_at, retry_at)
+        self.assertTrue(OutboxNotification.objects.filter(pk=blocked.pk).exists())
+        self.assertFalse(OutboxNotification.objects.filter(pk=other.pk).exists())
+        mock_apply_async.assert_called_once_with(eta=retry_at)
+
+        with freeze_time(retry_at):
+            send_outbox_notifications()
+
+        self.assertEqual(
+            [request.json() for request in m.request_history[2:]],
+            [failed.message, blocked.message],
+        )
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_max_retries(self, m):
+        m.post(NOTIFICATIONS_URL, status_code=500)
+        create_notification("http://testserver/object/1", "create", attempts=2)
+
+        send_outbox_notifications()
+
+        self.assertEqual(len(m.request_history), 1)
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_not_available(self, m):
+        create_notification(
+            "http://testserver/object/1",
+            "create",
+            available_at=timezone.now() + timedelta(minutes=1),
+        )
+
+        send_outbox_notifications()
+
+        self.assertEqual(m.request_history, [])
+        self.assertEqual(OutboxNotification.objects.count(), 1)
+
+    @patch("objects.api.tasks.send_outbox_notifications.apply_async")
+    def test_not_configured(self, m, mock_apply_async):
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = None
+        config.save()
+        create_notification("http://testserver/object/1", "create")
+
+        send_outbox_notifications()
+
+        self.assertEqual(m.request_history, [])
+        self.assertEqual(OutboxNotification.objects.count(), 1)
+        mock_apply_async.assert_called_once_with(
+            eta=timezone.now() + timedelta(seconds=300)
+        )
+
+    @patch("objects.api.tasks.send_outbox_notifications.apply_async")
+    def test_not_configured_empty_outbox(self, m, mock_apply_async):
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = None
+        config.save()
+
+        send_outbox_notifications()
+
+        mock_apply_async.assert_not_called()
+
+    def test_command(self, m):
+        m.post(NOTIFICATIONS_URL, status_code=201)
+        create_notification("http://testserver/object/1", "create")
+        create_notification(
+            "http://testserver/object/2",
+            "create",
+            available_at=timezone.now() + timedelta(minutes=1),
+        )
+        out = StringIO()
+
+        call_command("send_outbox_notifications", stdout=out)
+
+        self.assertEqual(len(m.request_history), 1)
+        self.assertIn("1 notification(s) are pending", out.getvalue())
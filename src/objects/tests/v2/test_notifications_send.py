@@ -3,6 +3,7 @@ from urllib.parse import urlencode
 
 from django.test import override_settings
 
+import requests_mock
 from freezegun import freeze_time
 from notifications_api_common.models import NotificationsConfig
 from rest_framework import status
@@ -11,7 +12,8 @@ from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
 
 from objects.cloud_events.constants import ZAAK_GEKOPPELD, ZAAK_ONTKOPPELD
-from objects.core.models import Reference
+from objects.cloud_events.tasks import send_batched_zaak_events, send_cloudevents
+from objects.core.models import OutboxNotification, Reference
 from objects.core.tests.factories import (
     ObjectFactory,
     ObjectRecordFactory,
@@ -60,7 +62,7 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
         config.notifications_api_service = service
         config.save()
 
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     def test_send_notif_create_object(self, mock_task):
         """
         Check if notifications will be send when Object is created
@@ -87,7 +89,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
 
         data = response.json()
 
-        mock_task.assert_called_once_with(
+        mock_task.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "hoofdObject": data["url"],
@@ -101,7 +105,30 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             },
         )
 
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch(
+        "objects.api.mixins.send_outbox_notifications.delay",
+        side_effect=ConnectionError("broker unavailable"),
+    )
+    def test_send_notif_task_not_started(self, mock_task):
+        url = reverse("object-list")
+        data = {
+            "type": f"https://testserver{reverse('objecttype-detail', args=[self.object_type.uuid])}",
+            "record": {
+                "typeVersion": 1,
+                "data": {"plantDate": "2020-04-12", "diameter": 30},
+                "startAt": "2020-01-01",
+            },
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(url, data, **GEO_WRITE_KWARGS)
+
+        # the notification is kept in the outbox, to be sent by the command
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        mock_task.assert_called_once_with()
+        self.assertEqual(OutboxNotification.objects.count(), 1)
+
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     def test_send_notif_update_object(self, mock_task):
         """
         Check if notifications will be send when Object is created
@@ -131,7 +158,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
 
         data = response.json()
 
-        mock_task.assert_called_once_with(
+        mock_task.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "hoofdObject": data["url"],
@@ -145,7 +174,7 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             },
         )
 
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     def test_send_notif_partial_update_object(self, mock_task):
         """
         Check if notifications will be send when Object is created
@@ -175,7 +204,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
 
         data = response.json()
 
-        mock_task.assert_called_once_with(
+        mock_task.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "hoofdObject": data["url"],
@@ -189,7 +220,7 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             },
         )
 
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     def test_send_notif_delete_object(self, mock_task):
         """
         Check if notifications will be send when Object is created
@@ -207,7 +238,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             response.status_code, status.HTTP_204_NO_CONTENT, response.data
         )
 
-        mock_task.assert_called_once_with(
+        mock_task.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "hoofdObject": full_url,
@@ -221,8 +254,8 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             },
         )
 
-    @patch("notifications_api_common.tasks.send_cloudevent.delay")
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.cloud_events.tasks.send_cloudevents")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     @override_settings(
         CELERY_TASK_ALWAYS_EAGER=True,
         ENABLE_CLOUD_EVENTS=True,
@@ -248,7 +281,7 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
         data = response.json()
 
         mock_event.assert_called_once()
-        event = mock_event.call_args[0][0]
+        [event] = mock_event.call_args[0][0]
         self.assertEqual(event["type"], ZAAK_GEKOPPELD)
         self.assertTrue(
             event["data"]["label"].endswith(
@@ -267,7 +300,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             },
         )
 
-        mock_notification.assert_called_once_with(
+        mock_notification.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "source": "open-object-test",
@@ -282,8 +317,8 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             },
         )
 
-    @patch("notifications_api_common.tasks.send_cloudevent.delay")
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.cloud_events.tasks.send_cloudevents")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     @override_settings(
         CELERY_TASK_ALWAYS_EAGER=True,
         ENABLE_CLOUD_EVENTS=True,
@@ -324,9 +359,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
 
         data = response.json()
 
-        self.assertEqual(mock_event.call_count, 2)
+        mock_event.assert_called_once()
 
-        koppel_event = mock_event.call_args_list[0][0][0]
+        koppel_event, ontkoppel_event = mock_event.call_args[0][0]
         self.assertEqual(koppel_event["type"], ZAAK_GEKOPPELD)
         self.assertTrue(
             koppel_event["data"]["label"].endswith(
@@ -345,7 +380,6 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             },
         )
 
-        ontkoppel_event = mock_event.call_args_list[1][0][0]
         self.assertEqual(ontkoppel_event["type"], ZAAK_ONTKOPPELD)
         self.assertEqual(
             ontkoppel_event["data"],
@@ -356,7 +390,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             },
         )
 
-        mock_notification.assert_called_once_with(
+        mock_notification.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "hoofdObject": f"http://testserver{url}",
@@ -372,7 +408,7 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
         )
 
     @patch("notifications_api_common.tasks.send_cloudevent.delay")
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     @override_settings(
         CELERY_TASK_ALWAYS_EAGER=True,
         ENABLE_CLOUD_EVENTS=True,
@@ -413,7 +449,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             "https://example.com/zaak/2",
         }
 
-        mock_notification.assert_called_once_with(
+        mock_notification.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "hoofdObject": f"http://testserver{url}",
@@ -429,7 +467,7 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
         )
 
     @patch("notifications_api_common.tasks.send_cloudevent.delay")
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     @override_settings(
         CELERY_TASK_ALWAYS_EAGER=True,
         ENABLE_CLOUD_EVENTS=True,
@@ -472,7 +510,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
             "https://example.com/zaak/1"
         }
 
-        mock_notification.assert_called_once_with(
+        mock_notification.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "hoofdObject": f"http://testserver{url}",
@@ -488,7 +528,7 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
         )
 
     @patch("notifications_api_common.tasks.send_cloudevent.delay")
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     @override_settings(
         CELERY_TASK_ALWAYS_EAGER=True,
         ENABLE_CLOUD_EVENTS=True,
@@ -533,7 +573,9 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
 
         # check correct notification
 
-        mock_notification.assert_called_once_with(
+        mock_notification.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
             {
                 "kanaal": "objecten",
                 "hoofdObject": f"http://testserver{url}",
@@ -553,7 +595,7 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
         ENABLE_CLOUD_EVENTS=False,
     )
     @patch("notifications_api_common.tasks.send_cloudevent.delay")
-    @patch("notifications_api_common.viewsets.send_notification.delay")
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
     def test_no_notifications_sent_when_disabled(self, mock_notification, mock_events):
         url = reverse("object-list")
         data = {
@@ -577,3 +619,92 @@ class SendNotifTestCase(TokenAuthMixin, APITestCase):
 
         assert mock_notification.call_count == 3
         assert mock_events.call_args_list == []
+
+
+@override_settings(ENABLE_CLOUD_EVENTS=True, NOTIFICATIONS_SOURCE="open-object-test")
+class SendBatchedZaakEventsTestCase(APITestCase):
+    @patch("objects.cloud_events.tasks.send_cloudevents")
+    def test_send_batched_zaak_events(self, mock_send):
+        first = ObjectFactory.create()
+        ReferenceFactory.create(
+            type="zaak", url="https://example.com/zaak/1", record__object=first
+        )
+        first_record = ObjectRecordFactory.create(object=first)
+        ReferenceFactory.create(
+            type="zaak", url="https://example.com/zaak/2", record=first_record
+        )
+        second_record = ReferenceFactory.create(
+            type="zaak", url="https://example.com/zaak/3"
+        ).record
+
+        # the records, the references of the records and of the previous records
+        with self.assertNumQueries(3):
+            send_batched_zaak_events(
+                [
+                    (first_record.pk, "http://testserver/objects/1"),
+                    (second_record.pk, "http://testserver/objects/2"),
+                ]
+            )
+
+        events = mock_send.call_args[0][0]
+        self.assertEqual(
+            [
+                (event["type"], event["data"]["zaak"], event["data"]["linkTo"])
+                for event in events
+            ],
+            [
+                (
+                    ZAAK_GEKOPPELD,
+                    "https://example.com/zaak/2",
+                    "http://testserver/objects/1",
+                ),
+                (
+                    ZAAK_ONTKOPPELD,
+                    "https://example.com/zaak/1",
+                    "http://testserver/objects/1",
+                ),
+                (
+                    ZAAK_GEKOPPELD,
+                    "https://example.com/zaak/3",
+                    "http://testserver/objects/2",
+                ),
+            ],
+        )
+
+    @override_settings(NOTIFICATIONS_SOURCE="")
+    @patch("objects.cloud_events.tasks.send_cloudevents")
+    def test_send_batched_zaak_events_without_source(self, mock_send):
+        record = ReferenceFactory.create(
+            type="zaak", url="https://example.com/zaak/1"
+        ).record
+
+        with self.assertNumQueries(0):
+            send_batched_zaak_events([(record.pk, "http://testserver/objects/1")])
+
+        mock_send.assert_not_called()
+
+    @requests_mock.Mocker()
+    @patch("objects.cloud_events.tasks.send_cloudevent.delay")
+    def test_send_cloudevents_retry(self, m, mock_retry):
+        service = Service.objects.create(
+            api_root="https://notificaties-api.vng.cloud/api/v1/",
+            api_type=APITypes.nrc,
+            client_id="test",
+            secret="test",
+            user_id="test",
+            user_representation="Test",
+        )
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = service
+        config.save()
+        m.post(
+            "https://notificaties-api.vng.cloud/api/v1/cloudevents",
+            [{"status_code": 500}, {"status_code": 201}],
+        )
+        events = [{"type": ZAAK_GEKOPPELD}, {"type": ZAAK_ONTKOPPELD}]
+
+        send_cloudevents(events)
+
+        self.assertEqual(len(m.request_history), 2)
+        # only the failed event is retried by its own task
+        mock_retry.assert_called_once_with({"type": ZAAK_GEKOPPELD})
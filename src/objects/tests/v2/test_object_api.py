@@ -771,6 +771,34 @@ class ObjectsAvailableRecordsTests(TokenAuthMixin, APITestCase):
         self.assertEqual(data["results"][1]["record"]["index"], 1)
         self.assertEqual(data["results"][1]["url"], f"http://testserver{object_url}")
 
+    @freeze_time("2024-08-31")
+    def test_list_available_today_with_last_record_in_future(self):
+        """
+        The last record of an object should not show up before its start date, the
+        previous record is the actual record instead
+        """
+        object2 = ObjectFactory.create(object_type=self.object_type)
+        ObjectRecordFactory.create(
+            object=object2,
+            data={"name": "old"},
+            start_at="2024-08-01",
+            registration_at="2024-08-02",
+        )
+        ObjectRecordFactory.create(
+            object=object2,
+            data={"name": "new"},
+            start_at="2024-09-30",
+            registration_at="2024-08-30",
+        )
+
+        response = self.client.get(self.url, {"data_attrs": "name__exact__old"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(data["results"][0]["uuid"], str(object2.uuid))
+        self.assertEqual(data["results"][0]["record"]["index"], 1)
+
     def test_list_available_for_date(self):
         with self.subTest("filter on old name"):
             response = self.client.get(
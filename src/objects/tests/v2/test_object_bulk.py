@@ -0,0 +1,243 @@
+import uuid
+from datetime import date
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from freezegun import freeze_time
+from notifications_api_common.models import NotificationsConfig
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import get_validation_errors
+from zgw_consumers.constants import APITypes
+from zgw_consumers.models import Service
+
+from objects.core.models import Object, ObjectRecord, OutboxNotification
+from objects.core.tests.factories import (
+    ObjectFactory,
+    ObjectTypeFactory,
+    ObjectTypeVersionFactory,
+)
+from objects.token.constants import PermissionModes
+from objects.token.tests.factories import PermissionFactory
+from objects.utils.test import TokenAuthMixin
+
+from ..constants import GEO_WRITE_KWARGS
+from .utils import reverse, reverse_lazy
+
+
+def get_result_error(result: dict, field: str) -> dict:
+    return next(error for error in result["invalidParams"] if error["name"] == field)
+
+
+@freeze_time("2020-08-08")
+class ObjectBulkCreateTests(TokenAuthMixin, APITestCase):
+    url = reverse_lazy("object-bulk-create")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        ObjectTypeVersionFactory.create(object_type=cls.object_type)
+        PermissionFactory.create(
+            object_type=cls.object_type,
+            mode=PermissionModes.read_and_write,
+            token_auth=cls.token_auth,
+        )
+        cls.object_type_url = f"http://testserver{reverse('objecttype-detail', args=[cls.object_type.uuid])}"
+
+    def get_object_data(self, **record_data) -> dict:
+        return {
+            "type": self.object_type_url,
+            "record": {
+                "typeVersion": 1,
+                "data": {"plantDate": "2020-04-12", "diameter": 30},
+                "startAt": "2020-01-01",
+                **record_data,
+            },
+        }
+
+    def test_bulk_create(self):
+        object_uuid = uuid.uuid4()
+        data = [
+            {
+                **self.get_object_data(
+                    references=[{"type": "zaak", "url": "https://example.com/zaak/1"}]
+                ),
+                "uuid": str(object_uuid),
+            },
+            self.get_object_data(data={"diameter": 20}),
+        ]
+
+        response = self.client.post(self.url, data, **GEO_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.json()["results"]
+
+        self.assertEqual([result["status"] for result in results], [201, 201])
+        self.assertEqual(Object.objects.count(), 2)
+
+        object = Object.objects.get(uuid=object_uuid)
+        record = object.records.get()
+
+        self.assertEqual(object.object_type, self.object_type)
+        self.assertEqual(record._object_type, self.object_type)
+        self.assertEqual(record.index, 1)
+        self.assertTrue(record.is_last_record)
+        self.assertEqual(record.registration_at, date(2020, 8, 8))
+        self.assertEqual(
+            list(record.references.values_list("url", flat=True)),
+            ["https://example.com/zaak/1"],
+        )
+        self.assertEqual(
+            results[0]["object"],
+            {
+                "url": f"http://testserver{reverse('object-detail', args=[object_uuid])}",
+                "uuid": str(object_uuid),
+                "type": self.object_type_url,
+                "record": {
+                    "index": 1,
+                    "typeVersion": 1,
+                    "data": {"plantDate": "2020-04-12", "diameter": 30},
+                    "geometry": None,
+                    "references": [
+                        {"type": "zaak", "url": "https://example.com/zaak/1"}
+                    ],
+                    "startAt": "2020-01-01",
+                    "endAt": None,
+                    "registrationAt": "2020-08-08",
+                    "correctionFor": None,
+                    "correctedBy": None,
+                },
+            },
+        )
+        self.assertEqual(results[1]["object"]["record"]["data"], {"diameter": 20})
+
+    def test_bulk_create_with_invalid_objects(self):
+        existing_object = ObjectFactory.create(object_type=self.object_type)
+        data = [
+            self.get_object_data(data={"plantDate": "2020-04-12"}),
+            self.get_object_data(),
+            {**self.get_object_data(), "uuid": str(existing_object.uuid)},
+        ]
+
+        response = self.client.post(self.url, data, **GEO_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.json()["results"]
+
+        self.assertEqual([result["status"] for result in results], [400, 201, 400])
+        self.assertNotIn("object", results[0])
+        self.assertEqual(
+            get_result_error(results[0], "nonFieldErrors")["reason"],
+            "'diameter' is a required property",
+        )
+        self.assertEqual(get_result_error(results[2], "uuid")["code"], "unique")
+        self.assertEqual(ObjectRecord.objects.count(), 2)
+
+    def test_bulk_create_with_duplicate_uuids(self):
+        object_uuid = str(uuid.uuid4())
+        data = [
+            {**self.get_object_data(), "uuid": object_uuid},
+            {**self.get_object_data(), "uuid": object_uuid},
+        ]
+
+        response = self.client.post(self.url, data, **GEO_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.json()["results"]
+
+        self.assertEqual([result["status"] for result in results], [201, 400])
+        self.assertEqual(get_result_error(results[1], "uuid")["code"], "unique")
+        self.assertEqual(Object.objects.get().uuid, uuid.UUID(object_uuid))
+
+    def test_bulk_create_without_write_permission(self):
+        other_object_type = ObjectTypeFactory.create()
+        ObjectTypeVersionFactory.create(object_type=other_object_type)
+        PermissionFactory.create(
+            object_type=other_object_type,
+            mode=PermissionModes.read_only,
+            token_auth=self.token_auth,
+        )
+        data = [
+            {
+                **self.get_object_data(),
+                "type": f"http://testserver{reverse('objecttype-detail', args=[other_object_type.uuid])}",
+            },
+            self.get_object_data(),
+        ]
+
+        response = self.client.post(self.url, data, **GEO_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.json()["results"]
+
+        self.assertEqual([result["status"] for result in results], [403, 201])
+        self.assertEqual(
+            get_result_error(results[0], "type")["code"], "permission_denied"
+        )
+        self.assertEqual(Object.objects.get().object_type, self.object_type)
+
+    def test_bulk_create_not_a_list(self):
+        response = self.client.post(
+            self.url, self.get_object_data(), **GEO_WRITE_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            get_validation_errors(response, "nonFieldErrors")["code"], "not_a_list"
+        )
+
+    @override_settings(OBJECTS_BULK_CREATE_MAX_SIZE=1)
+    def test_bulk_create_too_many_objects(self):
+        data = [self.get_object_data(), self.get_object_data()]
+
+        response = self.client.post(self.url, data, **GEO_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            get_validation_errors(response, "nonFieldErrors")["code"], "max_length"
+        )
+        self.assertFalse(Object.objects.exists())
+
+    @override_settings(NOTIFICATIONS_DISABLED=False)
+    @patch("objects.api.mixins.send_outbox_notifications.delay")
+    def test_bulk_create_sends_notifications(self, mock_task):
+        service = Service.objects.create(
+            api_root="https://notificaties-api.vng.cloud/api/v1/",
+            api_type=APITypes.nrc,
+            client_id="test",
+            secret="test",
+            user_id="test",
+            user_representation="Test",
+        )
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = service
+        config.save()
+        data = [self.get_object_data(), self.get_object_data(data={"foo": "bar"})]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, data, **GEO_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        object_url = response.json()["results"][0]["object"]["url"]
+
+        mock_task.assert_called_once_with()
+        self.assertEqual(
+            OutboxNotification.objects.get().message,
+            {
+                "kanaal": "objecten",
+                "hoofdObject": object_url,
+                "resource": "object",
+                "resourceUrl": object_url,
+                "actie": "create",
+                "aanmaakdatum": "2020-08-08T02:00:00+02:00",
+                "kenmerken": {"objectType": self.object_type_url},
+            },
+        )
@@ -0,0 +1,161 @@
+from datetime import date, timedelta
+
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+
+from objects.core.constants import ChangeActions
+from objects.core.models import ObjectRecord
+from objects.core.tests.factories import (
+    ObjectFactory,
+    ObjectRecordFactory,
+    ObjectTypeFactory,
+)
+from objects.token.cache import clear_token_auth
+from objects.token.constants import PermissionModes
+from objects.token.tests.factories import PermissionFactory, TokenAuthFactory
+
+from .utils import reverse, reverse_lazy
+
+
+# the changes are only returned once their transaction is finished, so the tests
+# don't run in a transaction
+class ObjectChangeTests(APITransactionTestCase):
+    url = reverse_lazy("object-changes")
+
+    def setUp(self):
+        super().setUp()
+
+        clear_token_auth()
+        self.addCleanup(clear_token_auth)
+
+        self.token_auth = TokenAuthFactory.create()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token_auth.token}")
+
+        self.object_type = ObjectTypeFactory.create()
+        PermissionFactory.create(
+            object_type=self.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=self.token_auth,
+        )
+
+    def test_changes(self):
+        object = ObjectFactory.create(object_type=self.object_type)
+        ObjectRecordFactory.create(
+            object=object, start_at=date.today() - timedelta(days=1)
+        )
+        ObjectRecordFactory.create(object=object, start_at=date.today())
+        uuid = object.uuid
+        object.delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(
+            [
+                (change["uuid"], change["action"], change["recordIndex"])
+                for change in data["results"]
+            ],
+            [
+                (str(uuid), ChangeActions.created, 1),
+                (str(uuid), ChangeActions.updated, 2),
+                (str(uuid), ChangeActions.deleted, None),
+            ],
+        )
+        self.assertEqual(
+            data["results"][0]["url"],
+            f"http://testserver{reverse('object-detail', args=[uuid])}",
+        )
+        self.assertEqual(
+            data["results"][0]["type"],
+            f"http://testserver{reverse('objecttype-detail', args=[self.object_type.uuid])}",
+        )
+
+    def test_follow_next(self):
+        records = ObjectRecordFactory.create_batch(
+            3, object__object_type=self.object_type
+        )
+
+        response = self.client.get(self.url, {"pageSize": 2})
+        data = response.json()
+
+        self.assertEqual(len(data["results"]), 2)
+
+        response = self.client.get(data["next"])
+        data = response.json()
+
+        self.assertEqual(
+            [change["uuid"] for change in data["results"]],
+            [str(records[2].object.uuid)],
+        )
+
+        # the last position is returned to poll for later changes
+        response = self.client.get(data["next"])
+
+        self.assertEqual(response.json()["results"], [])
+
+        record = ObjectRecordFactory.create(object__object_type=self.object_type)
+
+        response = self.client.get(data["next"])
+
+        self.assertEqual(
+            [change["uuid"] for change in response.json()["results"]],
+            [str(record.object.uuid)],
+        )
+
+    def test_bulk_create(self):
+        objects = ObjectFactory.create_batch(2, object_type=self.object_type)
+        ObjectRecord.objects.bulk_create(
+            ObjectRecord(
+                object=object,
+                _object_type=self.object_type,
+                version=1,
+                start_at=date.today(),
+                is_last_record=True,
+            )
+            for object in objects
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            [change["uuid"] for change in response.json()["results"]],
+            [str(object.uuid) for object in objects],
+        )
+
+    def test_permissions(self):
+        ObjectRecordFactory.create(object__object_type=self.object_type)
+        ObjectRecordFactory.create()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(len(response.json()["results"]), 1)
+
+    def test_filter_type(self):
+        other_object_type = ObjectTypeFactory.create()
+        PermissionFactory.create(
+            object_type=other_object_type,
+            mode=PermissionModes.read_only,
+            token_auth=self.token_auth,
+        )
+        record = ObjectRecordFactory.create(object__object_type=self.object_type)
+        ObjectRecordFactory.create(object__object_type=other_object_type)
+
+        response = self.client.get(
+            self.url,
+            {
+                "type": f"http://testserver{reverse('objecttype-detail', args=[self.object_type.uuid])}"
+            },
+        )
+
+        self.assertEqual(
+            [change["uuid"] for change in response.json()["results"]],
+            [str(record.object.uuid)],
+        )
+
+    def test_invalid_since(self):
+        response = self.client.get(self.url, {"since": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
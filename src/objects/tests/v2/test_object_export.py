@@ -0,0 +1,146 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import get_validation_errors
+
+from objects.core.tests.factories import (
+    ObjectFactory,
+    ObjectRecordFactory,
+    ObjectTypeFactory,
+)
+from objects.token.constants import PermissionModes
+from objects.token.tests.factories import PermissionFactory
+from objects.utils.test import TokenAuthMixin
+
+from .utils import reverse, reverse_lazy
+
+
+class ObjectExportTests(TokenAuthMixin, APITestCase):
+    url = reverse_lazy("object-export")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        cls.object_type_url = f"http://testserver{reverse('objecttype-detail', args=[cls.object_type.uuid])}"
+
+    def get_content(self, response) -> str:
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson(self):
+        PermissionFactory.create(
+            object_type=self.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=self.token_auth,
+        )
+        object1, object2 = ObjectFactory.create_batch(2, object_type=self.object_type)
+        ObjectRecordFactory.create(object=object1, start_at=date.today())
+        ObjectRecordFactory.create(
+            object=object2, start_at=date.today() - timedelta(days=2)
+        )
+        # only the actual record is exported
+        ObjectRecordFactory.create(
+            object=object2, start_at=date.today() - timedelta(days=1), data={"a": 1}
+        )
+        # other object types are not exported
+        ObjectRecordFactory.create()
+
+        response = self.client.get(self.url, {"type": self.object_type_url})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="objects.ndjson"'
+        )
+
+        lines = self.get_content(response).splitlines()
+        data = [json.loads(line) for line in lines]
+
+        self.assertEqual(
+            [item["uuid"] for item in data], [str(object2.uuid), str(object1.uuid)]
+        )
+        self.assertEqual(data[0]["record"]["index"], 2)
+        self.assertEqual(data[0]["record"]["data"], {"a": 1})
+        self.assertEqual(data[0]["type"], self.object_type_url)
+
+    def test_export_csv(self):
+        PermissionFactory.create(
+            object_type=self.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=self.token_auth,
+        )
+        record = ObjectRecordFactory.create(
+            object__object_type=self.object_type,
+            data={"name": "some"},
+            geometry=None,
+            start_at=date(2020, 1, 1),
+        )
+
+        response = self.client.get(
+            self.url, {"type": self.object_type_url, "exportFormat": "csv"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(self.get_content(response))))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["uuid"], str(record.object.uuid))
+        self.assertEqual(rows[0]["record.data"], '{"name":"some"}')
+        self.assertEqual(rows[0]["record.startAt"], "2020-01-01")
+        self.assertEqual(rows[0]["record.geometry"], "")
+
+    def test_export_with_field_based_permissions(self):
+        PermissionFactory.create(
+            object_type=self.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=self.token_auth,
+            use_fields=True,
+            fields={"1": ["url", "record__data__name"]},
+        )
+        record = ObjectRecordFactory.create(
+            object__object_type=self.object_type,
+            data={"name": "some", "secret": "value"},
+            version=1,
+        )
+
+        response = self.client.get(self.url, {"type": self.object_type_url})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(self.get_content(response)),
+            {
+                "url": f"http://testserver{reverse('object-detail', args=[record.object.uuid])}",
+                "record": {"data": {"name": "some"}},
+            },
+        )
+
+    def test_export_without_permission(self):
+        ObjectRecordFactory.create(object__object_type=self.object_type)
+
+        response = self.client.get(self.url, {"type": self.object_type_url})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_content(response), "")
+
+    def test_export_without_type(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(get_validation_errors(response, "type")["code"], "required")
+
+    def test_export_invalid_format(self):
+        response = self.client.get(
+            self.url, {"type": self.object_type_url, "exportFormat": "xml"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            get_validation_errors(response, "exportFormat")["code"], "invalid_choice"
+        )
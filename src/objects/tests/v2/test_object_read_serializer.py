@@ -0,0 +1,121 @@
+from datetime import date, timedelta
+
+from django.http import QueryDict
+from django.test import TestCase
+
+from objects.api.export import get_export_request
+from objects.api.serializers import ObjectReadSerializer, ObjectSerializer
+from objects.api.v2.views import ObjectViewSet
+from objects.core.tests.factories import (
+    ObjectFactory,
+    ObjectRecordFactory,
+    ObjectTypeFactory,
+    ReferenceFactory,
+)
+from objects.token.constants import PermissionModes
+from objects.token.tests.factories import PermissionFactory
+
+
+class ObjectReadSerializerParityTests(TestCase):
+    """
+    The read-only serializer must have the same output as `ObjectSerializer`
+    """
+
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        object1, object2 = ObjectFactory.create_batch(2, object_type=cls.object_type)
+
+        record = ObjectRecordFactory.create(
+            object=object1,
+            version=1,
+            data={"name": "some", "nested": {"value": 1, "list": [1, 2]}},
+        )
+        ReferenceFactory.create_batch(2, record=record)
+
+        corrected_record = ObjectRecordFactory.create(
+            object=object2,
+            version=1,
+            geometry=None,
+            start_at=date.today() - timedelta(days=2),
+        )
+        ObjectRecordFactory.create(
+            object=object2,
+            version=2,
+            start_at=date.today() - timedelta(days=1),
+            correct=corrected_record,
+        )
+        # records of other object types have a different type url
+        cls.other_record = ObjectRecordFactory.create(data={})
+
+    def setUp(self):
+        super().setUp()
+
+        self.request = get_export_request()
+
+    def assertSameRepresentation(self):
+        records = list(ObjectViewSet.queryset.all())
+        context = {"request": self.request}
+
+        serializer = ObjectSerializer(records, many=True, context=context)
+        read_serializer = ObjectReadSerializer(records, many=True, context=context)
+
+        self.assertEqual(read_serializer.data, serializer.data)
+        self.assertEqual(
+            read_serializer.child.not_allowed, serializer.child.not_allowed
+        )
+
+        for record in records:
+            with self.subTest(record=record):
+                self.assertEqual(
+                    ObjectReadSerializer(record, context=context).data,
+                    ObjectSerializer(record, context=context).data,
+                )
+
+    def test_all_fields(self):
+        self.assertSameRepresentation()
+
+    def test_query_fields(self):
+        self.request._request.GET = QueryDict(
+            "fields=uuid,record__data__nested__value,record__correctedBy"
+        )
+
+        self.assertSameRepresentation()
+
+    def test_field_based_authorization(self):
+        permission = PermissionFactory.create(
+            object_type=self.object_type,
+            mode=PermissionModes.read_only,
+            use_fields=True,
+            fields={
+                "1": ["url", "type", "record__data__name", "record__geometry"],
+                "2": ["uuid", "record__startAt", "record__correctionFor"],
+            },
+        )
+        PermissionFactory.create(
+            token_auth=permission.token_auth,
+            object_type=self.other_record._object_type,
+        )
+        self.request.auth = permission.token_auth
+
+        self.assertSameRepresentation()
+
+    def test_field_based_authorization_with_query_fields(self):
+        permission = PermissionFactory.create(
+            object_type=self.object_type,
+            mode=PermissionModes.read_only,
+            use_fields=True,
+            fields={"1": ["url", "record__data"], "2": ["uuid", "record"]},
+        )
+        PermissionFactory.create(
+            token_auth=permission.token_auth,
+            object_type=self.other_record._object_type,
+        )
+        self.request.auth = permission.token_auth
+        self.request._request.GET = QueryDict("fields=record__data__name")
+
+        self.assertSameRepresentation()
@@ -1,14 +1,16 @@
 from datetime import date
 
+from django.test import override_settings
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from objects.core.tests.factories import ObjectRecordFactory, ObjectTypeFactory
 from objects.token.constants import PermissionModes
 from objects.token.tests.factories import PermissionFactory
-from objects.utils.test import TokenAuthMixin
+from objects.utils.test import ClearCachesMixin, TokenAuthMixin
 
-from .utils import reverse_lazy
+from .utils import reverse, reverse_lazy
 
 
 class FilterObjectTypeTests(TokenAuthMixin, APITestCase):
@@ -47,3 +49,202 @@ class FilterObjectTypeTests(TokenAuthMixin, APITestCase):
 
         self.assertEqual(data["count"], 10)
         self.assertEqual(data["next"], f"http://testserver{self.url}?page=2&pageSize=5")
+
+
+class CursorPaginationTests(TokenAuthMixin, APITestCase):
+    url = reverse_lazy("object-list")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        PermissionFactory.create(
+            object_type=cls.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=cls.token_auth,
+        )
+
+    def _get_all_pages(self, params: dict) -> list[dict]:
+        results = []
+        response = self.client.get(self.url, {"cursor": "", **params})
+
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertNotIn("count", data)
+            self.assertIsNone(data["previous"])
+            results += data["results"]
+
+            if not data["next"]:
+                return results
+
+            response = self.client.get(data["next"])
+
+    def test_list_with_cursor(self):
+        records = ObjectRecordFactory.create_batch(
+            7, object__object_type=self.object_type, start_at=date.today()
+        )
+
+        results = self._get_all_pages({"pageSize": 3})
+
+        self.assertEqual(
+            [result["uuid"] for result in results],
+            [str(record.object.uuid) for record in reversed(records)],
+        )
+
+    def test_list_with_cursor_and_json_ordering(self):
+        for value in [3, 1, 2, 1]:
+            ObjectRecordFactory.create(
+                object__object_type=self.object_type,
+                start_at=date.today(),
+                data={"nested": {"value": value}},
+            )
+        # records without the ordered attribute are sorted last
+        ObjectRecordFactory.create_batch(
+            2,
+            object__object_type=self.object_type,
+            start_at=date.today(),
+            data={"nested": {}},
+        )
+
+        for ordering in ["record__data__nested__value", "-record__data__nested__value"]:
+            with self.subTest(ordering=ordering):
+                expected = self.client.get(self.url, {"ordering": ordering}).json()
+
+                results = self._get_all_pages({"pageSize": 2, "ordering": ordering})
+
+                self.assertEqual(len(results), 6)
+                self.assertEqual(
+                    [result["record"]["data"] for result in results],
+                    [result["record"]["data"] for result in expected["results"]],
+                )
+                self.assertEqual(len({result["uuid"] for result in results}), 6)
+
+    def test_list_with_cursor_and_json_null_ordering(self):
+        # JSON null values are sorted before the other values, and differ from
+        # missing attributes which are sorted last
+        for nested in [{"value": 2}, {"value": None}, {}, {"value": 1}]:
+            ObjectRecordFactory.create_batch(
+                2,
+                object__object_type=self.object_type,
+                start_at=date.today(),
+                data={"nested": nested},
+            )
+
+        for ordering in ["record__data__nested__value", "-record__data__nested__value"]:
+            with self.subTest(ordering=ordering):
+                expected = self.client.get(self.url, {"ordering": ordering}).json()
+
+                for page_size in [1, 3]:
+                    results = self._get_all_pages(
+                        {"pageSize": page_size, "ordering": ordering}
+                    )
+
+                    self.assertEqual(
+                        [result["record"]["data"] for result in results],
+                        [result["record"]["data"] for result in expected["results"]],
+                    )
+                    self.assertEqual(len({result["uuid"] for result in results}), 8)
+
+    def test_history_with_cursor(self):
+        record = ObjectRecordFactory.create(
+            object__object_type=self.object_type, start_at=date(2020, 1, 1)
+        )
+        for _ in range(4):
+            ObjectRecordFactory.create(object=record.object, start_at=date(2020, 1, 1))
+        url = reverse("object-history", args=[record.object.uuid])
+
+        response = self.client.get(url, {"cursor": "", "pageSize": 3})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual([r["index"] for r in data["results"]], [1, 2, 3])
+
+        response = self.client.get(data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual([r["index"] for r in data["results"]], [4, 5])
+        self.assertIsNone(data["next"])
+
+    def test_invalid_cursor(self):
+        ObjectRecordFactory.create(
+            object__object_type=self.object_type, start_at=date.today()
+        )
+
+        response = self.client.get(self.url, {"cursor": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(OBJECTS_COUNT_EXACT_THRESHOLD=2)
+class CountStrategyTests(ClearCachesMixin, TokenAuthMixin, APITestCase):
+    url = reverse_lazy("object-list")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        PermissionFactory.create(
+            object_type=cls.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=cls.token_auth,
+        )
+        ObjectRecordFactory.create_batch(
+            3, object__object_type=cls.object_type, start_at=date.today()
+        )
+
+    @override_settings(OBJECTS_COUNT_STRATEGY="exact")
+    def test_exact_count(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 3)
+        self.assertNotIn("X-Approximate-Count", response)
+
+    @override_settings(OBJECTS_COUNT_STRATEGY="estimate")
+    def test_estimated_count(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreaterEqual(response.json()["count"], 3)
+        self.assertEqual(response["X-Approximate-Count"], "estimate")
+
+    @override_settings(OBJECTS_COUNT_STRATEGY="estimate")
+    def test_count_below_threshold_is_exact(self):
+        response = self.client.get(self.url, {"data_attr": "unknown__exact__value"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 0)
+        self.assertNotIn("X-Approximate-Count", response)
+
+    @override_settings(OBJECTS_COUNT_STRATEGY="cached")
+    def test_cached_count(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 3)
+        self.assertNotIn("X-Approximate-Count", response)
+
+        ObjectRecordFactory.create(
+            object__object_type=self.object_type, start_at=date.today()
+        )
+
+        with self.subTest("count is served from the cache"):
+            response = self.client.get(self.url, {"page": 2, "pageSize": 2})
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["count"], 3)
+            self.assertEqual(response["X-Approximate-Count"], "cached")
+
+        with self.subTest("other filters are not served from the cache"):
+            object_type_url = reverse("objecttype-detail", args=[self.object_type.uuid])
+            response = self.client.get(
+                self.url, {"type": f"http://testserver{object_type_url}"}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["count"], 4)
+            self.assertNotIn("X-Approximate-Count", response)
@@ -0,0 +1,207 @@
+from datetime import date
+from pathlib import Path
+
+from django.contrib.gis.geos import Point
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from objects.core.tests.factories import (
+    ObjectFactory,
+    ObjectRecordFactory,
+    ObjectTypeFactory,
+    ObjectTypeVersionFactory,
+    ReferenceFactory,
+)
+from objects.token.constants import PermissionModes
+from objects.token.tests.factories import PermissionFactory, TokenAuthFactory
+from objects.utils.test import QueryBudgetMixin, TokenAuthMixin
+
+from ..constants import GEO_WRITE_KWARGS, POLYGON_AMSTERDAM_CENTRUM
+from .utils import reverse
+
+# the number of objects of list scenarios, so a query per object exceeds the budget
+OBJECT_COUNT = 10
+
+
+class QueryBudgetTests(QueryBudgetMixin, TokenAuthMixin, APITestCase):
+    """
+    Number of queries per endpoint, which shouldn't depend on the number of objects.
+    """
+
+    query_budgets_file = Path(__file__).parent / "query_budgets.json"
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        ObjectTypeVersionFactory.create(object_type=cls.object_type)
+        PermissionFactory.create(
+            object_type=cls.object_type,
+            mode=PermissionModes.read_and_write,
+            token_auth=cls.token_auth,
+        )
+        cls.object_type_url = f"http://testserver{reverse('objecttype-detail', args=[cls.object_type.uuid])}"
+
+        cls.records = ObjectRecordFactory.create_batch(
+            OBJECT_COUNT,
+            object__object_type=cls.object_type,
+            version=1,
+            data={"name": "Name", "diameter": 20},
+            start_at=date(2020, 1, 1),
+            geometry=Point(4.905289, 52.369918),
+        )
+        for record in cls.records:
+            ReferenceFactory.create_batch(2, record=record)
+
+        # every record corrects the previous one, so the history has the
+        # `correctionFor` and `correctedBy` of all records
+        cls.history_object = ObjectFactory.create(object_type=cls.object_type)
+        previous_record = None
+        for day in range(1, OBJECT_COUNT + 1):
+            previous_record = ObjectRecordFactory.create(
+                object=cls.history_object,
+                version=1,
+                start_at=date(2020, 1, day),
+                correct=previous_record,
+            )
+
+    def get_record_data(self, **kwargs) -> dict:
+        return {
+            "typeVersion": 1,
+            "data": {"name": "Other", "diameter": 30},
+            "startAt": "2021-01-01",
+            "references": [
+                {"type": "zaak", "url": f"https://example.com/zaak/{i}"}
+                for i in range(OBJECT_COUNT)
+            ],
+            **kwargs,
+        }
+
+    def test_object_list(self):
+        with self.assertQueryBudget("object_list"):
+            response = self.client.get(reverse("object-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], OBJECT_COUNT + 1)
+
+    def test_object_list_superuser(self):
+        token_auth = TokenAuthFactory.create(is_superuser=True)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token_auth.token}")
+
+        with self.assertQueryBudget("object_list_superuser"):
+            response = self.client.get(reverse("object-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], OBJECT_COUNT + 1)
+
+    def test_object_list_field_based_token(self):
+        token_auth = TokenAuthFactory.create()
+        PermissionFactory.create(
+            object_type=self.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=token_auth,
+            use_fields=True,
+            fields={"1": ["url", "type", "record__data__name"]},
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token_auth.token}")
+
+        with self.assertQueryBudget("object_list_field_based_token"):
+            response = self.client.get(reverse("object-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], OBJECT_COUNT + 1)
+
+    def test_object_retrieve(self):
+        url = reverse("object-detail", args=[self.records[0].object.uuid])
+
+        with self.assertQueryBudget("object_retrieve"):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_object_history(self):
+        url = reverse("object-history", args=[self.history_object.uuid])
+
+        with self.assertQueryBudget("object_history"):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], OBJECT_COUNT)
+
+    def test_object_search_geometry(self):
+        with self.assertQueryBudget("object_search_geometry"):
+            response = self.client.post(
+                reverse("object-search"),
+                {
+                    "geometry": {
+                        "within": {
+                            "type": "Polygon",
+                            "coordinates": [POLYGON_AMSTERDAM_CENTRUM],
+                        }
+                    },
+                    "type": self.object_type_url,
+                },
+                **GEO_WRITE_KWARGS,
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], OBJECT_COUNT)
+
+    def test_object_create(self):
+        data = {"type": self.object_type_url, "record": self.get_record_data()}
+
+        with self.assertQueryBudget("object_create"):
+            response = self.client.post(
+                reverse("object-list"), data, **GEO_WRITE_KWARGS
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_object_update(self):
+        url = reverse("object-detail", args=[self.history_object.uuid])
+        data = {"type": self.object_type_url, "record": self.get_record_data()}
+
+        with self.assertQueryBudget("object_update"):
+            response = self.client.put(url, data, **GEO_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_object_partial_update(self):
+        url = reverse("object-detail", args=[self.history_object.uuid])
+        data = {"record": {"data": {"diameter": 40}, "startAt": "2021-01-01"}}
+
+        with self.assertQueryBudget("object_partial_update"):
+            response = self.client.patch(url, data, **GEO_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_object_destroy(self):
+        url = reverse("object-detail", args=[self.records[0].object.uuid])
+
+        with self.assertQueryBudget("object_destroy"):
+            response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_objecttype_list(self):
+        for object_type in ObjectTypeFactory.create_batch(OBJECT_COUNT):
+            ObjectTypeVersionFactory.create_batch(2, object_type=object_type)
+
+        with self.assertQueryBudget("objecttype_list"):
+            response = self.client.get(reverse("objecttype-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_permission_list(self):
+        for object_type in ObjectTypeFactory.create_batch(OBJECT_COUNT):
+            PermissionFactory.create(
+                object_type=object_type, token_auth=self.token_auth
+            )
+
+        with self.assertQueryBudget("permission_list"):
+            response = self.client.get(reverse("permission-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], OBJECT_COUNT + 1)
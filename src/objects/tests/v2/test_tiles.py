@@ -0,0 +1,115 @@
+from datetime import date, timedelta
+
+from django.contrib.gis.geos import Point
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from objects.api.tiles import CONTENT_TYPE, get_tile_bbox
+from objects.core.tests.factories import (
+    ObjectFactory,
+    ObjectRecordFactory,
+    ObjectTypeFactory,
+)
+from objects.token.constants import PermissionModes
+from objects.token.tests.factories import PermissionFactory
+from objects.utils.test import TokenAuthMixin
+
+from .utils import reverse
+
+# the tile of the centre of Amsterdam at zoom level 14
+TILE = {"z": 14, "x": 8415, "y": 5384}
+
+
+class TileTests(TokenAuthMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.object_type = ObjectTypeFactory.create()
+        cls.permission = PermissionFactory.create(
+            object_type=cls.object_type,
+            mode=PermissionModes.read_only,
+            token_auth=cls.token_auth,
+        )
+        cls.url = reverse(
+            "objecttype-tile", kwargs={"uuid": cls.object_type.uuid, **TILE}
+        )
+
+    def test_tile(self):
+        record = ObjectRecordFactory.create(
+            object__object_type=self.object_type, geometry=Point(4.905289, 52.369918)
+        )
+        # outside of the tile
+        outside = ObjectRecordFactory.create(
+            object__object_type=self.object_type, geometry=Point(4.905650, 52.357621)
+        )
+        # the previous record of the object was in the tile
+        moved = ObjectFactory.create(object_type=self.object_type)
+        ObjectRecordFactory.create(
+            object=moved,
+            geometry=Point(4.905289, 52.369918),
+            start_at=date.today() - timedelta(days=2),
+        )
+        ObjectRecordFactory.create(
+            object=moved,
+            geometry=Point(4.905650, 52.357621),
+            start_at=date.today() - timedelta(days=1),
+        )
+        # another object type
+        other = ObjectRecordFactory.create(geometry=Point(4.905289, 52.369918))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], CONTENT_TYPE)
+        # the strings of the tile are encoded as UTF-8
+        self.assertIn(str(record.object.uuid).encode(), response.content)
+        for excluded in [outside.object, moved, other.object]:
+            with self.subTest(uuid=excluded.uuid):
+                self.assertNotIn(str(excluded.uuid).encode(), response.content)
+
+    def test_empty_tile(self):
+        ObjectRecordFactory.create(
+            object__object_type=self.object_type, geometry=Point(4.905650, 52.357621)
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response.content, b"")
+
+    def test_invalid_tile(self):
+        url = reverse(
+            "objecttype-tile",
+            kwargs={"uuid": self.object_type.uuid, "z": 1, "x": 2, "y": 0},
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_no_permission(self):
+        self.permission.delete()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_field_based_permission(self):
+        self.permission.use_fields = True
+        self.permission.fields = {"1": ["uuid"]}
+        self.permission.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_tile_bbox(self):
+        bbox = get_tile_bbox(**TILE)
+
+        self.assertEqual(bbox.srid, 4326)
+        self.assertTrue(bbox.contains(Point(4.905289, 52.369918)))
+        self.assertFalse(bbox.contains(Point(4.905650, 52.357621)))
+        self.assertAlmostEqual(bbox.extent[0], 4.89990234375)
+        self.assertAlmostEqual(bbox.extent[2], 4.921875)
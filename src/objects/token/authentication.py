@@ -6,10 +6,11 @@ from rest_framework.authentication import TokenAuthentication as _TokenAuthentic
 
 class TokenAuthentication(_TokenAuthentication):
     def authenticate_credentials(self, key):
+        from .cache import get_token_auth
         from .models import TokenAuth
 
         try:
-            token = TokenAuth.objects.get(token=key)
+            token = get_token_auth(key)
         except TokenAuth.DoesNotExist:
             raise exceptions.AuthenticationFailed(_("Invalid token."))
 
@@ -0,0 +1,90 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from objects.token import models
+
+# process-local cache of tokens with their permissions, keyed by token digest
+_token_cache: dict[str, tuple[float, "models.TokenAuth"]] = {}
+
+# version of the tokens in the shared cache, which is incremented to clear all of them
+VERSION_KEY = "objects:token:version"
+
+
+def _get_cache_key(token: str) -> str:
+    # the token itself is not used in the key to keep it out of the shared cache
+    return f"objects:token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def _get_version() -> int | None:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # the version starts at the current time, so tokens which were cached before
+        # the version was evicted from the cache are not used again
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def _increment_version() -> None:
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def _fetch_token_auth(token: str) -> "models.TokenAuth":
+    token_auth = models.TokenAuth.objects.prefetch_related("permissions").get(
+        token=token
+    )
+    # evaluate the permissions, so they are stored in the cache as well
+    token_auth.object_type_permissions  # noqa: B018
+    return token_auth
+
+
+def get_token_auth(token: str) -> "models.TokenAuth":
+    """
+    Return the token authorization with its permissions for a token.
+
+    Tokens are cached for ``OBJECTS_TOKEN_CACHE_TIMEOUT`` seconds, in each process
+    or in the shared cache if ``OBJECTS_TOKEN_CACHE_SHARED`` is enabled.
+    Raises ``TokenAuth.DoesNotExist`` for unknown tokens, which are not cached.
+    """
+    timeout = settings.OBJECTS_TOKEN_CACHE_TIMEOUT
+    if not timeout:
+        return _fetch_token_auth(token)
+
+    key = _get_cache_key(token)
+    if settings.OBJECTS_TOKEN_CACHE_SHARED:
+        version = _get_version()
+        if (token_auth := cache.get(key, version=version)) is None:
+            token_auth = _fetch_token_auth(token)
+            cache.set(key, token_auth, timeout=timeout, version=version)
+        return token_auth
+
+    if (cached := _token_cache.get(key)) and cached[0] > time.monotonic():
+        return cached[1]
+
+    token_auth = _fetch_token_auth(token)
+    _token_cache[key] = (time.monotonic() + timeout, token_auth)
+    return token_auth
+
+
+def clear_token_auth(*tokens: str) -> None:
+    """
+    Remove the cached token authorizations of the tokens, or all of them if no
+    tokens are provided
+    """
+    if not tokens:
+        _token_cache.clear()
+        if settings.OBJECTS_TOKEN_CACHE_SHARED:
+            _increment_version()
+        return
+
+    keys = [_get_cache_key(token) for token in tokens if token]
+    for key in keys:
+        _token_cache.pop(key, None)
+    if settings.OBJECTS_TOKEN_CACHE_SHARED:
+        cache.delete_many(keys, version=_get_version())
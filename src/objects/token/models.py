@@ -1,4 +1,5 @@
 import secrets
+from functools import cached_property
 
 from django.core import exceptions
 from django.db import models
@@ -8,6 +9,7 @@ from objects.core.models import ObjectType
 from objects.token.validators import validate_no_empty, validate_no_whitespace
 
 from .constants import PermissionModes
+from .query import TokenCacheQuerySet
 
 
 class TokenAuth(models.Model):
@@ -68,6 +70,8 @@ class TokenAuth(models.Model):
         help_text=_("Object types which can be accessed"),
     )
 
+    objects = TokenCacheQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("token authorization")
         verbose_name_plural = _("token authorizations")
@@ -78,15 +82,21 @@ class TokenAuth(models.Model):
     def save(self, *args, **kwargs):
         if not self.token:
             self.token = self.generate_token()
-        return super().save(*args, **kwargs)
+
+        super().save(*args, **kwargs)
 
     def generate_token(self):
         return secrets.token_hex(20)
 
+    @cached_property
+    def object_type_permissions(self) -> dict[int, "Permission"]:
+        return {
+            permission.object_type_id: permission
+            for permission in self.permissions.all()
+        }
+
     def get_permission_for_object_type(self, object_type: ObjectType):
-        if not self.permissions.filter(object_type=object_type).exists():
-            return None
-        return self.permissions.get(object_type=object_type)
+        return self.object_type_permissions.get(object_type.pk)
 
 
 class Permission(models.Model):
@@ -116,6 +126,8 @@ class Permission(models.Model):
         ),
     )
 
+    objects = TokenCacheQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("permission")
         verbose_name_plural = _("permissions")
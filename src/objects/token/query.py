@@ -0,0 +1,35 @@
+from django.db import models, transaction
+
+from .cache import clear_token_auth
+
+
+class TokenCacheQuerySet(models.QuerySet):
+    """
+    Clear all cached token authorizations after bulk changes, which don't send the
+    signals that clear the cache of the changed tokens (see ``objects.token.signals``)
+    """
+
+    def _clear_token_auth(self) -> None:
+        clear_token_auth()
+        transaction.on_commit(clear_token_auth, using=self.db)
+
+    def update(self, **kwargs):
+        result = super().update(**kwargs)
+        self._clear_token_auth()
+        return result
+
+    update.alters_data = True
+
+    def bulk_create(self, *args, **kwargs):
+        result = super().bulk_create(*args, **kwargs)
+        self._clear_token_auth()
+        return result
+
+    bulk_create.alters_data = True
+
+    def bulk_update(self, *args, **kwargs):
+        result = super().bulk_update(*args, **kwargs)
+        self._clear_token_auth()
+        return result
+
+    bulk_update.alters_data = True
@@ -0,0 +1,62 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import clear_token_auth
+from .models import Permission, TokenAuth
+
+# The cached token authorizations are cleared with signals, which are also sent for
+# the objects deleted by cascades (e.g. the permissions of a deleted object type).
+# They are cleared immediately and once the transaction is committed, so requests
+# which are handled meanwhile don't cache the previous state again.
+
+
+def _clear_token_auth(*tokens: str) -> None:
+    clear_token_auth(*tokens)
+    transaction.on_commit(partial(clear_token_auth, *tokens))
+
+
+@receiver(pre_save, sender=TokenAuth, dispatch_uid="token_auth.get_previous_token")
+def get_previous_token(sender: type[TokenAuth], instance: TokenAuth, **kwargs) -> None:
+    # the previous token should no longer be accepted if the token is changed
+    instance._previous_token = (
+        TokenAuth.objects.filter(pk=instance.pk).values_list("token", flat=True).first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=TokenAuth, dispatch_uid="token_auth.clear_cache")
+def clear_token_auth_on_save(
+    sender: type[TokenAuth], instance: TokenAuth, **kwargs
+) -> None:
+    _clear_token_auth(instance.token, getattr(instance, "_previous_token", None))
+
+
+@receiver(post_delete, sender=TokenAuth, dispatch_uid="token_auth.clear_cache_delete")
+def clear_token_auth_on_delete(
+    sender: type[TokenAuth], instance: TokenAuth, **kwargs
+) -> None:
+    _clear_token_auth(instance.token)
+
+
+@receiver(post_save, sender=Permission, dispatch_uid="permission.clear_cache")
+@receiver(post_delete, sender=Permission, dispatch_uid="permission.clear_cache_delete")
+def clear_permission_token_auth(
+    sender: type[Permission], instance: Permission, **kwargs
+) -> None:
+    if Permission.token_auth.is_cached(instance):
+        token = instance.token_auth.token
+    else:
+        # the token may be deleted already by the same cascade, in which case it's
+        # cleared by its own signal
+        token = (
+            TokenAuth.objects.filter(pk=instance.token_auth_id)
+            .values_list("token", flat=True)
+            .first()
+        )
+
+    if token:
+        _clear_token_auth(token)
@@ -0,0 +1,158 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from objects.core.tests.factories import ObjectTypeFactory
+
+from ..cache import clear_token_auth, get_token_auth
+from ..constants import PermissionModes
+from ..models import Permission, TokenAuth
+from .factories import PermissionFactory
+
+
+class TokenAuthCacheTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_token_auth()
+        self.addCleanup(clear_token_auth)
+
+        self.permission = PermissionFactory.create(mode=PermissionModes.read_only)
+        self.token_auth = self.permission.token_auth
+        self.object_type = self.permission.object_type
+
+    def test_token_is_cached(self):
+        other_object_type = ObjectTypeFactory.create()
+        get_token_auth(self.token_auth.token)
+
+        with self.assertNumQueries(0):
+            token_auth = get_token_auth(self.token_auth.token)
+            permission = token_auth.get_permission_for_object_type(self.object_type)
+            no_permission = token_auth.get_permission_for_object_type(other_object_type)
+
+        self.assertEqual(token_auth, self.token_auth)
+        self.assertEqual(permission, self.permission)
+        self.assertIsNone(no_permission)
+
+    @override_settings(OBJECTS_TOKEN_CACHE_TIMEOUT=0)
+    def test_token_cache_disabled(self):
+        get_token_auth(self.token_auth.token)
+
+        with self.assertNumQueries(2):
+            get_token_auth(self.token_auth.token)
+
+    @override_settings(OBJECTS_TOKEN_CACHE_SHARED=True)
+    def test_shared_token_cache(self):
+        self.addCleanup(cache.clear)
+
+        get_token_auth(self.token_auth.token)
+
+        with self.assertNumQueries(0):
+            token_auth = get_token_auth(self.token_auth.token)
+
+        self.assertEqual(
+            token_auth.get_permission_for_object_type(self.object_type),
+            self.permission,
+        )
+
+        self.permission.delete()
+
+        token_auth = get_token_auth(self.token_auth.token)
+        self.assertIsNone(token_auth.get_permission_for_object_type(self.object_type))
+
+    def test_unknown_token(self):
+        with self.assertRaises(TokenAuth.DoesNotExist):
+            get_token_auth("unknown")
+
+    def test_token_is_invalidated_on_token_change(self):
+        previous_token = self.token_auth.token
+        get_token_auth(previous_token)
+
+        self.token_auth.token = "new-token"
+        self.token_auth.save()
+
+        with self.assertRaises(TokenAuth.DoesNotExist):
+            get_token_auth(previous_token)
+
+    def test_token_is_invalidated_on_token_delete(self):
+        get_token_auth(self.token_auth.token)
+
+        self.token_auth.delete()
+
+        with self.assertRaises(TokenAuth.DoesNotExist):
+            get_token_auth(self.token_auth.token)
+
+    def test_token_is_invalidated_on_permission_save(self):
+        get_token_auth(self.token_auth.token)
+
+        self.permission.mode = PermissionModes.read_and_write
+        self.permission.save()
+        other_permission = PermissionFactory.create(token_auth=self.token_auth)
+
+        token_auth = get_token_auth(self.token_auth.token)
+        self.assertEqual(
+            token_auth.get_permission_for_object_type(self.object_type).mode,
+            PermissionModes.read_and_write,
+        )
+        self.assertEqual(
+            token_auth.get_permission_for_object_type(other_permission.object_type),
+            other_permission,
+        )
+
+    def test_token_is_invalidated_on_permission_delete(self):
+        get_token_auth(self.token_auth.token)
+
+        self.permission.delete()
+
+        token_auth = get_token_auth(self.token_auth.token)
+        self.assertIsNone(token_auth.get_permission_for_object_type(self.object_type))
+
+    def test_token_is_invalidated_on_queryset_delete(self):
+        get_token_auth(self.token_auth.token)
+
+        TokenAuth.objects.filter(pk=self.token_auth.pk).delete()
+
+        with self.assertRaises(TokenAuth.DoesNotExist):
+            get_token_auth(self.token_auth.token)
+
+    def test_token_is_invalidated_on_queryset_update(self):
+        previous_token = self.token_auth.token
+        get_token_auth(previous_token)
+
+        TokenAuth.objects.filter(pk=self.token_auth.pk).update(token="new-token")
+
+        with self.assertRaises(TokenAuth.DoesNotExist):
+            get_token_auth(previous_token)
+
+    def test_token_is_invalidated_on_object_type_delete(self):
+        get_token_auth(self.token_auth.token)
+
+        # the permission is deleted by the cascade
+        self.object_type.delete()
+
+        token_auth = get_token_auth(self.token_auth.token)
+        self.assertEqual(token_auth.object_type_permissions, {})
+
+    @override_settings(OBJECTS_TOKEN_CACHE_SHARED=True)
+    def test_shared_token_cache_is_invalidated_on_queryset_update(self):
+        self.addCleanup(cache.clear)
+        get_token_auth(self.token_auth.token)
+
+        Permission.objects.filter(pk=self.permission.pk).update(
+            mode=PermissionModes.read_and_write
+        )
+
+        token_auth = get_token_auth(self.token_auth.token)
+        self.assertEqual(
+            token_auth.get_permission_for_object_type(self.object_type).mode,
+            PermissionModes.read_and_write,
+        )
+
+    @override_settings(OBJECTS_TOKEN_CACHE_SHARED=True)
+    def test_shared_token_cache_is_invalidated_on_queryset_delete(self):
+        self.addCleanup(cache.clear)
+        get_token_auth(self.token_auth.token)
+
+        TokenAuth.objects.filter(pk=self.token_auth.pk).delete()
+
+        with self.assertRaises(TokenAuth.DoesNotExist):
+            get_token_auth(self.token_auth.token)
@@ -12,7 +12,9 @@ from vng_api_common.constants import VERSION_HEADER
 from vng_api_common.geo import DEFAULT_CRS, HEADER_ACCEPT, HEADER_CONTENT
 from vng_api_common.schema import HTTP_STATUS_CODE_TITLES
 
+from objects.api.constants import CountStrategies
 from objects.api.mixins import GeoMixin
+from objects.api.pagination import ChangeFeedPagination, OptionalCursorPagination
 
 from .serializers import DynamicFieldsMixin
 
@@ -48,6 +50,7 @@ class AutoSchema(_AutoSchema):
         version_headers = self.get_version_headers()
         parent_path_headers = self.get_parent_path_headers()
         field_params = self.get_fields_params()
+        count_headers = self.get_count_headers()
         return (
             params
             + geo_headers
@@ -55,11 +58,12 @@ class AutoSchema(_AutoSchema):
             + version_headers
             + parent_path_headers
             + field_params
+            + count_headers
         )
 
     def _get_filter_parameters(self):
-        """remove filter parameters from all actions except LIST"""
-        if self.view.action != "list":
+        """remove filter parameters from all actions except LIST and EXPORT"""
+        if self.view.action not in ("list", "export"):
             return []
         return super()._get_filter_parameters()
 
@@ -190,6 +194,30 @@ class AutoSchema(_AutoSchema):
 
         return []
 
+    def get_count_headers(self) -> list[OpenApiParameter]:
+        pagination_class = getattr(self.view, "pagination_class", None)
+        if not (
+            pagination_class
+            and issubclass(pagination_class, OptionalCursorPagination)
+            and not issubclass(pagination_class, ChangeFeedPagination)
+            and self._is_list_view()
+        ):
+            return []
+
+        return [
+            OpenApiParameter(
+                name=settings.APPROXIMATE_COUNT_HEADER,
+                type=str,
+                location=OpenApiParameter.HEADER,
+                response=[200],
+                enum=[CountStrategies.estimate.value, CountStrategies.cached.value],
+                description=_(
+                    "Indicates that the `count` in the response is approximate and "
+                    "how it was determined. Only present if the count is approximate."
+                ),
+            )
+        ]
+
     def _get_request_body(self, direction="request"):
         """update search request body with filter parameters"""
         request_body = super()._get_request_body(direction)
@@ -1,13 +1,113 @@
+import hashlib
+import time
+from collections.abc import Iterator
 from uuid import UUID
 
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.exceptions import ImproperlyConfigured
+
 import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 from zgw_consumers.client import build_client
 from zgw_consumers.nlx import NLXClient
 from zgw_consumers.service import pagination_helper
 from zgw_consumers.utils import PaginatedResponseData
 
 
+def get_response_cache() -> BaseCache | None:
+    """
+    Return the cache of the responses of the Objecttypes API, configured with
+    ``OBJECTTYPES_CLIENT_CACHE``.
+    """
+    match settings.OBJECTTYPES_CLIENT_CACHE:
+        case "redis":
+            return caches["default"]
+        case "disk":
+            return FileBasedCache(settings.OBJECTTYPES_CLIENT_CACHE_DIR, {})
+        case "":
+            return None
+    raise ImproperlyConfigured(
+        f"Unknown OBJECTTYPES_CLIENT_CACHE: {settings.OBJECTTYPES_CLIENT_CACHE!r}"
+    )
+
+
+def _get_cache_key(url: str) -> str:
+    return f"objects:objecttypes:{hashlib.sha256(url.encode()).hexdigest()}"
+
+
+def _build_cached_response(
+    request: requests.PreparedRequest, cached: dict[str, object]
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict(cached["headers"])
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = cached["url"]
+    response.request = request
+    response._content = cached["content"]
+    return response
+
+
 class ObjecttypesClient(NLXClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.response_cache = get_response_cache()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """
+        Send the request, or return its cached response if ``OBJECTTYPES_CLIENT_CACHE``
+        is configured.
+
+        Cached responses are used for ``OBJECTTYPES_CLIENT_CACHE_TIMEOUT`` seconds,
+        afterwards the request is conditional on their ``ETag`` and they're used again
+        if the Objecttypes API responds with ``304 Not Modified``. Requests with the
+        ``Cache-Control: no-cache`` header are always sent without the cache.
+        """
+        if (
+            self.response_cache is None
+            or request.method != "GET"
+            or kwargs.get("stream")
+            or "no-cache" in request.headers.get("Cache-Control", "")
+        ):
+            return super().send(request, **kwargs)
+
+        key = _get_cache_key(request.url)
+        cached = self.response_cache.get(key)
+        if cached and cached["expires_at"] > time.time():
+            return _build_cached_response(request, cached)
+
+        if cached and cached["etag"]:
+            request.headers["If-None-Match"] = cached["etag"]
+
+        response = super().send(request, **kwargs)
+        if cached and response.status_code == 304:
+            response.close()
+            self._cache_response(key, cached)
+            return _build_cached_response(request, cached)
+
+        if response.status_code == 200:
+            self._cache_response(
+                key,
+                {
+                    "url": response.url,
+                    "headers": dict(response.headers),
+                    "content": response.content,
+                    "etag": response.headers.get("ETag"),
+                },
+            )
+        return response
+
+    def _cache_response(self, key: str, cached: dict[str, object]) -> None:
+        timeout = settings.OBJECTTYPES_CLIENT_CACHE_TIMEOUT
+        cached["expires_at"] = time.time() + timeout
+        # responses with an ETag are kept longer, to revalidate them after they expire
+        if cached["etag"]:
+            timeout = max(timeout, settings.OBJECTTYPES_CLIENT_CACHE_MAX_AGE)
+        self.response_cache.set(key, cached, timeout=timeout)
+
     def _get_paginated(
         self,
         endpoint: str,
@@ -35,7 +135,8 @@ class ObjecttypesClient(NLXClient):
     @property
     def can_connect(self) -> bool:
         try:
-            response = self.get("objecttypes")
+            # a cached response doesn't tell whether the API can be reached
+            response = self.get("objecttypes", headers={"Cache-Control": "no-cache"})
             response.raise_for_status()
             return response.status_code == 200
         except requests.RequestException:
@@ -52,6 +153,21 @@ class ObjecttypesClient(NLXClient):
             page_size=page_size,
         )
 
+    def iter_objecttype_pages(
+        self, url: str = "objecttypes"
+    ) -> Iterator[tuple[list[dict[str, object]], str | None]]:
+        """
+        Yield the pages of objecttypes one at a time, with the URL of the next page,
+        starting at the page of ``url``.
+        """
+        next_url = url
+        while next_url:
+            response = self.get(next_url)
+            response.raise_for_status()
+            data: PaginatedResponseData[dict[str, object]] = response.json()
+            next_url = data.get("next")
+            yield data["results"], next_url
+
     def get_objecttype(
         self,
         objecttype_uuid: str | UUID,
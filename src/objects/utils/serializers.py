@@ -1,4 +1,5 @@
 from collections import defaultdict
+from typing import NamedTuple
 
 from glom import SKIP, GlomError, glom
 from rest_framework import fields, serializers
@@ -31,6 +32,91 @@ def build_spec_field(spec, name, value, ui):
         spec[name] = value if ui else spec_val
 
 
+class FieldPath(NamedTuple):
+    path: str
+    keys: tuple[str, ...]
+    # data attributes which are absent are skipped instead of raising an error
+    optional: bool
+
+
+def build_projection(fields) -> dict:
+    """
+    Compile the fields into a projection, which selects the same data as the
+    glom spec of ``build_spec`` without evaluating glom for every object
+    """
+    projection = {}
+    for projection_field in fields:
+        build_projection_field(
+            projection, name=projection_field, value=projection_field
+        )
+    return projection
+
+
+def build_projection_field(projection, name, value):
+    if "__" in name:
+        parent, field_name = name.split("__", 1)
+        projection[parent] = projection.get(parent, {})
+        build_projection_field(projection[parent], field_name, value)
+    else:
+        path = value.replace("__", ".")
+        projection[name] = FieldPath(
+            path=path,
+            keys=tuple(path.split(".")),
+            optional=value.startswith("record__data__"),
+        )
+
+
+def project(projection: dict, data: dict) -> dict:
+    """
+    Apply a projection of ``build_projection`` to the data. Raises ``GlomError`` if
+    a required field is absent
+    """
+    result = {}
+    for name, value in projection.items():
+        if isinstance(value, dict):
+            result[name] = project(value, data)
+            continue
+
+        target = data
+        for key in value.keys:
+            if not isinstance(target, dict) or key not in target:
+                # fall back to glom for other targets and its error messages
+                target = (
+                    glom(data, value.path, default=SKIP)
+                    if value.optional
+                    else glom(data, value.path)
+                )
+                break
+            target = target[key]
+
+        if target is not SKIP:
+            result[name] = target
+    return result
+
+
+def get_excluded_field_names(data: dict, projection: dict, prefix: str = "") -> set:
+    """
+    Return the names of the fields of the data, which are not selected by the
+    projection
+    """
+    excluded = set()
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        projection_value = projection.get(key)
+        if isinstance(projection_value, FieldPath):
+            continue
+
+        if projection_value is not None and isinstance(value, dict):
+            excluded |= get_excluded_field_names(
+                value, projection_value, prefix=f"{name}__"
+            )
+        elif projection_value is None and isinstance(value, dict):
+            excluded.update(f"{name}__{field}" for field in get_field_names(value))
+        else:
+            excluded.add(name)
+    return excluded
+
+
 def get_field_names(data: dict[str, fields.Field]) -> list[str]:
     """return list of names for all serializer fields. Supports nesting"""
     names_and_sources = get_field_names_and_sources(data)
@@ -73,16 +159,23 @@ class DynamicFieldsMixin:
     """
     this mixin allows selecting fields for serializer in the query param
     It also supports nested fields.
+
+    The projections of the allowed and requested fields are compiled once per
+    serializer, since they are the same for all objects of an object type version.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.not_allowed = NotAllowedDict(set)
+        self._projections: dict[tuple[str, ...], dict] = {}
+        self._not_allowed_keys: dict[tuple, str] = {}
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
+        return self.limit_fields(instance, data)
 
+    def limit_fields(self, instance, data: dict) -> dict:
         allowed_fields = self.get_allowed_fields(instance)
         query_fields = self.get_query_fields()
 
@@ -93,9 +186,9 @@ class DynamicFieldsMixin:
         if allowed_fields == ALL_FIELDS:
             allowed_data = data
         else:
-            spec_allowed = build_spec(allowed_fields)
+            projection_allowed = self.get_projection(allowed_fields)
             try:
-                allowed_data = glom(data, spec_allowed)
+                allowed_data = project(projection_allowed, data)
             except GlomError as exc:
                 raise serializers.ValidationError(
                     f"Fields in the configured authorization are absent in the data: {exc.args[0]}"
@@ -104,41 +197,43 @@ class DynamicFieldsMixin:
         #  limit allowed data to requested in fields= query param
         if not query_fields:
             result_data = allowed_data
-            not_allowed = set(get_field_names(data)) - set(get_field_names(result_data))
-            if not_allowed:
-                self.not_allowed[
-                    f"{
-                        self.context['request'].build_absolute_uri(
-                            reverse(
-                                'objecttype-detail', args=[instance._object_type.uuid]
-                            )
-                        )
-                    }({instance.version})"
-                ] |= not_allowed
+            not_allowed = get_excluded_field_names(data, projection_allowed)
         else:
-            spec_query = build_spec(query_fields)
+            projection_query = self.get_projection(query_fields)
             try:
-                result_data = glom(allowed_data, spec_query)
+                result_data = project(projection_query, allowed_data)
             except GlomError as exc:
                 raise serializers.ValidationError(
                     f"'fields' query parameter has invalid or unauthorized values: {exc.args[0]}"
                 )
-            not_allowed = set(get_field_names(glom(data, spec_query))) - set(
-                get_field_names(result_data)
+            # all requested fields are present if all fields are allowed
+            not_allowed = (
+                set(get_field_names(project(projection_query, data)))
+                - set(get_field_names(result_data))
+                if allowed_fields != ALL_FIELDS
+                else set()
             )
-            if not_allowed:
-                self.not_allowed[
-                    f"{
-                        self.context['request'].build_absolute_uri(
-                            reverse(
-                                'objecttype-detail', args=[instance._object_type.uuid]
-                            )
-                        )
-                    }({instance.version})"
-                ] |= not_allowed
+
+        if not_allowed:
+            self.not_allowed[self.get_not_allowed_key(instance)] |= not_allowed
 
         return result_data
 
+    def get_projection(self, fields: list) -> dict:
+        key = tuple(fields)
+        if key not in self._projections:
+            self._projections[key] = build_projection(fields)
+        return self._projections[key]
+
+    def get_not_allowed_key(self, instance) -> str:
+        key = (instance._object_type.uuid, instance.version)
+        if key not in self._not_allowed_keys:
+            object_type_url = self.context["request"].build_absolute_uri(
+                reverse("objecttype-detail", args=[instance._object_type.uuid])
+            )
+            self._not_allowed_keys[key] = f"{object_type_url}({instance.version})"
+        return self._not_allowed_keys[key]
+
     def get_query_fields(self) -> list:
         request = self.context.get("request")
         if not request:
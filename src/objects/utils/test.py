@@ -1,5 +1,15 @@
+import json
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
 from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from objects.token.cache import clear_token_auth
 from objects.token.tests.factories import TokenAuthFactory
 
 
@@ -15,6 +25,10 @@ class TokenAuthMixin:
     def setUp(self):
         super().setUp()
 
+        # permissions created in previous tests are rolled back
+        clear_token_auth()
+        self.addCleanup(clear_token_auth)
+
         self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token_auth.token}")
 
 
@@ -27,3 +41,69 @@ class ClearCachesMixin:
     def _clear_caches(self):
         for cache in caches.all():
             cache.clear()
+
+
+def _normalize_sql(sql: str) -> str:
+    # replace the parameters, so repeated queries are grouped
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    return re.sub(r"\b\d+\b", "?", sql)
+
+
+class QueryBudgetMixin:
+    """
+    Compare the number of queries of test scenarios with the budgets in
+    ``query_budgets_file``, which map scenario names to the maximum number of queries.
+
+    Set the ``UPDATE_QUERY_BUDGETS`` environment variable to record the current
+    number of queries as the budgets instead.
+    """
+
+    query_budgets_file: Path
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.update_query_budgets = bool(os.environ.get("UPDATE_QUERY_BUDGETS"))
+        cls.query_budgets = json.loads(cls.query_budgets_file.read_text())
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.update_query_budgets:
+            cls.query_budgets_file.write_text(
+                json.dumps(cls.query_budgets, indent=2, sort_keys=True) + "\n"
+            )
+
+        super().tearDownClass()
+
+    @contextmanager
+    def assertQueryBudget(self, scenario: str):
+        with CaptureQueriesContext(connection) as context:
+            yield
+
+        queries = context.captured_queries
+        if self.update_query_budgets:
+            self.query_budgets[scenario] = len(queries)
+            return
+
+        budget = self.query_budgets.get(scenario)
+        if budget is None:
+            self.fail(
+                f"No query budget for scenario '{scenario}' in "
+                f"{self.query_budgets_file.name}, run the tests with "
+                "UPDATE_QUERY_BUDGETS=1 to record it"
+            )
+
+        if len(queries) > budget:
+            self.fail(self._format_query_report(scenario, queries, budget))
+
+    def _format_query_report(self, scenario: str, queries: list, budget: int) -> str:
+        duration = sum(float(query["time"]) for query in queries) * 1000
+        counts = Counter(_normalize_sql(query["sql"]) for query in queries)
+        lines = [
+            f"Scenario '{scenario}' executed {len(queries)} queries, "
+            f"{len(queries) - budget} more than its budget of {budget} "
+            f"({duration:.1f}ms SQL time):",
+            *(f"{count:>4}x {sql}" for sql, count in counts.most_common()),
+        ]
+        return "\n".join(lines)
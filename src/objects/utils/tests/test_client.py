@@ -0,0 +1,166 @@
+import tempfile
+import uuid
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+
+import requests
+import requests_mock
+from freezegun import freeze_time
+from zgw_consumers.models import Service
+
+from objects.tests.utils import mock_objecttype, mock_objecttypes
+from objects.utils.client import get_objecttypes_client
+
+OBJECTTYPES_API_ROOT = "http://127.0.0.1:8000/api/v2/"
+
+
+@requests_mock.Mocker()
+class ObjecttypesClientCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.service = Service.objects.create(
+            api_root=OBJECTTYPES_API_ROOT, slug="objecttypes-api"
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+        self.uuid = str(uuid.uuid4())
+        self.url = f"{OBJECTTYPES_API_ROOT}objecttypes/{self.uuid}"
+
+    def _get_objecttype(self):
+        with get_objecttypes_client(self.service) as client:
+            return client.get_objecttype(self.uuid)
+
+    def test_no_cache(self, m):
+        m.get(self.url, json=mock_objecttype(self.url))
+
+        self._get_objecttype()
+        self._get_objecttype()
+
+        self.assertEqual(m.call_count, 2)
+
+    @override_settings(
+        OBJECTTYPES_CLIENT_CACHE="redis", OBJECTTYPES_CLIENT_CACHE_TIMEOUT=60
+    )
+    def test_cached(self, m):
+        m.get(self.url, json=mock_objecttype(self.url))
+
+        self._get_objecttype()
+        data = self._get_objecttype()
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(data, mock_objecttype(self.url))
+
+    @override_settings(
+        OBJECTTYPES_CLIENT_CACHE="redis", OBJECTTYPES_CLIENT_CACHE_TIMEOUT=0
+    )
+    def test_revalidated_with_etag(self, m):
+        m.get(
+            self.url,
+            [
+                {"json": mock_objecttype(self.url), "headers": {"ETag": '"1"'}},
+                {"status_code": 304, "headers": {"ETag": '"1"'}},
+            ],
+        )
+
+        self._get_objecttype()
+        data = self._get_objecttype()
+
+        self.assertEqual(m.call_count, 2)
+        self.assertNotIn("If-None-Match", m.request_history[0].headers)
+        self.assertEqual(m.request_history[1].headers["If-None-Match"], '"1"')
+        self.assertEqual(data, mock_objecttype(self.url))
+
+    @override_settings(
+        OBJECTTYPES_CLIENT_CACHE="redis", OBJECTTYPES_CLIENT_CACHE_TIMEOUT=0
+    )
+    def test_changed_response_replaces_cache(self, m):
+        changed = {**mock_objecttype(self.url), "name": "changed"}
+        m.get(
+            self.url,
+            [
+                {"json": mock_objecttype(self.url), "headers": {"ETag": '"1"'}},
+                {"json": changed, "headers": {"ETag": '"2"'}},
+                {"status_code": 304, "headers": {"ETag": '"2"'}},
+            ],
+        )
+
+        self._get_objecttype()
+        self._get_objecttype()
+        data = self._get_objecttype()
+
+        self.assertEqual(m.request_history[2].headers["If-None-Match"], '"2"')
+        self.assertEqual(data, changed)
+
+    @override_settings(
+        OBJECTTYPES_CLIENT_CACHE="redis",
+        OBJECTTYPES_CLIENT_CACHE_TIMEOUT=0,
+        OBJECTTYPES_CLIENT_CACHE_MAX_AGE=60,
+    )
+    def test_expired_after_max_age(self, m):
+        m.get(self.url, json=mock_objecttype(self.url), headers={"ETag": '"1"'})
+
+        with freeze_time("2026-01-01T12:00:00"):
+            self._get_objecttype()
+        with freeze_time("2026-01-01T12:01:01"):
+            self._get_objecttype()
+
+        self.assertEqual(m.call_count, 2)
+        self.assertNotIn("If-None-Match", m.request_history[1].headers)
+
+    @override_settings(
+        OBJECTTYPES_CLIENT_CACHE="redis", OBJECTTYPES_CLIENT_CACHE_TIMEOUT=60
+    )
+    def test_errors_are_not_cached(self, m):
+        m.get(self.url, [{"status_code": 500}, {"json": mock_objecttype(self.url)}])
+
+        with self.assertRaises(requests.HTTPError):
+            self._get_objecttype()
+        data = self._get_objecttype()
+
+        self.assertEqual(data, mock_objecttype(self.url))
+
+    @override_settings(
+        OBJECTTYPES_CLIENT_CACHE="redis", OBJECTTYPES_CLIENT_CACHE_TIMEOUT=60
+    )
+    def test_can_connect_bypasses_cache(self, m):
+        m.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes",
+            [
+                {"json": mock_objecttypes(self.uuid, self.uuid)},
+                {"status_code": 500},
+            ],
+        )
+
+        with get_objecttypes_client(self.service) as client:
+            client.list_objecttypes()
+            self.assertFalse(client.can_connect)
+
+        self.assertEqual(m.call_count, 2)
+
+    @override_settings(OBJECTTYPES_CLIENT_CACHE="memcached")
+    def test_unknown_cache(self, m):
+        with self.assertRaises(ImproperlyConfigured):
+            get_objecttypes_client(self.service)
+
+    def test_disk(self, m):
+        m.get(self.url, json=mock_objecttype(self.url))
+
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(
+                OBJECTTYPES_CLIENT_CACHE="disk",
+                OBJECTTYPES_CLIENT_CACHE_DIR=directory,
+                OBJECTTYPES_CLIENT_CACHE_TIMEOUT=60,
+            ):
+                self._get_objecttype()
+                self._get_objecttype()
+
+        self.assertEqual(m.call_count, 1)